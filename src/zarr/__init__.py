@@ -1,6 +1,7 @@
 from zarr._version import version as __version__
 from zarr.api.synchronous import (
     array,
+    compact_shards,
     consolidate_metadata,
     copy,
     copy_all,
@@ -42,6 +43,7 @@ __all__ = [
     "Group",
     "__version__",
     "array",
+    "compact_shards",
     "config",
     "consolidate_metadata",
     "copy",
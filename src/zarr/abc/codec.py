@@ -9,23 +9,28 @@ from zarr.core.common import ChunkCoords, concurrent_map
 from zarr.core.config import config
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable, Iterable
+    from collections.abc import Awaitable, Callable, Iterable, Sequence
     from typing import Self
 
     import numpy as np
+    import numpy.typing as npt
 
     from zarr.abc.store import ByteGetter, ByteSetter
     from zarr.core.array_spec import ArraySpec
     from zarr.core.chunk_grids import ChunkGrid
-    from zarr.core.indexing import SelectorTuple
+    from zarr.core.indexing import ChunkBatchProjection, SelectorTuple
 
 __all__ = [
     "ArrayArrayCodec",
+    "ArrayArrayCodecPartialDecodeMixin",
     "ArrayBytesCodec",
+    "ArrayBytesCodecDecodeIntoMixin",
     "ArrayBytesCodecPartialDecodeMixin",
     "ArrayBytesCodecPartialEncodeMixin",
     "BaseCodec",
     "BytesBytesCodec",
+    "BytesBytesCodecDecodeIntoMixin",
+    "BytesBytesCodecPartialDecodeMixin",
     "CodecInput",
     "CodecOutput",
     "CodecPipeline",
@@ -167,6 +172,90 @@ class BytesBytesCodec(BaseCodec[Buffer, Buffer]):
 Codec = ArrayArrayCodec | ArrayBytesCodec | BytesBytesCodec
 
 
+class ArrayArrayCodecPartialDecodeMixin:
+    """Mixin for array-to-array codecs that support partial decoding.
+
+    Such codecs map a selection of the decoded chunk to a selection of the encoded
+    chunk, so that only that part of the encoded chunk needs to be decoded by the
+    codecs that follow."""
+
+    def resolve_selection(self, selection: SelectorTuple, chunk_spec: ArraySpec) -> SelectorTuple:
+        """Maps a selection of a decoded chunk to the selection of the encoded chunk that
+        is needed to compute it.
+
+        Parameters
+        ----------
+        selection : SelectorTuple
+            The selection of the decoded chunk.
+        chunk_spec : ArraySpec
+            The spec of the decoded chunk.
+
+        Returns
+        -------
+        SelectorTuple
+        """
+        raise NotImplementedError
+
+    async def _decode_partial_single(
+        self, chunk_array: NDBuffer, selection: SelectorTuple, chunk_spec: ArraySpec
+    ) -> NDBuffer:
+        raise NotImplementedError
+
+    async def decode_partial(
+        self,
+        batch_info: Iterable[tuple[NDBuffer | None, SelectorTuple, ArraySpec]],
+    ) -> Iterable[NDBuffer | None]:
+        """Partially decodes a batch of chunks.
+        Each chunk array holds the part of the encoded chunk given by
+        `resolve_selection` for the selection, and is decoded into the selection of the
+        decoded chunk. Chunks can be None in which case they are ignored by the codec.
+
+        Parameters
+        ----------
+        batch_info : Iterable[tuple[NDBuffer | None, SelectorTuple, ArraySpec]]
+            Ordered set of partially read encoded chunks, with the selection of the
+            decoded chunk and the spec of the decoded chunk.
+
+        Returns
+        -------
+        Iterable[NDBuffer | None]
+        """
+
+        async def _decode_partial(
+            chunk_array: NDBuffer | None, selection: SelectorTuple, chunk_spec: ArraySpec
+        ) -> NDBuffer | None:
+            if chunk_array is None:
+                return None
+            return await self._decode_partial_single(chunk_array, selection, chunk_spec)
+
+        return await concurrent_map(
+            list(batch_info), _decode_partial, config.get("async.concurrency")
+        )
+
+
+class BytesBytesCodecPartialDecodeMixin:
+    """Mixin for bytes-to-bytes codecs that support partial decoding.
+
+    Such codecs store the decoded bytes as a contiguous range of the encoded bytes, so
+    that byte ranges of the decoded bytes can be read directly from the store."""
+
+    def resolve_byte_getter(self, byte_getter: ByteGetter, chunk_spec: ArraySpec) -> ByteGetter:
+        """Returns a byte getter for the decoded bytes of the chunk stored at `byte_getter`.
+
+        Parameters
+        ----------
+        byte_getter : ByteGetter
+            The byte getter of the encoded chunk.
+        chunk_spec : ArraySpec
+            The spec of the chunk.
+
+        Returns
+        -------
+        ByteGetter
+        """
+        raise NotImplementedError
+
+
 class ArrayBytesCodecPartialDecodeMixin:
     """Mixin for array-to-bytes codecs that implement partial decoding."""
 
@@ -239,6 +328,80 @@ class ArrayBytesCodecPartialEncodeMixin:
         )
 
 
+class BytesBytesCodecDecodeIntoMixin:
+    """Mixin for bytes-to-bytes codecs that can decode chunks into an existing buffer,
+    instead of allocating a new one."""
+
+    async def decode_into(
+        self, chunk_bytes: Buffer, chunk_spec: ArraySpec, out: npt.NDArray[np.uint8]
+    ) -> None:
+        """Decodes a chunk into ``out``.
+
+        Parameters
+        ----------
+        chunk_bytes : Buffer
+            The encoded chunk.
+        chunk_spec : ArraySpec
+            The spec of the chunk.
+        out : numpy.ndarray
+            Writable, contiguous array of bytes with the size of the decoded chunk.
+        """
+        raise NotImplementedError
+
+
+class ArrayBytesCodecDecodeIntoMixin:
+    """Mixin for array-to-bytes codecs that can decode chunks into an existing array,
+    such as a region of the output array of a read."""
+
+    def resolve_decode_target(
+        self, chunk_spec: ArraySpec, out: npt.NDArray[Any]
+    ) -> npt.NDArray[np.uint8] | None:
+        """Returns the bytes of ``out`` that hold the encoded bytes of the chunk, if the
+        chunk is encoded as a copy of the memory of ``out``, so that bytes-to-bytes codecs
+        can decode directly into ``out``.
+
+        Parameters
+        ----------
+        chunk_spec : ArraySpec
+            The spec of the chunk.
+        out : numpy.ndarray
+            C-contiguous array with the shape and data type of the chunk.
+
+        Returns
+        -------
+        numpy.ndarray | None
+            A writable view of the bytes of ``out``, or None if the encoded bytes of the
+            chunk do not share the memory layout of ``out``.
+        """
+        return None
+
+    async def decode_into(
+        self, chunk_bytes: Buffer, chunk_spec: ArraySpec, out: npt.NDArray[Any]
+    ) -> bool:
+        """Decodes a chunk into ``out``.
+
+        Parameters
+        ----------
+        chunk_bytes : Buffer
+            The encoded chunk.
+        chunk_spec : ArraySpec
+            The spec of the chunk.
+        out : numpy.ndarray
+            C-contiguous array with the shape and data type of the chunk.
+
+        Returns
+        -------
+        bool
+            Whether the chunk was decoded. If False, ``out`` is left untouched, and the
+            chunk has to be decoded with ``decode``.
+        """
+        target = self.resolve_decode_target(chunk_spec, out)
+        if target is None:
+            return False
+        target[:] = chunk_bytes.as_numpy_array().view("u1")
+        return True
+
+
 class CodecPipeline:
     """Base class for implementing CodecPipeline.
     A CodecPipeline implements the read and write paths for chunk data.
@@ -399,6 +562,69 @@ class CodecPipeline:
         """
         ...
 
+    async def read_batches(
+        self,
+        batch_info: Iterable[
+            tuple[Sequence[ByteGetter], Sequence[ArraySpec], ChunkBatchProjection]
+        ],
+        out: NDBuffer,
+    ) -> None:
+        """Reads the chunks of a coordinate or mask selection, a run of chunks at a time, and
+        writes the selected items into an output array.
+
+        The default implementation splits the runs into their chunks and reads them with
+        ``read``. Implementations can override it to move the items of a run with a single
+        vectorized operation.
+
+        Parameters
+        ----------
+        batch_info : Iterable[tuple[Sequence[ByteGetter], Sequence[ArraySpec], ChunkBatchProjection]]
+            Ordered set of runs of chunks, with the ByteGetter and chunk spec of each chunk
+            of the run and the projection of the run into the output array.
+        out : NDBuffer
+        """
+        await self.read(
+            (
+                (byte_getter, chunk_spec, chunk_selection, out_selection)
+                for byte_getters, chunk_specs, batch in batch_info
+                for byte_getter, chunk_spec, (_, chunk_selection, out_selection) in zip(
+                    byte_getters, chunk_specs, batch.projections(), strict=True
+                )
+            ),
+            out,
+        )
+
+    async def write_batches(
+        self,
+        batch_info: Iterable[
+            tuple[Sequence[ByteSetter], Sequence[ArraySpec], ChunkBatchProjection]
+        ],
+        value: NDBuffer,
+    ) -> None:
+        """Merges the items of a coordinate or mask selection into the chunks, a run of
+        chunks at a time, encodes the chunks and writes them to the store.
+
+        The default implementation splits the runs into their chunks and writes them with
+        ``write``.
+
+        Parameters
+        ----------
+        batch_info : Iterable[tuple[Sequence[ByteSetter], Sequence[ArraySpec], ChunkBatchProjection]]
+            Ordered set of runs of chunks, with the ByteSetter and chunk spec of each chunk
+            of the run and the projection of the run into the value array.
+        value : NDBuffer
+        """
+        await self.write(
+            (
+                (byte_setter, chunk_spec, chunk_selection, out_selection)
+                for byte_setters, chunk_specs, batch in batch_info
+                for byte_setter, chunk_spec, (_, chunk_selection, out_selection) in zip(
+                    byte_setters, chunk_specs, batch.projections(), strict=True
+                )
+            ),
+            value,
+        )
+
 
 async def _batching_helper(
     func: Callable[[CodecInput, ArraySpec], Awaitable[CodecOutput | None]],
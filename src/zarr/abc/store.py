@@ -1,13 +1,12 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from asyncio import gather
+from asyncio import Queue, TaskGroup, create_task, gather
 from dataclasses import dataclass
 from itertools import starmap
 from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
 from zarr.core.buffer.core import default_buffer_prototype
-from zarr.core.common import concurrent_map
 from zarr.core.config import config
 
 if TYPE_CHECKING:
@@ -371,16 +370,56 @@ class Store(ABC):
         """Close the store."""
         self._is_open = False
 
-    async def _get_many(
+    async def get_many(
         self, requests: Iterable[tuple[str, BufferPrototype, ByteRequest | None]]
     ) -> AsyncGenerator[tuple[str, Buffer | None], None]:
         """
-        Retrieve a collection of objects from storage. In general this method does not guarantee
-        that objects will be retrieved in the order in which they were requested, so this method
-        yields tuple[str, Buffer | None] instead of just Buffer | None
+        Retrieve a collection of objects from storage.
+
+        The objects are yielded as soon as they are retrieved, which is in general not the
+        order in which they were requested, so this method yields the key of each object
+        with its value. At most ``async.concurrency`` requests are in flight at a time.
+
+        Stores that can retrieve several objects with a single request should override
+        this method.
+
+        Parameters
+        ----------
+        requests : Iterable[tuple[str, BufferPrototype, ByteRequest | None]]
+            The key, buffer prototype and byte range of each object to retrieve.
+
+        Yields
+        ------
+        tuple[str, Buffer | None]
+            The key of each object, and its value or None if the key does not exist.
         """
-        for req in requests:
-            yield (req[0], await self.get(*req))
+        requests = iter(requests)
+        results: Queue[tuple[str, Buffer | None] | BaseException | None] = Queue()
+
+        # the workers take requests from the shared iterator until it is exhausted
+        async def work() -> None:
+            try:
+                for key, prototype, byte_range in requests:
+                    results.put_nowait((key, await self.get(key, prototype, byte_range)))
+            except Exception as e:
+                results.put_nowait(e)
+            else:
+                results.put_nowait(None)
+
+        workers = [create_task(work()) for _ in range(config.get("async.concurrency"))]
+        try:
+            running = len(workers)
+            while running:
+                result = await results.get()
+                if result is None:
+                    running -= 1
+                elif isinstance(result, BaseException):
+                    raise result
+                else:
+                    yield result
+        finally:
+            for worker in workers:
+                worker.cancel()
 
     async def getsize(self, key: str) -> int:
         """
@@ -436,15 +475,32 @@ class Store(ABC):
         Implementations may differ on the behavior when some other ``prefix``
         is provided.
         """
-        # TODO: Overlap listing keys with getsize calls.
-        # Currently, we load the list of keys into memory and only then move
-        # on to getting sizes. Ideally we would overlap those two, which should
-        # improve tail latency and might reduce memory pressure (since not all keys
-        # would be in memory at once).
-        keys = [(x,) async for x in self.list_prefix(prefix)]
+        # The listed keys are passed on to a bounded pool of getsize calls as they
+        # arrive, so that listing and size queries overlap and not all keys are held in
+        # memory at once.
         limit = config.get("async.concurrency")
-        sizes = await concurrent_map(keys, self.getsize, limit=limit)
-        return sum(sizes)
+        keys: Queue[str | None] = Queue(maxsize=limit)
+        nbytes = 0
+
+        async def list_keys() -> None:
+            async for key in self.list_prefix(prefix):
+                await keys.put(key)
+            for _ in range(limit):
+                await keys.put(None)
+
+        async def add_sizes() -> None:
+            nonlocal nbytes
+            while (key := await keys.get()) is not None:
+                nbytes += await self.getsize(key)
+
+        try:
+            async with TaskGroup() as tg:
+                tg.create_task(list_keys())
+                for _ in range(limit):
+                    tg.create_task(add_sizes())
+        except BaseExceptionGroup as e:
+            raise e.exceptions[0] from None
+        return nbytes
 
 
 @runtime_checkable
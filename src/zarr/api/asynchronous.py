@@ -10,8 +10,9 @@ import numpy.typing as npt
 from typing_extensions import deprecated
 
 from zarr.core.array import Array, AsyncArray, create_array, get_array_metadata
-from zarr.core.array_spec import ArrayConfig, ArrayConfigLike
-from zarr.core.buffer import NDArrayLike
+from zarr.core.array_spec import ArrayConfig, ArrayConfigLike, ArraySpec, parse_array_config
+from zarr.core.buffer import NDArrayLike, default_buffer_prototype
+from zarr.core.codec_pipeline import codecs_from_list
 from zarr.core.common import (
     JSON,
     AccessModeLiteral,
@@ -33,6 +34,7 @@ if TYPE_CHECKING:
     from collections.abc import Iterable
 
     from zarr.abc.codec import Codec
+    from zarr.codecs.sharding import ShardCompactionReport
     from zarr.core.chunk_key_encodings import ChunkKeyEncoding
     from zarr.storage import StoreLike
 
@@ -42,6 +44,7 @@ if TYPE_CHECKING:
 
 __all__ = [
     "array",
+    "compact_shards",
     "consolidate_metadata",
     "copy",
     "copy_all",
@@ -214,6 +217,76 @@ async def consolidate_metadata(
     return group
 
 
+async def compact_shards(
+    store: StoreLike,
+    path: str | None = None,
+    *,
+    dry_run: bool = False,
+    max_memory: int = 2**30,
+    storage_options: dict[str, Any] | None = None,
+) -> ShardCompactionReport:
+    """
+    Rewrite the fragmented shards of a sharded array densely in Morton order.
+
+    A shard is fragmented when it contains bytes that belong to no inner chunk, for
+    example after writes with the ``"append"`` sharding write mode, or when its inner
+    chunks are not stored contiguously in Morton order.
+
+    Parameters
+    ----------
+    store : StoreLike
+        The store containing the array.
+    path : str, optional
+        The path to the array in the store.
+    dry_run : bool, default=False
+        If True, only report the layout of the shards without rewriting them.
+    max_memory : int, default=2**30
+        The maximum total size, in bytes, of the shards that are rewritten
+        concurrently. A shard larger than ``max_memory`` is rewritten on its own.
+    storage_options : dict
+        If using an fsspec URL to create the store, these will be passed to
+        the backend implementation. Ignored otherwise.
+
+    Returns
+    -------
+    ShardCompactionReport
+        A summary of the layout of the shards before compaction.
+    """
+    from zarr.codecs.sharding import ShardingCodec
+
+    if max_memory <= 0:
+        raise ValueError(f"max_memory must be positive. Got {max_memory} instead.")
+
+    mode: AccessModeLiteral = "r" if dry_run else "r+"
+    store_path = await make_store_path(store, path=path, mode=mode, storage_options=storage_options)
+    array = await AsyncArray.open(store_path, zarr_format=3)
+    if not dry_run:
+        store_path.store._check_writable()
+
+    metadata = cast(ArrayV3Metadata, array.metadata)
+    array_array_codecs, array_bytes_codec, bytes_bytes_codecs = codecs_from_list(metadata.codecs)
+    if not isinstance(array_bytes_codec, ShardingCodec) or bytes_bytes_codecs:
+        raise ValueError(
+            "Shard compaction requires an array whose only array-to-bytes codec is "
+            "`sharding_indexed` and which has no bytes-to-bytes codecs."
+        )
+
+    def shard_spec(chunk_coords: ChunkCoords) -> ArraySpec:
+        spec = metadata.get_chunk_spec(chunk_coords, array._config, default_buffer_prototype())
+        for codec in array_array_codecs:
+            spec = codec.resolve_metadata(spec)
+        return spec
+
+    return await array_bytes_codec._compact(
+        (
+            (array.store_path / metadata.encode_chunk_key(chunk_coords), shard_spec(chunk_coords))
+            for chunk_coords in array._iter_chunk_coords()
+        ),
+        dry_run=dry_run,
+        max_memory=max_memory,
+    )
+
+
 async def copy(*args: Any, **kwargs: Any) -> tuple[int, int, int]:
     raise NotImplementedError
 
@@ -1220,7 +1293,8 @@ async def open_array(
         If using an fsspec URL to create the store, these will be passed to
         the backend implementation. Ignored otherwise.
     **kwargs
-        Any keyword arguments to pass to :func:`create`.
+        Any keyword arguments to pass to :func:`create`. The runtime configuration
+        ``config`` also applies when the array exists.
 
     Returns
     -------
@@ -1239,7 +1313,7 @@ async def open_array(
         _warn_write_empty_chunks_kwarg()
 
     try:
-        return await AsyncArray.open(store_path, zarr_format=zarr_format)
+        array = await AsyncArray.open(store_path, zarr_format=zarr_format)
     except FileNotFoundError:
         if not store_path.read_only and mode in _CREATE_MODES:
             overwrite = _infer_overwrite(mode)
@@ -1251,6 +1325,14 @@ async def open_array(
                 **kwargs,
             )
         raise
+    if kwargs.get("config") is not None:
+        # the runtime configuration applies to existing arrays as well
+        array = AsyncArray(
+            metadata=array.metadata,
+            store_path=array.store_path,
+            config=parse_array_config(kwargs["config"]),
+        )
+    return array
 
 
 async def open_like(
@@ -18,6 +18,7 @@ if TYPE_CHECKING:
 
     from zarr.abc.codec import Codec
     from zarr.api.asynchronous import ArrayLike, PathLike
+    from zarr.codecs.sharding import ShardCompactionReport
     from zarr.core.array import (
         CompressorsLike,
         FiltersLike,
@@ -39,6 +40,7 @@ if TYPE_CHECKING:
 
 __all__ = [
     "array",
+    "compact_shards",
     "consolidate_metadata",
     "copy",
     "copy_all",
@@ -101,6 +103,52 @@ def consolidate_metadata(
     return Group(sync(async_api.consolidate_metadata(store, path=path, zarr_format=zarr_format)))
 
 
+def compact_shards(
+    store: StoreLike,
+    path: str | None = None,
+    *,
+    dry_run: bool = False,
+    max_memory: int = 2**30,
+    storage_options: dict[str, Any] | None = None,
+) -> ShardCompactionReport:
+    """
+    Rewrite the fragmented shards of a sharded array densely in Morton order.
+
+    A shard is fragmented when it contains bytes that belong to no inner chunk, for
+    example after writes with the ``"append"`` sharding write mode, or when its inner
+    chunks are not stored contiguously in Morton order.
+
+    Parameters
+    ----------
+    store : StoreLike
+        The store containing the array.
+    path : str, optional
+        The path to the array in the store.
+    dry_run : bool, default=False
+        If True, only report the layout of the shards without rewriting them.
+    max_memory : int, default=2**30
+        The maximum total size, in bytes, of the shards that are rewritten
+        concurrently. A shard larger than ``max_memory`` is rewritten on its own.
+    storage_options : dict
+        If using an fsspec URL to create the store, these will be passed to
+        the backend implementation. Ignored otherwise.
+
+    Returns
+    -------
+    ShardCompactionReport
+        A summary of the layout of the shards before compaction.
+    """
+    return sync(
+        async_api.compact_shards(
+            store,
+            path=path,
+            dry_run=dry_run,
+            max_memory=max_memory,
+            storage_options=storage_options,
+        )
+    )
+
+
 def copy(*args: Any, **kwargs: Any) -> tuple[int, int, int]:
     return sync(async_api.copy(*args, **kwargs))
 
@@ -1040,7 +1088,8 @@ def open_array(
         If using an fsspec URL to create the store, these will be passed to
         the backend implementation. Ignored otherwise.
     **kwargs
-        Any keyword arguments to pass to ``create``.
+        Any keyword arguments to pass to ``create``. The runtime configuration
+        ``config`` also applies when the array exists.
 
     Returns
     -------
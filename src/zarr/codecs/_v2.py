@@ -1,25 +1,61 @@
 from __future__ import annotations
 
-import asyncio
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import numcodecs
 import numpy as np
 from numcodecs.compat import ensure_bytes, ensure_ndarray_like
 
-from zarr.abc.codec import ArrayBytesCodec
+from zarr.abc.codec import ArrayBytesCodec, ArrayBytesCodecDecodeIntoMixin
+from zarr.core.sync import run_codec_function
 from zarr.registry import get_ndbuffer_class
 
 if TYPE_CHECKING:
     import numcodecs.abc
+    import numpy.typing as npt
 
     from zarr.core.array_spec import ArraySpec
     from zarr.core.buffer import Buffer, NDBuffer
 
 
+def _decompress_and_unfilter(
+    cdata: Any,
+    compressor: numcodecs.abc.Codec | None,
+    filters: tuple[numcodecs.abc.Codec, ...] | None,
+) -> Any:
+    # decompress
+    chunk = compressor.decode(cdata) if compressor else cdata
+
+    # apply filters
+    if filters:
+        for f in reversed(filters):
+            chunk = f.decode(chunk)
+    return chunk
+
+
+def _filter_and_compress(
+    chunk: Any,
+    compressor: numcodecs.abc.Codec | None,
+    filters: tuple[numcodecs.abc.Codec, ...] | None,
+) -> bytes:
+    # apply filters
+    if filters:
+        for f in filters:
+            chunk = f.encode(chunk)
+
+    # check object encoding
+    if ensure_ndarray_like(chunk).dtype == object:
+        raise RuntimeError("cannot write object array without object codec")
+
+    # compress
+    cdata = compressor.encode(chunk) if compressor else chunk
+    result: bytes = ensure_bytes(cdata)
+    return result
+
+
 @dataclass(frozen=True)
-class V2Codec(ArrayBytesCodec):
+class V2Codec(ArrayBytesCodecDecodeIntoMixin, ArrayBytesCodec):
     filters: tuple[numcodecs.abc.Codec, ...] | None
     compressor: numcodecs.abc.Codec | None
 
@@ -31,16 +67,10 @@ class V2Codec(ArrayBytesCodec):
         chunk_spec: ArraySpec,
     ) -> NDBuffer:
         cdata = chunk_bytes.as_array_like()
-        # decompress
-        if self.compressor:
-            chunk = await asyncio.to_thread(self.compressor.decode, cdata)
-        else:
-            chunk = cdata
-
-        # apply filters
-        if self.filters:
-            for f in reversed(self.filters):
-                chunk = await asyncio.to_thread(f.decode, chunk)
+        # decompress and apply filters
+        chunk = await run_codec_function(
+            _decompress_and_unfilter, cdata, self.compressor, self.filters
+        )
 
         # view as numpy array with correct dtype
         chunk = ensure_ndarray_like(chunk)
@@ -72,6 +102,30 @@ class V2Codec(ArrayBytesCodec):
 
         return get_ndbuffer_class().from_ndarray_like(chunk)
 
+    async def decode_into(
+        self, chunk_bytes: Buffer, chunk_spec: ArraySpec, out: npt.NDArray[Any]
+    ) -> bool:
+        # filters may change the items, so only chunks that are just compressed are
+        # decompressed into the memory of ``out``
+        if (
+            self.filters
+            or chunk_spec.order != "C"
+            or out.dtype.hasobject
+            or out.dtype.itemsize == 0
+            or out.dtype != chunk_spec.dtype
+        ):
+            return False
+        cdata = chunk_bytes.as_numpy_array()
+        target = out.reshape(-1).view(np.uint8)
+        if self.compressor is None:
+            target[:] = cdata.view(np.uint8)
+        else:
+            chunk = await run_codec_function(self.compressor.decode, cdata, target)
+            # compressors are not required to decompress into ``out``
+            if chunk is not None and not np.shares_memory(ensure_ndarray_like(chunk), target):
+                target[:] = ensure_ndarray_like(chunk).reshape(-1).view(np.uint8)
+        return True
+
     async def _encode_single(
         self,
         chunk_array: NDBuffer,
@@ -82,22 +136,8 @@ class V2Codec(ArrayBytesCodec):
         # ensure contiguous and correct order
         chunk = chunk.astype(chunk_spec.dtype, order=chunk_spec.order, copy=False)
 
-        # apply filters
-        if self.filters:
-            for f in self.filters:
-                chunk = await asyncio.to_thread(f.encode, chunk)
-
-        # check object encoding
-        if ensure_ndarray_like(chunk).dtype == object:
-            raise RuntimeError("cannot write object array without object codec")
-
-        # compress
-        if self.compressor:
-            cdata = await asyncio.to_thread(self.compressor.encode, chunk)
-        else:
-            cdata = chunk
-
-        cdata = ensure_bytes(cdata)
+        # apply filters and compress
+        cdata = await run_codec_function(_filter_and_compress, chunk, self.compressor, self.filters)
         return chunk_spec.prototype.buffer.from_bytes(cdata)
 
     def compute_encoded_size(self, _input_byte_length: int, _chunk_spec: ArraySpec) -> int:
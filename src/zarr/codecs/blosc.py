@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import asyncio
 from dataclasses import dataclass, replace
 from enum import Enum
 from functools import cached_property
@@ -9,14 +8,17 @@ from typing import TYPE_CHECKING
 import numcodecs
 from numcodecs.blosc import Blosc
 
-from zarr.abc.codec import BytesBytesCodec
-from zarr.core.buffer.cpu import as_numpy_array_wrapper
+from zarr.abc.codec import BytesBytesCodec, BytesBytesCodecDecodeIntoMixin
 from zarr.core.common import JSON, parse_enum, parse_named_configuration
+from zarr.core.sync import run_codec_function
 from zarr.registry import register_codec
 
 if TYPE_CHECKING:
     from typing import Self
 
+    import numpy as np
+    import numpy.typing as npt
+
     from zarr.core.array_spec import ArraySpec
     from zarr.core.buffer import Buffer
 
@@ -84,7 +86,7 @@ def parse_blocksize(data: JSON) -> int:
 
 
 @dataclass(frozen=True)
-class BloscCodec(BytesBytesCodec):
+class BloscCodec(BytesBytesCodecDecodeIntoMixin, BytesBytesCodec):
     is_fixed_size = False
 
     typesize: int | None
@@ -170,10 +172,15 @@ class BloscCodec(BytesBytesCodec):
         chunk_bytes: Buffer,
         chunk_spec: ArraySpec,
     ) -> Buffer:
-        return await asyncio.to_thread(
-            as_numpy_array_wrapper, self._blosc_codec.decode, chunk_bytes, chunk_spec.prototype
+        return chunk_spec.prototype.buffer.from_bytes(
+            await run_codec_function(self._blosc_codec.decode, chunk_bytes.as_numpy_array())
         )
 
+    async def decode_into(
+        self, chunk_bytes: Buffer, chunk_spec: ArraySpec, out: npt.NDArray[np.uint8]
+    ) -> None:
+        await run_codec_function(self._blosc_codec.decode, chunk_bytes.as_numpy_array(), out)
+
     async def _encode_single(
         self,
         chunk_bytes: Buffer,
@@ -181,11 +188,8 @@ class BloscCodec(BytesBytesCodec):
     ) -> Buffer | None:
         # Since blosc only support host memory, we convert the input and output of the encoding
         # between numpy array and buffer
-        return await asyncio.to_thread(
-            lambda chunk: chunk_spec.prototype.buffer.from_bytes(
-                self._blosc_codec.encode(chunk.as_numpy_array())
-            ),
-            chunk_bytes,
+        return chunk_spec.prototype.buffer.from_bytes(
+            await run_codec_function(self._blosc_codec.encode, chunk_bytes.as_numpy_array())
         )
 
     def compute_encoded_size(self, _input_byte_length: int, _chunk_spec: ArraySpec) -> int:
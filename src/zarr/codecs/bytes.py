@@ -7,13 +7,15 @@ from typing import TYPE_CHECKING
 
 import numpy as np
 
-from zarr.abc.codec import ArrayBytesCodec
+from zarr.abc.codec import ArrayBytesCodec, ArrayBytesCodecDecodeIntoMixin
 from zarr.core.buffer import Buffer, NDArrayLike, NDBuffer
 from zarr.core.common import JSON, parse_enum, parse_named_configuration
 from zarr.registry import register_codec
 
 if TYPE_CHECKING:
-    from typing import Self
+    from typing import Any, Self
+
+    import numpy.typing as npt
 
     from zarr.core.array_spec import ArraySpec
 
@@ -31,7 +33,7 @@ default_system_endian = Endian(sys.byteorder)
 
 
 @dataclass(frozen=True)
-class BytesCodec(ArrayBytesCodec):
+class BytesCodec(ArrayBytesCodecDecodeIntoMixin, ArrayBytesCodec):
     is_fixed_size = True
 
     endian: Endian | None
@@ -65,23 +67,27 @@ class BytesCodec(ArrayBytesCodec):
             )
         return self
 
-    async def _decode_single(
-        self,
-        chunk_bytes: Buffer,
-        chunk_spec: ArraySpec,
-    ) -> NDBuffer:
-        assert isinstance(chunk_bytes, Buffer)
+    def _decoded_dtype(self, chunk_spec: ArraySpec) -> np.dtype[Any]:
         if chunk_spec.dtype.itemsize > 0:
             if self.endian == Endian.little:
                 prefix = "<"
             else:
                 prefix = ">"
-            dtype = np.dtype(f"{prefix}{chunk_spec.dtype.str[1:]}")
+            return np.dtype(f"{prefix}{chunk_spec.dtype.str[1:]}")
         else:
-            dtype = np.dtype(f"|{chunk_spec.dtype.str[1:]}")
+            return np.dtype(f"|{chunk_spec.dtype.str[1:]}")
+
+    async def _decode_single(
+        self,
+        chunk_bytes: Buffer,
+        chunk_spec: ArraySpec,
+    ) -> NDBuffer:
+        assert isinstance(chunk_bytes, Buffer)
+        dtype = self._decoded_dtype(chunk_spec)
 
         as_array_like = chunk_bytes.as_array_like()
-        if isinstance(as_array_like, NDArrayLike):
+        # checking against the runtime protocol is slow, so numpy arrays are matched first
+        if isinstance(as_array_like, np.ndarray | NDArrayLike):
             as_nd_array_like = as_array_like
         else:
             as_nd_array_like = np.asanyarray(as_array_like)
@@ -96,6 +102,15 @@ class BytesCodec(ArrayBytesCodec):
             )
         return chunk_array
 
+    def resolve_decode_target(
+        self, chunk_spec: ArraySpec, out: npt.NDArray[Any]
+    ) -> npt.NDArray[np.uint8] | None:
+        # the encoded bytes are the items of the chunk in C order, so they are the memory of
+        # ``out`` if their byte order matches
+        if out.dtype.itemsize == 0 or out.dtype != self._decoded_dtype(chunk_spec):
+            return None
+        return out.reshape(-1).view(np.uint8)
+
     async def _encode_single(
         self,
         chunk_array: NDBuffer,
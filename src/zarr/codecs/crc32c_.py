@@ -1,25 +1,78 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, cast
 
 import numpy as np
 import typing_extensions
 from crc32c import crc32c
 
-from zarr.abc.codec import BytesBytesCodec
+from zarr.abc.codec import BytesBytesCodec, BytesBytesCodecPartialDecodeMixin
+from zarr.abc.store import RangeByteRequest, SuffixByteRequest
 from zarr.core.common import JSON, parse_named_configuration
+from zarr.core.config import config
+from zarr.core.sync import run_codec_function
 from zarr.registry import register_codec
+from zarr.storage._utils import _normalize_byte_range_index
 
 if TYPE_CHECKING:
     from typing import Self
 
+    from zarr.abc.store import ByteGetter, ByteRequest
     from zarr.core.array_spec import ArraySpec
-    from zarr.core.buffer import Buffer
+    from zarr.core.buffer import Buffer, BufferPrototype
+
+
+@dataclass
+class _Crc32cByteGetter:
+    """Reads the bytes that precede the checksum of a chunk stored at ``byte_getter``.
+
+    The checksum covers the whole chunk, so the first byte-range read fetches and
+    verifies the whole chunk, and later reads are served from the verified bytes. For a
+    checksum after the sharding codec, any read from a shard thus downloads the whole
+    shard. If ``sharding.verify_partial_checksums`` is disabled, byte-range reads only
+    fetch the requested bytes and return them unverified.
+    """
+
+    codec: Crc32cCodec
+    byte_getter: ByteGetter
+    chunk_spec: ArraySpec
+    _lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False, repr=False)
+    _verified: bool = field(default=False, init=False, repr=False)
+    _chunk_bytes: Buffer | None = field(default=None, init=False, repr=False)
+
+    async def _get_verified(self, prototype: BufferPrototype) -> Buffer | None:
+        async with self._lock:
+            if not self._verified:
+                chunk_bytes = await self.byte_getter.get(prototype)
+                if chunk_bytes is not None:
+                    chunk_bytes = await self.codec._decode_single(chunk_bytes, self.chunk_spec)
+                self._chunk_bytes = chunk_bytes
+                self._verified = True
+            return self._chunk_bytes
+
+    async def get(
+        self, prototype: BufferPrototype, byte_range: ByteRequest | None = None
+    ) -> Buffer | None:
+        if byte_range is None or config.get("sharding.verify_partial_checksums"):
+            chunk_bytes = await self._get_verified(prototype)
+            if chunk_bytes is None or byte_range is None:
+                return chunk_bytes
+            start, stop = _normalize_byte_range_index(chunk_bytes, byte_range)
+            return chunk_bytes[start:stop]
+        if isinstance(byte_range, RangeByteRequest):
+            return await self.byte_getter.get(prototype, byte_range)
+        if isinstance(byte_range, SuffixByteRequest):
+            byte_range = SuffixByteRequest(byte_range.suffix + 4)
+        chunk_bytes = await self.byte_getter.get(prototype, byte_range)
+        if chunk_bytes is None:
+            return None
+        return chunk_bytes[:-4]
 
 
 @dataclass(frozen=True)
-class Crc32cCodec(BytesBytesCodec):
+class Crc32cCodec(BytesBytesCodecPartialDecodeMixin, BytesBytesCodec):
     is_fixed_size = True
 
     @classmethod
@@ -40,7 +93,9 @@ class Crc32cCodec(BytesBytesCodec):
         inner_bytes = data[:-4]
 
         # Need to do a manual cast until https://github.com/numpy/numpy/issues/26783 is resolved
-        computed_checksum = np.uint32(crc32c(cast(typing_extensions.Buffer, inner_bytes))).tobytes()
+        computed_checksum = np.uint32(
+            await run_codec_function(crc32c, cast(typing_extensions.Buffer, inner_bytes))
+        ).tobytes()
         stored_checksum = bytes(crc32_bytes)
         if computed_checksum != stored_checksum:
             raise ValueError(
@@ -55,10 +110,16 @@ class Crc32cCodec(BytesBytesCodec):
     ) -> Buffer | None:
         data = chunk_bytes.as_numpy_array()
         # Calculate the checksum and "cast" it to a numpy array
-        checksum = np.array([crc32c(cast(typing_extensions.Buffer, data))], dtype=np.uint32)
+        checksum = np.array(
+            [await run_codec_function(crc32c, cast(typing_extensions.Buffer, data))],
+            dtype=np.uint32,
+        )
         # Append the checksum (as bytes) to the data
         return chunk_spec.prototype.buffer.from_array_like(np.append(data, checksum.view("b")))
 
+    def resolve_byte_getter(self, byte_getter: ByteGetter, chunk_spec: ArraySpec) -> ByteGetter:
+        return _Crc32cByteGetter(self, byte_getter, chunk_spec)
+
     def compute_encoded_size(self, input_byte_length: int, _chunk_spec: ArraySpec) -> int:
         return input_byte_length + 4
 
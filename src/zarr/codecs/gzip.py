@@ -1,19 +1,21 @@
 from __future__ import annotations
 
-import asyncio
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from numcodecs.gzip import GZip
 
-from zarr.abc.codec import BytesBytesCodec
-from zarr.core.buffer.cpu import as_numpy_array_wrapper
+from zarr.abc.codec import BytesBytesCodec, BytesBytesCodecDecodeIntoMixin
 from zarr.core.common import JSON, parse_named_configuration
+from zarr.core.sync import run_codec_function
 from zarr.registry import register_codec
 
 if TYPE_CHECKING:
     from typing import Self
 
+    import numpy as np
+    import numpy.typing as npt
+
     from zarr.core.array_spec import ArraySpec
     from zarr.core.buffer import Buffer
 
@@ -29,7 +31,7 @@ def parse_gzip_level(data: JSON) -> int:
 
 
 @dataclass(frozen=True)
-class GzipCodec(BytesBytesCodec):
+class GzipCodec(BytesBytesCodecDecodeIntoMixin, BytesBytesCodec):
     is_fixed_size = False
 
     level: int = 5
@@ -52,17 +54,22 @@ class GzipCodec(BytesBytesCodec):
         chunk_bytes: Buffer,
         chunk_spec: ArraySpec,
     ) -> Buffer:
-        return await asyncio.to_thread(
-            as_numpy_array_wrapper, GZip(self.level).decode, chunk_bytes, chunk_spec.prototype
+        return chunk_spec.prototype.buffer.from_bytes(
+            await run_codec_function(GZip(self.level).decode, chunk_bytes.as_numpy_array())
         )
 
+    async def decode_into(
+        self, chunk_bytes: Buffer, chunk_spec: ArraySpec, out: npt.NDArray[np.uint8]
+    ) -> None:
+        await run_codec_function(GZip(self.level).decode, chunk_bytes.as_numpy_array(), out)
+
     async def _encode_single(
         self,
         chunk_bytes: Buffer,
         chunk_spec: ArraySpec,
     ) -> Buffer | None:
-        return await asyncio.to_thread(
-            as_numpy_array_wrapper, GZip(self.level).encode, chunk_bytes, chunk_spec.prototype
+        return chunk_spec.prototype.buffer.from_bytes(
+            await run_codec_function(GZip(self.level).encode, chunk_bytes.as_numpy_array())
         )
 
     def compute_encoded_size(
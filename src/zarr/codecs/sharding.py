@@ -5,7 +5,7 @@ from dataclasses import dataclass, field, replace
 from enum import Enum
 from functools import lru_cache
 from operator import itemgetter
-from typing import TYPE_CHECKING, Any, NamedTuple, cast
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple, cast
 
 import numpy as np
 import numpy.typing as npt
@@ -26,6 +26,7 @@ from zarr.abc.store import (
 )
 from zarr.codecs.bytes import BytesCodec
 from zarr.codecs.crc32c_ import Crc32cCodec
+from zarr.core._lru import CacheInfo, LRUCache, StoreToken, store_token
 from zarr.core.array_spec import ArrayConfig, ArraySpec
 from zarr.core.buffer import (
     Buffer,
@@ -34,29 +35,38 @@ from zarr.core.buffer import (
     default_buffer_prototype,
     numpy_buffer_prototype,
 )
+from zarr.core.buffer_pool import _get_buffer_pool, acquire_array
 from zarr.core.chunk_grids import ChunkGrid, RegularChunkGrid
 from zarr.core.common import (
     ChunkCoords,
     ChunkCoordsLike,
+    concurrent_map,
+    decode_map,
     parse_enum,
     parse_named_configuration,
     parse_shapelike,
     product,
 )
+from zarr.core.config import config
 from zarr.core.indexing import (
     BasicIndexer,
+    ChunkProjection,
     SelectorTuple,
     c_order_iter,
     get_indexer,
+    is_total_slice,
     morton_order_iter,
+    morton_order_permutation,
 )
 from zarr.core.metadata.v3 import parse_codecs
 from zarr.registry import get_ndbuffer_class, get_pipeline_class, register_codec
+from zarr.storage._common import StorePath
 
 if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable, Iterator
     from typing import Self
 
+    from zarr.abc.store import Store
     from zarr.core.common import JSON
 
 MAX_UINT_64 = 2**64 - 1
@@ -64,6 +74,38 @@ ShardMapping = Mapping[ChunkCoords, Buffer]
 ShardMutableMapping = MutableMapping[ChunkCoords, Buffer]
 
 
+def _coalesce_byte_ranges(
+    byte_ranges: Iterable[tuple[int, int]], max_gap: int
+) -> list[tuple[int, int, list[int]]]:
+    """
+    Group byte ranges into larger ranges that can be fetched with a single request.
+
+    Ranges are merged if the gap between them is at most ``max_gap`` bytes.
+
+    Parameters
+    ----------
+    byte_ranges : Iterable[tuple[int, int]]
+        The ``(start, stop)`` byte ranges.
+    max_gap : int
+        The maximum number of unrequested bytes between two merged ranges.
+
+    Returns
+    -------
+    list[tuple[int, int, list[int]]]
+        The ``(start, stop)`` of each merged range, with the positions of its members in
+        ``byte_ranges``.
+    """
+    groups: list[tuple[int, int, list[int]]] = []
+    for i, (start, stop) in sorted(enumerate(byte_ranges), key=lambda item: item[1]):
+        if groups and start - groups[-1][1] <= max_gap:
+            group_start, group_stop, members = groups[-1]
+            members.append(i)
+            groups[-1] = (group_start, max(group_stop, stop), members)
+        else:
+            groups.append((start, stop, [i]))
+    return groups
+
+
 class ShardingCodecIndexLocation(Enum):
     """
     Enum for index location used by the sharding codec.
@@ -77,6 +119,16 @@ def parse_index_location(data: object) -> ShardingCodecIndexLocation:
     return parse_enum(data, ShardingCodecIndexLocation)
 
 
+def _get_write_mode() -> Literal["rewrite", "append"]:
+    write_mode = config.get("sharding.write_mode", "rewrite")
+    if write_mode not in ("rewrite", "append"):
+        raise ValueError(
+            f"Invalid value for sharding.write_mode: {write_mode!r}. "
+            "Expected 'rewrite' or 'append'."
+        )
+    return cast(Literal["rewrite", "append"], write_mode)
+
+
 @dataclass(frozen=True)
 class _ShardingByteGetter(ByteGetter):
     shard_dict: ShardMapping
@@ -168,6 +220,30 @@ class _ShardIndex(NamedTuple):
             for offset, length in sorted_offsets_and_lengths
         )
 
+    def nbytes_chunks(self) -> int:
+        """The total length of all non-empty chunks."""
+        lengths = self.offsets_and_lengths[..., 1]
+        return int(lengths[lengths != MAX_UINT_64].sum())
+
+    def count_out_of_order(self, data_start: int) -> int:
+        """Count the non-empty chunks that do not directly follow the previous non-empty
+        chunk in Morton order. The first chunk is expected at ``data_start``."""
+        offsets_and_lengths = self.offsets_and_lengths.reshape(-1, 2)[
+            morton_order_permutation(self.chunks_per_shard)
+        ]
+        offsets_and_lengths = offsets_and_lengths[offsets_and_lengths[:, 0] != MAX_UINT_64]
+        expected_offsets = np.concatenate(
+            (
+                np.array([data_start], dtype="<u8"),
+                offsets_and_lengths[:-1, 0] + offsets_and_lengths[:-1, 1],
+            )
+        )
+        return int(
+            np.count_nonzero(
+                offsets_and_lengths[:, 0] != expected_offsets[: len(offsets_and_lengths)]
+            )
+        )
+
     @classmethod
     def create_empty(cls, chunks_per_shard: ChunkCoords) -> _ShardIndex:
         offsets_and_lengths = np.zeros(chunks_per_shard + (2,), dtype="<u8", order="C")
@@ -175,6 +251,111 @@ class _ShardIndex(NamedTuple):
         return cls(offsets_and_lengths)
 
 
+_ShardIndexCacheKey = tuple[StoreToken, str, ChunkCoords, ShardingCodecIndexLocation]
+
+# Decoded shard indexes, shared by all arrays and keyed by the store and the path of
+# the shard.
+_shard_index_cache: LRUCache[_ShardIndexCacheKey, _ShardIndex] = LRUCache(
+    0,
+    sizeof=lambda index: index.offsets_and_lengths.nbytes,
+    # the indexes are looked up by store, and by store and shard path, for invalidation
+    groups=lambda key: ((key[0],), key[:2]),
+)
+
+
+def _get_shard_index_cache() -> LRUCache[_ShardIndexCacheKey, _ShardIndex] | None:
+    max_nbytes = config.get("sharding.index_cache_size", 0)
+    if max_nbytes != _shard_index_cache.max_nbytes:
+        _shard_index_cache.resize(max_nbytes)
+    return _shard_index_cache if max_nbytes > 0 else None
+
+
+def _invalidate_shard_indexes(store: Store, path: str, *, prefix: bool = False) -> None:
+    """Remove the index of the shard stored under ``path`` from the cache, or the
+    indexes of all shards in the directory ``path`` if ``prefix`` is True."""
+    token = store_token(store)
+    if not prefix:
+        _shard_index_cache.pop_group((token, path))
+    else:
+        directory = path.rstrip("/") + "/" if path.rstrip("/") else ""
+        _shard_index_cache.pop_matching(lambda key: key[1].startswith(directory), group=(token,))
+
+
+def shard_index_cache_info() -> CacheInfo:
+    """
+    Return the statistics of the shard index cache.
+
+    The cache is enabled by setting ``sharding.index_cache_size`` to the number of bytes
+    of decoded shard indexes to keep in memory.
+
+    Returns
+    -------
+    CacheInfo
+    """
+    return _shard_index_cache.info()
+
+
+def clear_shard_index_cache() -> None:
+    """
+    Remove all entries from the shard index cache and reset its statistics.
+
+    The cache is only invalidated by writes and deletes through Zarr arrays and groups
+    in this process. Call this function after shards were modified by other means.
+    """
+    _shard_index_cache.clear()
+
+
+class _ShardLayout(NamedTuple):
+    """Where the space of a stored shard goes."""
+
+    nbytes: int
+    nbytes_wasted: int
+    nchunks_out_of_order: int
+
+    @property
+    def is_fragmented(self) -> bool:
+        return self.nbytes_wasted > 0 or self.nchunks_out_of_order > 0
+
+
+@dataclass(frozen=True)
+class ShardCompactionReport:
+    """
+    Summary of the layout of the shards of an array, as returned by
+    :func:`zarr.api.asynchronous.compact_shards`.
+
+    Attributes
+    ----------
+    nshards : int
+        The number of stored shards.
+    nshards_fragmented : int
+        The number of shards with wasted bytes or chunks that are not stored densely
+        in Morton order.
+    nshards_compacted : int
+        The number of shards that were rewritten.
+    nbytes_wasted : int
+        The number of bytes in stored shards that do not belong to any chunk or index,
+        before compaction.
+    nchunks_out_of_order : int
+        The number of chunks that are not stored directly after the previous chunk in
+        Morton order, before compaction.
+    """
+
+    nshards: int
+    nshards_fragmented: int
+    nshards_compacted: int
+    nbytes_wasted: int
+    nchunks_out_of_order: int
+
+
+class _ShardReadPlan(NamedTuple):
+    """The fetched inner chunks of a shard and where to put them once decoded."""
+
+    shard_dict: ShardMapping
+    chunk_spec: ArraySpec
+    indexed_chunks: list[ChunkProjection]
+    out: NDBuffer
+
+
 class _ShardReader(ShardMapping):
     buf: Buffer
     index: _ShardIndex
@@ -327,6 +508,83 @@ class _MergingShardBuilder(ShardMutableMapping):
         return await shard_builder.finalize(index_location, index_encoder)
 
 
+@dataclass(frozen=True)
+class _AppendingShardBuilder(ShardMutableMapping):
+    """Collects the changed inner chunks of a shard so that they can be appended to it.
+
+    ``old_dict`` holds the existing bytes of the chunks that are partially overwritten
+    and ``index`` is a writable copy of the existing shard index.
+    """
+
+    old_dict: ShardMapping
+    index: _ShardIndex
+    new_dict: dict[ChunkCoords, Buffer] = field(default_factory=dict)
+    tombstones: set[ChunkCoords] = field(default_factory=set)
+
+    def __getitem__(self, chunk_coords: ChunkCoords) -> Buffer:
+        if chunk_coords in self.tombstones:
+            raise KeyError(chunk_coords)
+        chunk_bytes_maybe = self.new_dict.get(chunk_coords)
+        if chunk_bytes_maybe is not None:
+            return chunk_bytes_maybe
+        return self.old_dict[chunk_coords]
+
+    def __setitem__(self, chunk_coords: ChunkCoords, value: Buffer) -> None:
+        self.tombstones.discard(chunk_coords)
+        self.new_dict[chunk_coords] = value
+
+    def __delitem__(self, chunk_coords: ChunkCoords) -> None:
+        self.new_dict.pop(chunk_coords, None)
+        self.tombstones.add(chunk_coords)
+
+    def __len__(self) -> int:
+        return product(self.index.chunks_per_shard)
+
+    def __iter__(self) -> Iterator[ChunkCoords]:
+        return c_order_iter(self.index.chunks_per_shard)
+
+    def is_empty(self) -> bool:
+        full_chunk_coords_map = self.index.get_full_chunk_map()
+        for tombstone in self.tombstones:
+            full_chunk_coords_map[tombstone] = False
+        for chunk_coords in self.new_dict:
+            full_chunk_coords_map[chunk_coords] = True
+        return bool(np.array_equiv(full_chunk_coords_map, False))
+
+    async def finalize_append(
+        self,
+        shard_nbytes: int,
+        index_nbytes: int,
+        index_location: ShardingCodecIndexLocation,
+        index_encoder: Callable[[_ShardIndex], Awaitable[Buffer]],
+    ) -> list[tuple[int, Buffer]]:
+        """Return the ``(start, bytes)`` writes that apply the changes to the shard.
+
+        New chunks are appended after the existing chunks. With the index at the end,
+        they overwrite the old index, which is then written after them. With the index
+        at the start, it is overwritten in place. The bytes of replaced and deleted
+        chunks are left in the shard as dead space.
+        """
+        if index_location == ShardingCodecIndexLocation.end:
+            append_start = shard_nbytes - index_nbytes
+        else:
+            append_start = shard_nbytes
+        new_buf = default_buffer_prototype().buffer.create_zero_length()
+        for chunk_coords, value in self.new_dict.items():
+            chunk_start = append_start + len(new_buf)
+            self.index.set_chunk_slice(chunk_coords, slice(chunk_start, chunk_start + len(value)))
+            new_buf += value
+        for tombstone in self.tombstones:
+            self.index.set_chunk_slice(tombstone, None)
+
+        index_bytes = await index_encoder(self.index)
+        if index_location == ShardingCodecIndexLocation.end:
+            return [(append_start, new_buf + index_bytes)]
+        if len(new_buf) == 0:
+            return [(0, index_bytes)]
+        return [(0, index_bytes), (append_start, new_buf)]
+
+
 @dataclass(frozen=True)
 class ShardingCodec(
     ArrayBytesCodec, ArrayBytesCodecPartialDecodeMixin, ArrayBytesCodecPartialEncodeMixin
@@ -421,11 +679,40 @@ class ShardingCodec(
                 "The array's `chunk_shape` needs to be divisible by the shard's inner `chunk_shape`."
             )
 
+    async def decode(
+        self,
+        chunks_and_specs: Iterable[tuple[Buffer | None, ArraySpec]],
+    ) -> Iterable[NDBuffer | None]:
+        # docstring inherited
+        if self.codec_pipeline.supports_partial_decode:
+            return await super().decode(chunks_and_specs)
+        chunks_and_specs = list(chunks_and_specs)
+        plans = await concurrent_map(
+            [
+                (shard_bytes, shard_spec)
+                for shard_bytes, shard_spec in chunks_and_specs
+                if shard_bytes is not None
+            ],
+            self._plan_shard_read,
+            config.get("async.concurrency"),
+        )
+        await self._decode_inner_chunks(plans)
+        plans_iter = iter(plans)
+        return [
+            next(plans_iter).out if shard_bytes is not None else None
+            for shard_bytes, _ in chunks_and_specs
+        ]
+
     async def _decode_single(
         self,
         shard_bytes: Buffer,
         shard_spec: ArraySpec,
     ) -> NDBuffer:
+        plan = await self._plan_shard_read(shard_bytes, shard_spec)
+        await self._read_inner_chunks(plan)
+        return plan.out
+
+    async def _plan_shard_read(self, shard_bytes: Buffer, shard_spec: ArraySpec) -> _ShardReadPlan:
         shard_shape = shard_spec.shape
         chunk_shape = self.chunk_shape
         chunks_per_shard = self._get_chunks_per_shard(shard_spec)
@@ -445,23 +732,23 @@ class ShardingCodec(
 
         if shard_dict.index.is_all_empty():
             out.fill(shard_spec.fill_value)
-            return out
+            return _ShardReadPlan(shard_dict, chunk_spec, [], out)
 
-        # decoding chunks and writing them into the output buffer
-        await self.codec_pipeline.read(
-            [
-                (
-                    _ShardingByteGetter(shard_dict, chunk_coords),
-                    chunk_spec,
-                    chunk_selection,
-                    out_selection,
-                )
-                for chunk_coords, chunk_selection, out_selection in indexer
-            ],
-            out,
-        )
+        return _ShardReadPlan(shard_dict, chunk_spec, list(indexer), out)
 
-        return out
+    async def decode_partial(
+        self,
+        batch_info: Iterable[tuple[ByteGetter, SelectorTuple, ArraySpec]],
+    ) -> Iterable[NDBuffer | None]:
+        # docstring inherited
+        if self.codec_pipeline.supports_partial_decode:
+            return await super().decode_partial(batch_info)
+        # fetch the requested inner chunks of all shards first, then decode them together
+        maybe_plans = await concurrent_map(
+            list(batch_info), self._plan_partial_shard_read, config.get("async.concurrency")
+        )
+        await self._decode_inner_chunks([plan for plan in maybe_plans if plan is not None])
+        return [plan.out if plan is not None else None for plan in maybe_plans]
 
     async def _decode_partial_single(
         self,
@@ -469,6 +756,18 @@ class ShardingCodec(
         selection: SelectorTuple,
         shard_spec: ArraySpec,
     ) -> NDBuffer | None:
+        plan = await self._plan_partial_shard_read(byte_getter, selection, shard_spec)
+        if plan is None:
+            return None
+        await self._read_inner_chunks(plan)
+        return plan.out
+
+    async def _plan_partial_shard_read(
+        self,
+        byte_getter: ByteGetter,
+        selection: SelectorTuple,
+        shard_spec: ArraySpec,
+    ) -> _ShardReadPlan | None:
         shard_shape = shard_spec.shape
         chunk_shape = self.chunk_shape
         chunks_per_shard = self._get_chunks_per_shard(shard_spec)
@@ -480,10 +779,18 @@ class ShardingCodec(
             chunk_grid=RegularChunkGrid(chunk_shape=chunk_shape),
         )
 
-        # setup output array
-        out = shard_spec.prototype.nd_buffer.create(
-            shape=indexer.shape, dtype=shard_spec.dtype, order=shard_spec.order, fill_value=0
-        )
+        # setup output array, every item of which is written by the inner chunks, so that
+        # memory from the buffer pool does not need to be initialized
+        pool = _get_buffer_pool()
+        out = None
+        if pool is not None:
+            out = acquire_array(
+                pool, shard_spec.prototype, indexer.shape, shard_spec.dtype, shard_spec.order
+            )
+        if out is None:
+            out = shard_spec.prototype.nd_buffer.create(
+                shape=indexer.shape, dtype=shard_spec.dtype, order=shard_spec.order, fill_value=0
+            )
 
         indexed_chunks = list(indexer)
         all_chunk_coords = {chunk_coords for chunk_coords, _, _ in indexed_chunks}
@@ -498,38 +805,73 @@ class ShardingCodec(
                 chunks_per_shard=chunks_per_shard,
             )
             if shard_dict_maybe is None:
+                if pool is not None:
+                    pool.release(out.as_ndarray_like())
                 return None
             shard_dict = shard_dict_maybe
         else:
             # read some chunks within the shard
             shard_index = await self._load_shard_index_maybe(byte_getter, chunks_per_shard)
             if shard_index is None:
+                if pool is not None:
+                    pool.release(out.as_ndarray_like())
                 return None
-            shard_dict = {}
-            for chunk_coords in all_chunk_coords:
-                chunk_byte_slice = shard_index.get_chunk_slice(chunk_coords)
-                if chunk_byte_slice:
-                    chunk_bytes = await byte_getter.get(
-                        prototype=chunk_spec.prototype,
-                        byte_range=RangeByteRequest(chunk_byte_slice[0], chunk_byte_slice[1]),
-                    )
-                    if chunk_bytes:
-                        shard_dict[chunk_coords] = chunk_bytes
+            shard_dict = await self._load_chunks(
+                byte_getter, shard_index, all_chunk_coords, chunk_spec.prototype
+            )
 
+        return _ShardReadPlan(shard_dict, chunk_spec, indexed_chunks, out)
+
+    async def _read_inner_chunks(self, plan: _ShardReadPlan) -> None:
         # decoding chunks and writing them into the output buffer
         await self.codec_pipeline.read(
             [
                 (
-                    _ShardingByteGetter(shard_dict, chunk_coords),
-                    chunk_spec,
+                    _ShardingByteGetter(plan.shard_dict, chunk_coords),
+                    plan.chunk_spec,
                     chunk_selection,
                     out_selection,
                 )
-                for chunk_coords, chunk_selection, out_selection in indexer
+                for chunk_coords, chunk_selection, out_selection in plan.indexed_chunks
+            ],
+            plan.out,
+        )
+
+    async def _decode_inner_chunks(self, plans: Iterable[_ShardReadPlan]) -> None:
+        """Decode the inner chunks of several shards as one flat work queue.
+
+        All inner chunks share a single ``async.concurrency`` budget, instead of every
+        shard running its own nested codec pipeline. Within a read, the budget is shared
+        with the inner chunks of the other shards that are being read (see
+        ``decode_budget``).
+        """
+        codec_pipeline = self.codec_pipeline
+
+        async def _decode_inner_chunk(
+            plan: _ShardReadPlan,
+            chunk_coords: ChunkCoords,
+            chunk_selection: SelectorTuple,
+            out_selection: SelectorTuple | slice,
+        ) -> None:
+            chunk_bytes = plan.shard_dict.get(chunk_coords)
+            if chunk_bytes is None:
+                plan.out[out_selection] = plan.chunk_spec.fill_value
+                return
+            (chunk_array,) = await codec_pipeline.decode([(chunk_bytes, plan.chunk_spec)])
+            if chunk_array is None:
+                plan.out[out_selection] = plan.chunk_spec.fill_value
+            else:
+                plan.out[out_selection] = chunk_array[chunk_selection]
+
+        await decode_map(
+            [
+                (plan, chunk_coords, chunk_selection, out_selection)
+                for plan in plans
+                for chunk_coords, chunk_selection, out_selection in plan.indexed_chunks
             ],
-            out,
+            _decode_inner_chunk,
+            config.get("async.concurrency"),
         )
-        return out
 
     async def _encode_single(
         self,
@@ -573,8 +915,34 @@ class ShardingCodec(
         selection: SelectorTuple,
         shard_spec: ArraySpec,
     ) -> None:
-        shard_shape = shard_spec.shape
-        chunk_shape = self.chunk_shape
+        chunks_per_shard = self._get_chunks_per_shard(shard_spec)
+        indexer = list(
+            get_indexer(
+                selection,
+                shape=shard_spec.shape,
+                chunk_grid=RegularChunkGrid(chunk_shape=self.chunk_shape),
+            )
+        )
+        all_chunk_coords = {chunk_coords for chunk_coords, _, _ in indexer}
+
+        if not (
+            _get_write_mode() == "append"
+            and isinstance(byte_setter, StorePath)
+            and byte_setter.store.supports_partial_writes
+            # rewriting is cheaper than appending if every chunk of the shard changes
+            and not self._is_total_shard(all_chunk_coords, chunks_per_shard)
+            and await self._append_partial_single(byte_setter, shard_array, indexer, shard_spec)
+        ):
+            await self._rewrite_partial_single(byte_setter, shard_array, indexer, shard_spec)
+        self._invalidate_shard_index(byte_setter, chunks_per_shard)
+
+    async def _rewrite_partial_single(
+        self,
+        byte_setter: ByteSetter,
+        shard_array: NDBuffer,
+        indexer: list[ChunkProjection],
+        shard_spec: ArraySpec,
+    ) -> None:
         chunks_per_shard = self._get_chunks_per_shard(shard_spec)
         chunk_spec = self._get_chunk_spec(shard_spec)
 
@@ -588,12 +956,6 @@ class ShardingCodec(
             _ShardBuilder.create_empty(chunks_per_shard),
         )
 
-        indexer = list(
-            get_indexer(
-                selection, shape=shard_shape, chunk_grid=RegularChunkGrid(chunk_shape=chunk_shape)
-            )
-        )
-
         await self.codec_pipeline.write(
             [
                 (
@@ -617,6 +979,142 @@ class ShardingCodec(
                 )
             )
 
+    async def _append_partial_single(
+        self,
+        byte_setter: StorePath,
+        shard_array: NDBuffer,
+        indexer: list[ChunkProjection],
+        shard_spec: ArraySpec,
+    ) -> bool:
+        """Write the changed inner chunks at the end of an existing shard and only rewrite
+        its index. Returns False, without writing anything, if the shard does not exist.
+        """
+        chunks_per_shard = self._get_chunks_per_shard(shard_spec)
+        chunk_spec = self._get_chunk_spec(shard_spec)
+
+        shard_index = await self._load_shard_index_maybe(byte_setter, chunks_per_shard)
+        if shard_index is None:
+            return False
+        shard_nbytes = await byte_setter.store.getsize(byte_setter.path)
+
+        # only chunks that are partially overwritten need their existing bytes
+        old_dict = await self._load_chunks(
+            byte_setter,
+            shard_index,
+            {
+                chunk_coords
+                for chunk_coords, chunk_selection, _ in indexer
+                if not is_total_slice(chunk_selection, self.chunk_shape)
+            },
+            chunk_spec.prototype,
+        )
+        shard_dict = _AppendingShardBuilder(
+            old_dict, _ShardIndex(shard_index.offsets_and_lengths.copy())
+        )
+
+        await self.codec_pipeline.write(
+            [
+                (
+                    _ShardingByteSetter(shard_dict, chunk_coords),
+                    chunk_spec,
+                    chunk_selection,
+                    out_selection,
+                )
+                for chunk_coords, chunk_selection, out_selection in indexer
+            ],
+            shard_array,
+        )
+
+        if shard_dict.is_empty():
+            await byte_setter.delete()
+        else:
+            writes = await shard_dict.finalize_append(
+                shard_nbytes,
+                self._shard_index_size(chunks_per_shard),
+                self.index_location,
+                self._encode_shard_index,
+            )
+            await byte_setter.store.set_partial_values(
+                [(byte_setter.path, start, buf.as_buffer_like()) for start, buf in writes]
+            )
+        return True
+
+    async def _inspect_shard(
+        self, store_path: StorePath, shard_spec: ArraySpec
+    ) -> _ShardLayout | None:
+        chunks_per_shard = self._get_chunks_per_shard(shard_spec)
+        shard_index = await self._fetch_shard_index_maybe(store_path, chunks_per_shard)
+        if shard_index is None:
+            return None
+        shard_nbytes = await store_path.store.getsize(store_path.path)
+        index_nbytes = self._shard_index_size(chunks_per_shard)
+        data_start = index_nbytes if self.index_location == ShardingCodecIndexLocation.start else 0
+        return _ShardLayout(
+            nbytes=shard_nbytes,
+            nbytes_wasted=shard_nbytes - index_nbytes - shard_index.nbytes_chunks(),
+            nchunks_out_of_order=shard_index.count_out_of_order(data_start),
+        )
+
+    async def _compact_shard(self, store_path: StorePath, shard_spec: ArraySpec) -> None:
+        chunks_per_shard = self._get_chunks_per_shard(shard_spec)
+        shard_dict = await self._load_full_shard_maybe(
+            byte_getter=store_path,
+            prototype=default_buffer_prototype(),
+            chunks_per_shard=chunks_per_shard,
+        )
+        if shard_dict is None:
+            return
+        shard_builder = _ShardBuilder.merge_with_morton_order(chunks_per_shard, set(), shard_dict)
+        if shard_builder.is_empty():
+            await store_path.delete()
+        else:
+            await store_path.set(
+                await shard_builder.finalize(self.index_location, self._encode_shard_index)
+            )
+        self._invalidate_shard_index(store_path, chunks_per_shard)
+
+    async def _compact(
+        self,
+        shards: Iterable[tuple[StorePath, ArraySpec]],
+        *,
+        dry_run: bool,
+        max_memory: int,
+    ) -> ShardCompactionReport:
+        """Inspect shards and rewrite the fragmented ones densely in Morton order.
+
+        Shards are rewritten concurrently in waves whose total stored size is at most
+        ``max_memory`` bytes; a shard larger than ``max_memory`` is rewritten on its own.
+        """
+        shards = list(shards)
+        layouts = await concurrent_map(shards, self._inspect_shard, config.get("async.concurrency"))
+        stored = [(shard, layout) for shard, layout in zip(shards, layouts, strict=True) if layout]
+        fragmented = [(shard, layout) for shard, layout in stored if layout.is_fragmented]
+
+        if not dry_run:
+            wave: list[tuple[StorePath, ArraySpec]] = []
+            wave_nbytes = 0
+            for shard, layout in fragmented:
+                if wave and wave_nbytes + layout.nbytes > max_memory:
+                    await concurrent_map(wave, self._compact_shard, config.get("async.concurrency"))
+                    wave, wave_nbytes = [], 0
+                wave.append(shard)
+                wave_nbytes += layout.nbytes
+            await concurrent_map(wave, self._compact_shard, config.get("async.concurrency"))
+
+        return ShardCompactionReport(
+            nshards=len(stored),
+            nshards_fragmented=len(fragmented),
+            nshards_compacted=0 if dry_run else len(fragmented),
+            nbytes_wasted=sum(layout.nbytes_wasted for _, layout in stored),
+            nchunks_out_of_order=sum(layout.nchunks_out_of_order for _, layout in stored),
+        )
+
+    def _invalidate_shard_index(
+        self, byte_setter: ByteSetter, chunks_per_shard: ChunkCoords
+    ) -> None:
+        if isinstance(byte_setter, StorePath):
+            _invalidate_shard_indexes(byte_setter.store, byte_setter.path)
+
     def _is_total_shard(
         self, all_chunk_coords: set[ChunkCoords], chunks_per_shard: ChunkCoords
     ) -> bool:
@@ -697,8 +1195,39 @@ class ShardingCodec(
             )
         )
 
+    def _shard_index_cache_key(
+        self, byte_getter: ByteGetter, chunks_per_shard: ChunkCoords
+    ) -> _ShardIndexCacheKey | None:
+        # only shards stored directly in a store are cached, not shards nested in shards
+        if not isinstance(byte_getter, StorePath):
+            return None
+        token = _shard_index_cache.track_store(byte_getter.store)
+        return (token, byte_getter.path, chunks_per_shard, self.index_location)
+
     async def _load_shard_index_maybe(
         self, byte_getter: ByteGetter, chunks_per_shard: ChunkCoords
+    ) -> _ShardIndex | None:
+        cache = _get_shard_index_cache()
+        cache_key = (
+            self._shard_index_cache_key(byte_getter, chunks_per_shard)
+            if cache is not None
+            else None
+        )
+        if cache is not None and cache_key is not None:
+            shard_index = cache.get(cache_key)
+            if shard_index is not None:
+                return shard_index
+            generation = cache.generation
+            shard_index = await self._fetch_shard_index_maybe(byte_getter, chunks_per_shard)
+            if shard_index is not None and generation == cache.generation:
+                # cached indexes are shared, so they must not be modified in place
+                shard_index.offsets_and_lengths.flags.writeable = False
+                cache.set(cache_key, shard_index, generation)
+            return shard_index
+        return await self._fetch_shard_index_maybe(byte_getter, chunks_per_shard)
+
+    async def _fetch_shard_index_maybe(
+        self, byte_getter: ByteGetter, chunks_per_shard: ChunkCoords
     ) -> _ShardIndex | None:
         shard_index_size = self._shard_index_size(chunks_per_shard)
         if self.index_location == ShardingCodecIndexLocation.start:
@@ -721,6 +1250,47 @@ class ShardingCodec(
             await self._load_shard_index_maybe(byte_getter, chunks_per_shard)
         ) or _ShardIndex.create_empty(chunks_per_shard)
 
+    async def _load_chunks(
+        self,
+        byte_getter: ByteGetter,
+        shard_index: _ShardIndex,
+        all_chunk_coords: Iterable[ChunkCoords],
+        prototype: BufferPrototype,
+    ) -> ShardMapping:
+        chunk_coords_and_slices = [
+            (chunk_coords, chunk_byte_slice)
+            for chunk_coords in all_chunk_coords
+            if (chunk_byte_slice := shard_index.get_chunk_slice(chunk_coords)) is not None
+        ]
+        # nearby chunks are fetched together and the requests are issued concurrently
+        groups = _coalesce_byte_ranges(
+            (chunk_byte_slice for _, chunk_byte_slice in chunk_coords_and_slices),
+            config.get("sharding.read_coalesce_max_gap", 0),
+        )
+        byte_ranges = [RangeByteRequest(start, stop) for start, stop, _ in groups]
+        group_bytes: list[Buffer | None]
+        if isinstance(byte_getter, StorePath):
+            group_bytes = await byte_getter.store.get_partial_values(
+                prototype, [(byte_getter.path, byte_range) for byte_range in byte_ranges]
+            )
+        else:
+            group_bytes = await concurrent_map(
+                [(byte_range,) for byte_range in byte_ranges],
+                lambda byte_range: byte_getter.get(prototype=prototype, byte_range=byte_range),
+                config.get("async.concurrency"),
+            )
+
+        shard_dict: dict[ChunkCoords, Buffer] = {}
+        for (group_start, _, members), buf in zip(groups, group_bytes, strict=True):
+            if buf is None:
+                continue
+            for i in members:
+                chunk_coords, (chunk_start, chunk_stop) = chunk_coords_and_slices[i]
+                chunk_bytes = buf[chunk_start - group_start : chunk_stop - group_start]
+                if chunk_bytes:
+                    shard_dict[chunk_coords] = chunk_bytes
+        return shard_dict
+
     async def _load_full_shard_maybe(
         self, byte_getter: ByteGetter, prototype: BufferPrototype, chunks_per_shard: ChunkCoords
     ) -> _ShardReader | None:
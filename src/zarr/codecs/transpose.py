@@ -6,9 +6,10 @@ from typing import TYPE_CHECKING, cast
 
 import numpy as np
 
-from zarr.abc.codec import ArrayArrayCodec
+from zarr.abc.codec import ArrayArrayCodec, ArrayArrayCodecPartialDecodeMixin
 from zarr.core.array_spec import ArraySpec
 from zarr.core.common import JSON, ChunkCoordsLike, parse_named_configuration
+from zarr.core.indexing import is_integer
 from zarr.registry import register_codec
 
 if TYPE_CHECKING:
@@ -16,6 +17,7 @@ if TYPE_CHECKING:
 
     from zarr.core.buffer import NDBuffer
     from zarr.core.chunk_grids import ChunkGrid
+    from zarr.core.indexing import SelectorTuple
 
 
 def parse_transpose_order(data: JSON | Iterable[int]) -> tuple[int, ...]:
@@ -26,8 +28,24 @@ def parse_transpose_order(data: JSON | Iterable[int]) -> tuple[int, ...]:
     return tuple(cast(Iterable[int], data))
 
 
+def _is_basic_selection(selection: SelectorTuple, ndim: int) -> bool:
+    return (
+        isinstance(selection, tuple)
+        and len(selection) == ndim
+        and all(isinstance(s, slice) or is_integer(s) for s in selection)
+    )
+
+
+def _is_array_selection(selection: SelectorTuple, ndim: int) -> bool:
+    return (
+        isinstance(selection, tuple)
+        and len(selection) == ndim
+        and all(isinstance(s, np.ndarray) for s in selection)
+    )
+
+
 @dataclass(frozen=True)
-class TransposeCodec(ArrayArrayCodec):
+class TransposeCodec(ArrayArrayCodecPartialDecodeMixin, ArrayArrayCodec):
     is_fixed_size = True
 
     order: tuple[int, ...]
@@ -96,6 +114,33 @@ class TransposeCodec(ArrayArrayCodec):
         inverse_order = np.argsort(self.order)
         return chunk_array.transpose(inverse_order)
 
+    def resolve_selection(self, selection: SelectorTuple, chunk_spec: ArraySpec) -> SelectorTuple:
+        # Basic selections (slices and integers) and advanced selections (only integer
+        # arrays) select the same elements when their entries are transposed. Any other
+        # selection reads the whole chunk.
+        if _is_basic_selection(selection, chunk_spec.ndim) or _is_array_selection(
+            selection, chunk_spec.ndim
+        ):
+            assert isinstance(selection, tuple)
+            return tuple(selection[axis] for axis in self.order)
+        return tuple(slice(None) for _ in self.order)
+
+    async def _decode_partial_single(
+        self,
+        chunk_array: NDBuffer,
+        selection: SelectorTuple,
+        chunk_spec: ArraySpec,
+    ) -> NDBuffer:
+        if _is_basic_selection(selection, chunk_spec.ndim):
+            assert isinstance(selection, tuple)
+            # integers drop their axis, so only the remaining axes are reordered
+            kept_axes = [axis for axis in self.order if not is_integer(selection[axis])]
+            return chunk_array.transpose(tuple(np.argsort(kept_axes)))
+        if _is_array_selection(selection, chunk_spec.ndim):
+            # the result has the broadcast shape of the arrays, regardless of their order
+            return chunk_array
+        return (await self._decode_single(chunk_array, chunk_spec))[selection]
+
     async def _encode_single(
         self,
         chunk_array: NDBuffer,
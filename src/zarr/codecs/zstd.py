@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import asyncio
 from dataclasses import dataclass
 from functools import cached_property
 from typing import TYPE_CHECKING
@@ -9,14 +8,17 @@ import numcodecs
 from numcodecs.zstd import Zstd
 from packaging.version import Version
 
-from zarr.abc.codec import BytesBytesCodec
-from zarr.core.buffer.cpu import as_numpy_array_wrapper
+from zarr.abc.codec import BytesBytesCodec, BytesBytesCodecDecodeIntoMixin
 from zarr.core.common import JSON, parse_named_configuration
+from zarr.core.sync import run_codec_function
 from zarr.registry import register_codec
 
 if TYPE_CHECKING:
     from typing import Self
 
+    import numpy as np
+    import numpy.typing as npt
+
     from zarr.core.array_spec import ArraySpec
     from zarr.core.buffer import Buffer
 
@@ -36,7 +38,7 @@ def parse_checksum(data: JSON) -> bool:
 
 
 @dataclass(frozen=True)
-class ZstdCodec(BytesBytesCodec):
+class ZstdCodec(BytesBytesCodecDecodeIntoMixin, BytesBytesCodec):
     is_fixed_size = True
 
     level: int = 0
@@ -75,17 +77,22 @@ class ZstdCodec(BytesBytesCodec):
         chunk_bytes: Buffer,
         chunk_spec: ArraySpec,
     ) -> Buffer:
-        return await asyncio.to_thread(
-            as_numpy_array_wrapper, self._zstd_codec.decode, chunk_bytes, chunk_spec.prototype
+        return chunk_spec.prototype.buffer.from_bytes(
+            await run_codec_function(self._zstd_codec.decode, chunk_bytes.as_numpy_array())
         )
 
+    async def decode_into(
+        self, chunk_bytes: Buffer, chunk_spec: ArraySpec, out: npt.NDArray[np.uint8]
+    ) -> None:
+        await run_codec_function(self._zstd_codec.decode, chunk_bytes.as_numpy_array(), out)
+
     async def _encode_single(
         self,
         chunk_bytes: Buffer,
         chunk_spec: ArraySpec,
     ) -> Buffer | None:
-        return await asyncio.to_thread(
-            as_numpy_array_wrapper, self._zstd_codec.encode, chunk_bytes, chunk_spec.prototype
+        return chunk_spec.prototype.buffer.from_bytes(
+            await run_codec_function(self._zstd_codec.encode, chunk_bytes.as_numpy_array())
         )
 
     def compute_encoded_size(self, _input_byte_length: int, _chunk_spec: ArraySpec) -> int:
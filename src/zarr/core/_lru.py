@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Iterable
+
+K = TypeVar("K", bound="Hashable")
+V = TypeVar("V")
+
+# Stores are identified by their type and string representation, which names the
+# location of their data, so that the stores that a program opens repeatedly for the
+# same location share their cache entries.
+StoreToken = tuple[type, str]
+
+
+def store_token(store: object) -> StoreToken:
+    """Return the token identifying ``store`` in the keys of the process-wide caches."""
+    return (type(store), str(store))
+
+
+@dataclass(frozen=True)
+class CacheInfo:
+    """
+    Statistics of a cache.
+
+    Attributes
+    ----------
+    hits : int
+        Number of lookups that found an entry.
+    misses : int
+        Number of lookups that did not find an entry.
+    evictions : int
+        Number of entries that were evicted to stay within ``max_nbytes``.
+    size : int
+        Number of entries currently held.
+    nbytes : int
+        Total size of the entries currently held, in bytes.
+    max_nbytes : int
+        Capacity of the cache, in bytes.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    nbytes: int
+    max_nbytes: int
+
+
+class LRUCache(Generic[K, V]):
+    """
+    A thread-safe least-recently-used cache bounded by the total size of its values.
+
+    Parameters
+    ----------
+    max_nbytes : int
+        The capacity of the cache, in bytes. A capacity of 0 disables the cache.
+    sizeof : Callable[[V], int]
+        A function returning the size of a value, in bytes. Values larger than
+        ``max_nbytes`` are never cached.
+    on_evict : Callable[[K, V], None], optional
+        A function called with the key and value of every entry that is evicted to stay
+        within ``max_nbytes``, or that is too large to be cached.
+    ttl : float, optional
+        The number of seconds after which entries expire. Expired entries are treated
+        as missing. By default, entries do not expire.
+    groups : Callable[[K], Iterable[Hashable]], optional
+        A function returning the groups that a key belongs to. The entries of a group
+        can be removed with ``pop_group`` without scanning the whole cache.
+
+    Notes
+    -----
+    Every removal of entries other than an eviction is an invalidation, and increments
+    ``generation``. A value read from the cached source is only stored if it is passed
+    to ``set`` with the generation from before the read, and no invalidation happened
+    since, so that reads that overlap a write do not cache stale values.
+    """
+
+    max_nbytes: int
+    ttl: float | None
+
+    def __init__(
+        self,
+        max_nbytes: int,
+        sizeof: Callable[[V], int],
+        on_evict: Callable[[K, V], None] | None = None,
+        ttl: float | None = None,
+        groups: Callable[[K], Iterable[Hashable]] | None = None,
+    ) -> None:
+        if max_nbytes < 0:
+            raise ValueError(f"max_nbytes must be non-negative. Got {max_nbytes} instead.")
+        self.max_nbytes = max_nbytes
+        self._sizeof = sizeof
+        self._on_evict = on_evict
+        self.ttl = ttl
+        self._key_groups = groups
+        # the value, its size, and the time at which it was stored
+        self._entries: OrderedDict[K, tuple[V, int, float]] = OrderedDict()
+        self._groups: dict[Hashable, set[K]] = {}
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._generation = 0
+        # the ids of the stores whose entries are removed when they are garbage collected
+        self._stores: set[int] = set()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def get(self, key: K) -> V | None:
+        """Return the value stored under ``key`` and mark it as most recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if (
+                entry is not None
+                and self.ttl is not None
+                and time.monotonic() - entry[2] >= self.ttl
+            ):
+                self._pop(key)
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    @property
+    def generation(self) -> int:
+        """The number of invalidations of the cache."""
+        return self._generation
+
+    def set(self, key: K, value: V, generation: int | None = None) -> None:
+        """Store ``value`` under ``key``, evicting least recently used entries as needed.
+
+        If ``generation`` is given, the value is only stored if the cache was not
+        invalidated since ``generation`` was read.
+        """
+        nbytes = self._sizeof(value)
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._pop(key)
+            if nbytes > self.max_nbytes:
+                if self._on_evict is not None:
+                    self._on_evict(key, value)
+                return
+            self._entries[key] = (value, nbytes, time.monotonic())
+            self._nbytes += nbytes
+            if self._key_groups is not None:
+                for group in self._key_groups(key):
+                    self._groups.setdefault(group, set()).add(key)
+            self._evict()
+
+    def pop(self, key: K) -> V | None:
+        """Remove ``key`` from the cache and return its value, if present."""
+        with self._lock:
+            self._generation += 1
+            return self._pop(key)
+
+    def pop_matching(self, predicate: Callable[[K], bool], group: Hashable = None) -> None:
+        """Remove all entries whose key satisfies ``predicate``, only considering the
+        entries of ``group`` if it is given."""
+        with self._lock:
+            self._generation += 1
+            keys = self._entries if group is None else self._groups.get(group, ())
+            for key in [key for key in keys if predicate(key)]:
+                self._pop(key)
+
+    def pop_group(self, group: Hashable) -> None:
+        """Remove all entries of ``group``."""
+        with self._lock:
+            self._generation += 1
+            for key in list(self._groups.get(group, ())):
+                self._pop(key)
+
+    def track_store(self, store: object) -> StoreToken:
+        """Return the token of ``store``, and remove the entries of the group ``(token,)``
+        once ``store`` is garbage collected.
+
+        The string representation of some stores, such as MemoryStore, is only unique
+        among the live stores, so their entries must not outlive them.
+        """
+        token = store_token(store)
+        store_id = id(store)
+        with self._lock:
+            if store_id in self._stores:
+                return token
+            self._stores.add(store_id)
+        weakref.finalize(store, self._forget_store, store_id, token)
+        return token
+
+    def _forget_store(self, store_id: int, token: StoreToken) -> None:
+        with self._lock:
+            self._stores.discard(store_id)
+        self.pop_group((token,))
+
+    def resize(self, max_nbytes: int) -> None:
+        """Change the capacity of the cache, evicting entries if it shrinks."""
+        if max_nbytes < 0:
+            raise ValueError(f"max_nbytes must be non-negative. Got {max_nbytes} instead.")
+        with self._lock:
+            self.max_nbytes = max_nbytes
+            self._evict()
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._groups.clear()
+            self._nbytes = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def info(self) -> CacheInfo:
+        """Return the statistics of the cache."""
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+                nbytes=self._nbytes,
+                max_nbytes=self.max_nbytes,
+            )
+
+    def _pop(self, key: K) -> V | None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return None
+        self._nbytes -= entry[1]
+        self._ungroup(key)
+        return entry[0]
+
+    def _ungroup(self, key: K) -> None:
+        if self._key_groups is None:
+            return
+        for group in self._key_groups(key):
+            keys = self._groups.get(group)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._groups[group]
+
+    def _evict(self) -> None:
+        while self._nbytes > self.max_nbytes:
+            key, (value, nbytes, _) = self._entries.popitem(last=False)
+            self._nbytes -= nbytes
+            self._ungroup(key)
+            self._evictions += 1
+            if self._on_evict is not None:
+                self._on_evict(key, value)
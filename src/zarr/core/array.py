@@ -38,6 +38,12 @@ from zarr.core.buffer import (
     NDBuffer,
     default_buffer_prototype,
 )
+from zarr.core.chunk_cache import (
+    _array_cache_key,
+    _get_chunk_cache,
+    _invalidate_chunks,
+    _read_cached,
+)
 from zarr.core.chunk_grids import RegularChunkGrid, _auto_partition, normalize_chunks
 from zarr.core.chunk_key_encodings import (
     ChunkKeyEncoding,
@@ -45,6 +51,17 @@ from zarr.core.chunk_key_encodings import (
     DefaultChunkKeyEncoding,
     V2ChunkKeyEncoding,
 )
+from zarr.core.chunk_manifest import (
+    ChunkManifest,
+    add_chunks,
+    chunk_byte_setter,
+    create_chunk_manifest,
+    discard_chunks,
+    forget_chunk_manifest,
+    has_chunk_manifest,
+    load_chunk_manifest,
+    resize_chunk_manifest,
+)
 from zarr.core.common import (
     JSON,
     ZARR_JSON,
@@ -116,12 +133,15 @@ from zarr.storage import StoreLike
 from zarr.storage._common import StorePath, ensure_no_existing_node, make_store_path
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator, Sequence
+    from collections.abc import Callable, Iterator, Sequence
     from typing import Self
 
     from zarr.abc.codec import CodecPipeline
+    from zarr.abc.store import ByteSetter
     from zarr.codecs.sharding import ShardingCodecIndexLocation
+    from zarr.core.array_spec import ArraySpec
     from zarr.core.group import AsyncGroup
+    from zarr.core.indexing import ChunkBatchProjection, SelectorTuple
     from zarr.storage import StoreLike
 
 
@@ -725,6 +745,9 @@ class AsyncArray(Generic[T_ArrayMetadata]):
 
         array = cls(metadata=metadata, store_path=store_path, config=config)
         await array._save_metadata(metadata, ensure_parents=True)
+        # chunks cached for an array that was stored at the same path are stale
+        _invalidate_chunks(store_path.store, array.path)
+        await array._create_chunk_manifest()
         return array
 
     @classmethod
@@ -778,6 +801,9 @@ class AsyncArray(Generic[T_ArrayMetadata]):
         )
         array = cls(metadata=metadata, store_path=store_path, config=config)
         await array._save_metadata(metadata, ensure_parents=True)
+        # chunks cached for an array that was stored at the same path are stale
+        _invalidate_chunks(store_path.store, array.path)
+        await array._create_chunk_manifest()
         return array
 
     @classmethod
@@ -1100,6 +1126,10 @@ class AsyncArray(Generic[T_ArrayMetadata]):
         >>> await arr.nchunks_initialized()
         3
         """
+        if self._config.chunk_manifest:
+            manifest = await load_chunk_manifest(self.store_path, self.cdata_shape)
+            if manifest is not None:
+                return manifest.count()
         return len(await chunks_initialized(self))
 
     async def nbytes_stored(self) -> int:
@@ -1197,6 +1227,118 @@ class AsyncArray(Generic[T_ArrayMetadata]):
         """
         return self.size * self.dtype.itemsize
 
+    async def _create_chunk_manifest(self) -> None:
+        """Create the chunk manifest of a new array, if its configuration enables it."""
+        if self._config.chunk_manifest:
+            await create_chunk_manifest(self.store_path, self.cdata_shape)
+        else:
+            forget_chunk_manifest(self.store_path)
+
+    def _chunk_byte_setter_factory(
+        self, manifest: ChunkManifest | None, deleted: list[ChunkCoords] | None
+    ) -> Callable[[ChunkCoords, str], ByteSetter]:
+        """Return a function that creates the byte setter of a chunk from its indices and
+        key, which goes through the chunk ``manifest`` if there is one."""
+        store = self.store_path.store
+        prefix = self.store_path.path.rstrip("/")
+        prefix = prefix + "/" if prefix else ""
+        if manifest is None:
+            return lambda chunk_coords, chunk_key: StorePath(store, prefix + chunk_key)
+        deleted_ = [] if deleted is None else deleted
+        return lambda chunk_coords, chunk_key: chunk_byte_setter(
+            store, prefix + chunk_key, chunk_coords, manifest, deleted_
+        )
+
+    def _iter_chunks(
+        self,
+        indexer: Indexer,
+        prototype: BufferPrototype,
+        manifest: ChunkManifest | None = None,
+        deleted: list[ChunkCoords] | None = None,
+    ) -> Iterator[tuple[str, ByteSetter, ArraySpec, SelectorTuple, SelectorTuple]]:
+        """
+        Yield the key, byte setter, spec, chunk selection and output selection of each chunk
+        touched by the selection of ``indexer``, as they are consumed.
+
+        For basic and orthogonal selections, the chunks come from the projection plan of
+        the indexer: their keys are encoded in bulk, and their spec, which all chunks of a
+        regular chunk grid share, is created once.
+
+        With a chunk ``manifest``, the chunks that it lists as absent are not read from the
+        store, and the indices of the chunks that are deleted are appended to ``deleted``.
+        """
+        byte_setter = self._chunk_byte_setter_factory(manifest, deleted)
+        if isinstance(indexer, BasicIndexer | OrthogonalIndexer):
+            plan = indexer.plan()
+            if len(plan) == 0:
+                return
+            chunk_spec = self.metadata.get_chunk_spec(
+                tuple(int(dim_chunk_ixs[0]) for dim_chunk_ixs in plan.dim_chunk_ixs),
+                self._config,
+                prototype=prototype,
+            )
+            chunk_keys = self.metadata.encode_chunk_keys(plan.dim_chunk_ixs)
+            for chunk_key, (chunk_coords, chunk_selection, out_selection) in zip(
+                chunk_keys, plan, strict=True
+            ):
+                yield (
+                    chunk_key,
+                    byte_setter(chunk_coords, chunk_key),
+                    chunk_spec,
+                    chunk_selection,
+                    out_selection,
+                )
+        else:
+            for chunk_coords, chunk_selection, out_selection in indexer:
+                chunk_key = self.metadata.encode_chunk_key(chunk_coords)
+                yield (
+                    chunk_key,
+                    byte_setter(chunk_coords, chunk_key),
+                    self.metadata.get_chunk_spec(chunk_coords, self._config, prototype=prototype),
+                    chunk_selection,
+                    out_selection,
+                )
+
+    def _iter_chunk_batches(
+        self,
+        indexer: CoordinateIndexer,
+        prototype: BufferPrototype,
+        manifest: ChunkManifest | None = None,
+        deleted: list[ChunkCoords] | None = None,
+    ) -> Iterator[tuple[list[str], list[ByteSetter], list[ArraySpec], ChunkBatchProjection]]:
+        """
+        Yield the keys, byte setters and specs of runs of chunks touched by the coordinate or
+        mask selection of ``indexer``, with the projection of each run.
+
+        The runs hold as many chunks as fit in ``codec_pipeline.coordinate_batch_nbytes``
+        bytes once decoded, and at least one chunk. ``manifest`` and ``deleted`` are used as
+        in :meth:`_iter_chunks`.
+        """
+        byte_setter = self._chunk_byte_setter_factory(manifest, deleted)
+        chunk_nbytes = product(indexer.chunk_shape) * self.dtype.itemsize
+        max_chunks = max(
+            1, zarr_config.get("codec_pipeline.coordinate_batch_nbytes") // max(1, chunk_nbytes)
+        )
+        chunk_spec: ArraySpec | None = None
+        for batch in indexer.batches(max_chunks):
+            if chunk_spec is None:
+                # all chunks of a regular chunk grid share their spec
+                chunk_spec = self.metadata.get_chunk_spec(
+                    batch.chunk_coords[0], self._config, prototype=prototype
+                )
+            chunk_keys = [
+                self.metadata.encode_chunk_key(chunk_coords) for chunk_coords in batch.chunk_coords
+            ]
+            yield (
+                chunk_keys,
+                [
+                    byte_setter(chunk_coords, chunk_key)
+                    for chunk_coords, chunk_key in zip(batch.chunk_coords, chunk_keys, strict=True)
+                ],
+                [chunk_spec] * len(chunk_keys),
+                batch,
+            )
+
     async def _get_selection(
         self,
         indexer: Indexer,
@@ -1226,19 +1368,46 @@ class AsyncArray(Generic[T_ArrayMetadata]):
                 fill_value=self.metadata.fill_value,
             )
         if product(indexer.shape) > 0:
+            manifest = None
+            if self._config.chunk_manifest:
+                manifest = await load_chunk_manifest(
+                    self.store_path, self.cdata_shape, indexer
+                )
+            chunk_cache = _get_chunk_cache()
+            if chunk_cache is not None and not self.codec_pipeline.supports_partial_decode:
+                # partial decoders (e.g. sharding) only read the parts of a chunk that
+                # are needed, so they bypass the cache of whole decoded chunks
+                await _read_cached(
+                    chunk_cache,
+                    _array_cache_key(
+                        self.store_path.store, self.path, self.metadata, prototype.nd_buffer
+                    ),
+                    self.codec_pipeline,
+                    self._iter_chunks(indexer, prototype, manifest),
+                    out_buffer,
+                    drop_axes=indexer.drop_axes,
+                )
+                return out_buffer.as_ndarray_like()
+            if isinstance(indexer, CoordinateIndexer):
+                # the items of many chunks are gathered at once
+                await self.codec_pipeline.read_batches(
+                    (
+                        (byte_getters, chunk_specs, batch)
+                        for _, byte_getters, chunk_specs, batch in self._iter_chunk_batches(
+                            indexer, prototype, manifest
+                        )
+                    ),
+                    out_buffer,
+                )
+                return out_buffer.as_ndarray_like()
             # reading chunks and decoding them
             await self.codec_pipeline.read(
-                [
-                    (
-                        self.store_path / self.metadata.encode_chunk_key(chunk_coords),
-                        self.metadata.get_chunk_spec(
-                            chunk_coords, self._config, prototype=prototype
-                        ),
-                        chunk_selection,
-                        out_selection,
+                (
+                    (byte_getter, chunk_spec, chunk_selection, out_selection)
+                    for _, byte_getter, chunk_spec, chunk_selection, out_selection in (
+                        self._iter_chunks(indexer, prototype, manifest)
                     )
-                    for chunk_coords, chunk_selection, out_selection in indexer
-                ],
+                ),
                 out_buffer,
                 drop_axes=indexer.drop_axes,
             )
@@ -1350,20 +1519,56 @@ class AsyncArray(Generic[T_ArrayMetadata]):
         # Buffer and NDBuffer between components.
         value_buffer = prototype.nd_buffer.from_ndarray_like(value)
 
-        # merging with existing data and encoding chunks
-        await self.codec_pipeline.write(
-            [
-                (
-                    self.store_path / self.metadata.encode_chunk_key(chunk_coords),
-                    self.metadata.get_chunk_spec(chunk_coords, self._config, prototype),
-                    chunk_selection,
-                    out_selection,
+        # the chunks are added to the manifest before they are written, and the chunks that
+        # are deleted by the write are removed from it afterwards. Arrays without the option
+        # update the manifest as well, so that arrays with the option do not miss chunks.
+        manifest = None
+        deleted: list[ChunkCoords] = []
+        if self._config.chunk_manifest or await has_chunk_manifest(self.store_path):
+            manifest = await add_chunks(self.store_path, self.metadata, self.cdata_shape, indexer)
+
+        # the chunks are planned while they are written, so only the chunks that the
+        # pipeline has taken on can have been modified
+        chunk_keys: list[str] = []
+
+        def _iter_write_chunks() -> (
+            Iterator[tuple[ByteSetter, ArraySpec, SelectorTuple, SelectorTuple]]
+        ):
+            for (
+                chunk_key,
+                byte_setter,
+                chunk_spec,
+                chunk_selection,
+                out_selection,
+            ) in self._iter_chunks(indexer, prototype, manifest, deleted):
+                chunk_keys.append(chunk_key)
+                yield byte_setter, chunk_spec, chunk_selection, out_selection
+
+        def _iter_write_chunk_batches(
+            indexer: CoordinateIndexer,
+        ) -> Iterator[tuple[list[ByteSetter], list[ArraySpec], ChunkBatchProjection]]:
+            for batch_chunk_keys, byte_setters, chunk_specs, batch in self._iter_chunk_batches(
+                indexer, prototype, manifest, deleted
+            ):
+                chunk_keys.extend(batch_chunk_keys)
+                yield byte_setters, chunk_specs, batch
+
+        try:
+            # merging with existing data and encoding chunks
+            if isinstance(indexer, CoordinateIndexer):
+                await self.codec_pipeline.write_batches(
+                    _iter_write_chunk_batches(indexer), value_buffer
                 )
-                for chunk_coords, chunk_selection, out_selection in indexer
-            ],
-            value_buffer,
-            drop_axes=indexer.drop_axes,
-        )
+            else:
+                await self.codec_pipeline.write(
+                    _iter_write_chunks(),
+                    value_buffer,
+                    drop_axes=indexer.drop_axes,
+                )
+        finally:
+            _invalidate_chunks(self.store_path.store, self.path, chunk_keys)
+            if manifest is not None and deleted:
+                await discard_chunks(self.store_path, manifest, deleted)
 
     async def setitem(
         self,
@@ -1443,10 +1648,20 @@ class AsyncArray(Generic[T_ArrayMetadata]):
         new_shape = parse_shapelike(new_shape)
         assert len(new_shape) == len(self.metadata.shape)
         new_metadata = self.metadata.update_shape(new_shape)
+        old_chunk_grid_shape = self.cdata_shape
+        has_manifest = self._config.chunk_manifest or await has_chunk_manifest(self.store_path)
+        manifest = None
+        if has_manifest:
+            manifest = await load_chunk_manifest(self.store_path, old_chunk_grid_shape)
 
         if delete_outside_chunks:
-            # Remove all chunks outside of the new shape
-            old_chunk_coords = set(self.metadata.chunk_grid.all_chunk_coords(self.metadata.shape))
+            # Remove all chunks outside of the new shape, or only those that exist if the
+            # array has a chunk manifest
+            old_chunk_coords = (
+                set(self.metadata.chunk_grid.all_chunk_coords(self.metadata.shape))
+                if manifest is None
+                else set(manifest.chunk_coords())
+            )
             new_chunk_coords = set(self.metadata.chunk_grid.all_chunk_coords(new_shape))
 
             async def _delete_key(key: str) -> None:
@@ -1466,6 +1681,11 @@ class AsyncArray(Generic[T_ArrayMetadata]):
 
         # Update metadata (in place)
         object.__setattr__(self, "metadata", new_metadata)
+        _invalidate_chunks(self.store_path.store, self.path)
+        if has_manifest:
+            await resize_chunk_manifest(
+                self.store_path, old_chunk_grid_shape, self.cdata_shape, delete_outside_chunks
+            )
 
     async def append(self, data: npt.ArrayLike, axis: int = 0) -> ChunkCoords:
         """Append `data` to `axis`.
@@ -3662,9 +3882,19 @@ async def chunks_initialized(
     nchunks_initialized
 
     """
-    store_contents = [
-        x async for x in array.store_path.store.list_prefix(prefix=array.store_path.path)
-    ]
+    if array._config.chunk_manifest:
+        manifest = await load_chunk_manifest(array.store_path, array.cdata_shape)
+        if manifest is not None:
+            return tuple(
+                array.metadata.encode_chunk_key(chunk_coords)
+                for chunk_coords in manifest.chunk_coords()
+            )
+    # the listed keys are relative to the root of the store, the chunk keys to the array
+    prefix = array.store_path.path.rstrip("/")
+    prefix = prefix + "/" if prefix else ""
+    store_contents = {
+        key.removeprefix(prefix) async for key in array.store_path.store.list_prefix(prefix)
+    }
     return tuple(chunk_key for chunk_key in array._iter_chunk_keys() if chunk_key in store_contents)
 
 
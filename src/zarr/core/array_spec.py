@@ -30,6 +30,7 @@ class ArrayConfigLike(TypedDict):
 
     order: NotRequired[MemoryOrder]
     write_empty_chunks: NotRequired[bool]
+    chunk_manifest: NotRequired[bool]
 
 
 @dataclass(frozen=True)
@@ -43,17 +44,25 @@ class ArrayConfig:
         The memory layout of the arrays returned when reading data from the store.
     write_empty_chunks : bool
         If True, empty chunks will be written to the store.
+    chunk_manifest : bool
+        If True, a manifest of the chunks that exist in the store is kept next to the
+        metadata of the array, and chunks that are absent from it are not requested.
     """
 
     order: MemoryOrder
     write_empty_chunks: bool
+    chunk_manifest: bool
 
-    def __init__(self, order: MemoryOrder, write_empty_chunks: bool) -> None:
+    def __init__(
+        self, order: MemoryOrder, write_empty_chunks: bool, chunk_manifest: bool = False
+    ) -> None:
         order_parsed = parse_order(order)
         write_empty_chunks_parsed = parse_bool(write_empty_chunks)
+        chunk_manifest_parsed = parse_bool(chunk_manifest)
 
         object.__setattr__(self, "order", order_parsed)
         object.__setattr__(self, "write_empty_chunks", write_empty_chunks_parsed)
+        object.__setattr__(self, "chunk_manifest", chunk_manifest_parsed)
 
     @classmethod
     def from_dict(cls, data: ArrayConfigLike) -> Self:
@@ -64,7 +73,7 @@ class ArrayConfig:
         """
         kwargs_out: ArrayConfigLike = {}
         for f in fields(ArrayConfig):
-            field_name = cast(Literal["order", "write_empty_chunks"], f.name)
+            field_name = cast(Literal["order", "write_empty_chunks", "chunk_manifest"], f.name)
             if field_name not in data:
                 kwargs_out[field_name] = zarr_config.get(f"array.{field_name}")
             else:
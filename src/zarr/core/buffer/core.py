@@ -265,6 +265,19 @@ class Buffer(ABC):
         """
         return bytes(self.as_numpy_array())
 
+    def as_buffer_like(self) -> memoryview:
+        """Returns the buffer as a `memoryview` of bytes (host memory).
+
+        Unlike `.to_bytes()`, this does not copy data that is already in contiguous host
+        memory. Use it to hand buffers to functions that accept any object supporting
+        the buffer protocol, such as file writes.
+
+        Returns
+        -------
+            `memoryview` of this buffer (might be a data copy)
+        """
+        return np.ascontiguousarray(self.as_numpy_array()).data.cast("B")
+
     def __getitem__(self, key: slice) -> Self:
         check_item_key_is_1d_contiguous(key)
         return self.__class__(self._data.__getitem__(key))
@@ -0,0 +1,223 @@
+"""
+A pool of host memory for the temporary chunk arrays of the codec pipeline, shared by all
+arrays of the process.
+
+Reads decode chunks into temporary arrays before copying the selected items into the
+output array, and writes merge the written items into temporary arrays before encoding
+them. Under a steady load of chunks of the same size, the pool hands out the memory of
+the arrays that were released instead of allocating new memory for every chunk, which
+avoids mapping and faulting in fresh pages.
+
+The pool is enabled by setting ``array.buffer_pool_size`` to the number of bytes of
+released memory to keep for reuse.
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from zarr.core._lru import CacheInfo
+from zarr.core.buffer import cpu
+from zarr.core.common import product
+from zarr.core.config import config
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import numpy.typing as npt
+
+    from zarr.core.buffer import BufferPrototype, NDArrayLike, NDBuffer
+    from zarr.core.common import MemoryOrder
+
+__all__ = ["buffer_pool_info", "clear_buffer_pool"]
+
+# smaller allocations are served by the allocator without mapping new pages
+_MIN_NBYTES = 2**16
+
+
+class BufferPool:
+    """
+    A thread-safe pool of host memory blocks, grouped in size classes of powers of two.
+
+    Blocks are handed out by :meth:`acquire`, and given back by :meth:`release` once their
+    memory is no longer used. Released blocks are kept for reuse as long as the pool
+    holds at most ``max_nbytes`` bytes.
+
+    Parameters
+    ----------
+    max_nbytes : int
+        The number of bytes of released blocks that are kept for reuse. A capacity of 0
+        disables the reuse of blocks.
+    """
+
+    max_nbytes: int
+
+    def __init__(self, max_nbytes: int) -> None:
+        if max_nbytes < 0:
+            raise ValueError(f"max_nbytes must be non-negative. Got {max_nbytes} instead.")
+        self.max_nbytes = max_nbytes
+        self._free: dict[int, list[npt.NDArray[np.uint8]]] = {}
+        # blocks that were handed out, so that only they are taken back
+        self._leased: weakref.WeakValueDictionary[int, npt.NDArray[np.uint8]] = (
+            weakref.WeakValueDictionary()
+        )
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def acquire(self, nbytes: int) -> npt.NDArray[np.uint8]:
+        """
+        Return an uninitialized array of ``nbytes`` bytes.
+
+        Arrays of less than 64 KiB are allocated directly and are not pooled.
+
+        Parameters
+        ----------
+        nbytes : int
+            The size of the array, in bytes.
+
+        Returns
+        -------
+        numpy.ndarray
+            A contiguous array of bytes.
+        """
+        if nbytes < _MIN_NBYTES:
+            return np.empty(nbytes, dtype=np.uint8)
+        size_class = 1 << (nbytes - 1).bit_length()
+        with self._lock:
+            blocks = self._free.get(size_class)
+            if blocks:
+                block = blocks.pop()
+                self._nbytes -= size_class
+                self._hits += 1
+            else:
+                block = None
+                self._misses += 1
+        if block is None:
+            block = np.empty(size_class, dtype=np.uint8)
+        with self._lock:
+            self._leased[id(block)] = block
+        return block[:nbytes]
+
+    def release(self, array: NDArrayLike | npt.NDArray[Any]) -> None:
+        """
+        Give back the memory of an array returned by :meth:`acquire`, or of a view of it.
+
+        The memory must not be used after it was released. Arrays that do not come from
+        the pool are ignored.
+
+        Parameters
+        ----------
+        array : NDArrayLike
+            The array to release.
+        """
+        if not isinstance(array, np.ndarray):
+            return
+        block = array if array.base is None else array.base
+        with self._lock:
+            if self._leased.get(id(block)) is not block:
+                return
+            del self._leased[id(block)]
+            if self._nbytes + block.nbytes > self.max_nbytes:
+                self._evictions += 1
+                return
+            self._free.setdefault(block.nbytes, []).append(block)
+            self._nbytes += block.nbytes
+
+    def resize(self, max_nbytes: int) -> None:
+        """Change the capacity of the pool, dropping released blocks to fit in it."""
+        if max_nbytes < 0:
+            raise ValueError(f"max_nbytes must be non-negative. Got {max_nbytes} instead.")
+        with self._lock:
+            self.max_nbytes = max_nbytes
+            self._trim()
+
+    def clear(self) -> None:
+        """Drop all released blocks and reset the statistics."""
+        with self._lock:
+            self._free.clear()
+            self._nbytes = 0
+            self._hits = self._misses = self._evictions = 0
+
+    def info(self) -> CacheInfo:
+        """
+        Return the statistics of the pool.
+
+        ``hits`` and ``misses`` count the blocks that were reused and allocated,
+        ``evictions`` the released blocks that were dropped because the pool was full, and
+        ``size`` and ``nbytes`` the blocks that are kept for reuse.
+        """
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=sum(len(blocks) for blocks in self._free.values()),
+                nbytes=self._nbytes,
+                max_nbytes=self.max_nbytes,
+            )
+
+    def _trim(self) -> None:
+        # drop the largest blocks first
+        for size_class in sorted(self._free, reverse=True):
+            blocks = self._free[size_class]
+            while blocks and self._nbytes > self.max_nbytes:
+                blocks.pop()
+                self._nbytes -= size_class
+                self._evictions += 1
+
+
+_buffer_pool = BufferPool(0)
+
+
+def _get_buffer_pool() -> BufferPool | None:
+    max_nbytes = config.get("array.buffer_pool_size", 0)
+    if max_nbytes != _buffer_pool.max_nbytes:
+        _buffer_pool.resize(max_nbytes)
+    return _buffer_pool if max_nbytes > 0 else None
+
+
+def acquire_array(
+    pool: BufferPool,
+    prototype: BufferPrototype,
+    shape: Iterable[int],
+    dtype: np.dtype[Any],
+    order: MemoryOrder = "C",
+) -> NDBuffer | None:
+    """
+    Return an uninitialized array backed by memory from ``pool``, or None if arrays of
+    ``prototype`` are not in host memory or if ``dtype`` holds Python objects.
+    """
+    if not issubclass(prototype.nd_buffer, cpu.NDBuffer) or dtype.hasobject:
+        return None
+    shape = tuple(shape)
+    nbytes = product(shape) * dtype.itemsize
+    if nbytes == 0:
+        return None
+    array = pool.acquire(nbytes).view(dtype).reshape(shape, order=order)
+    return prototype.nd_buffer.from_numpy_array(array)
+
+
+def buffer_pool_info() -> CacheInfo:
+    """
+    Return the statistics of the buffer pool shared by all arrays of the process.
+
+    The pool is enabled by setting ``array.buffer_pool_size`` to the number of bytes of
+    released memory to keep for reuse.
+
+    Returns
+    -------
+    CacheInfo
+    """
+    return _buffer_pool.info()
+
+
+def clear_buffer_pool() -> None:
+    """Drop the memory kept for reuse by the buffer pool, and reset its statistics."""
+    _buffer_pool.clear()
@@ -0,0 +1,150 @@
+"""
+An in-memory cache of decoded chunks, shared by all arrays of the process.
+
+The cache is enabled by setting ``array.chunk_cache_size`` to the number of bytes of
+decoded chunks to keep in memory.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from zarr.core._lru import CacheInfo, LRUCache, StoreToken, store_token
+from zarr.core.codec_pipeline import scatter_chunk_array
+from zarr.core.common import concurrent_map, product
+from zarr.core.config import config
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from zarr.abc.codec import CodecPipeline
+    from zarr.abc.store import ByteGetter, Store
+    from zarr.core.array_spec import ArraySpec
+    from zarr.core.buffer import NDBuffer
+    from zarr.core.indexing import SelectorTuple
+    from zarr.core.metadata import ArrayMetadata
+
+__all__ = ["chunk_cache_info", "clear_chunk_cache"]
+
+# (store token, path of the array, metadata token, NDBuffer class)
+_ArrayCacheKey = tuple[StoreToken, str, str, type]
+# an array cache key, followed by the chunk key
+_ChunkCacheKey = tuple[StoreToken, str, str, type, str]
+
+_chunk_cache: LRUCache[_ChunkCacheKey, NDBuffer] = LRUCache(
+    0,
+    sizeof=lambda chunk_array: product(chunk_array.shape) * chunk_array.dtype.itemsize,
+    # the chunks are looked up by store, by array and by chunk key, for invalidation
+    groups=lambda key: ((key[0],), key[:2], (key[0], key[1], key[4])),
+)
+
+
+def _get_chunk_cache() -> LRUCache[_ChunkCacheKey, NDBuffer] | None:
+    max_nbytes = config.get("array.chunk_cache_size", 0)
+    if max_nbytes != _chunk_cache.max_nbytes:
+        _chunk_cache.resize(max_nbytes)
+    return _chunk_cache if max_nbytes > 0 else None
+
+
+def _metadata_token(metadata: ArrayMetadata) -> str:
+    # attributes do not affect how chunks are decoded
+    metadata_dict = metadata.to_dict()
+    metadata_dict.pop("attributes", None)
+    metadata_json = json.dumps(metadata_dict, default=str, sort_keys=True)
+    return hashlib.sha1(metadata_json.encode(), usedforsecurity=False).hexdigest()
+
+
+def _array_cache_key(
+    store: Store, path: str, metadata: ArrayMetadata, nd_buffer: type[NDBuffer]
+) -> _ArrayCacheKey:
+    return (_chunk_cache.track_store(store), path, _metadata_token(metadata), nd_buffer)
+
+
+def _invalidate_chunks(store: Store, path: str, chunk_keys: Iterable[str] | None = None) -> None:
+    """Remove the chunks of the array at ``path`` from the cache, or only the chunks with
+    the given keys."""
+    token = store_token(store)
+    if chunk_keys is None:
+        _chunk_cache.pop_group((token, path))
+    else:
+        for chunk_key in chunk_keys:
+            _chunk_cache.pop_group((token, path, chunk_key))
+
+
+def _invalidate_chunks_in_dir(store: Store, path: str) -> None:
+    """Remove the chunks of all arrays in the directory ``path`` from the cache."""
+    path = path.rstrip("/")
+    _chunk_cache.pop_matching(
+        lambda key: not path or key[1] == path or key[1].startswith(path + "/"),
+        group=(store_token(store),),
+    )
+
+
+async def _read_cached(
+    cache: LRUCache[_ChunkCacheKey, NDBuffer],
+    array_cache_key: _ArrayCacheKey,
+    codec_pipeline: CodecPipeline,
+    batch_info: Iterable[tuple[str, ByteGetter, ArraySpec, SelectorTuple, SelectorTuple]],
+    out: NDBuffer,
+    drop_axes: tuple[int, ...] = (),
+) -> None:
+    """Read chunks into ``out`` like ``CodecPipeline.read``, taking decoded chunks from
+    the cache and adding the chunks that had to be decoded to it."""
+    generation = cache.generation
+    misses = []
+    for chunk_key, byte_getter, chunk_spec, chunk_selection, out_selection in batch_info:
+        chunk_array = cache.get((*array_cache_key, chunk_key))
+        if chunk_array is None:
+            misses.append((chunk_key, byte_getter, chunk_spec, chunk_selection, out_selection))
+        else:
+            scatter_chunk_array(
+                chunk_array, out, chunk_spec, chunk_selection, out_selection, drop_axes
+            )
+
+    async def _read_chunk(
+        chunk_key: str,
+        byte_getter: ByteGetter,
+        chunk_spec: ArraySpec,
+        chunk_selection: SelectorTuple,
+        out_selection: SelectorTuple,
+    ) -> None:
+        chunk_bytes = await byte_getter.get(prototype=chunk_spec.prototype)
+        (chunk_array,) = await codec_pipeline.decode([(chunk_bytes, chunk_spec)])
+        if chunk_array is not None and generation == cache.generation:
+            ndarray: Any = chunk_array.as_ndarray_like()
+            if isinstance(ndarray, np.ndarray):
+                # cached chunks are shared, so they must not be modified in place
+                ndarray.flags.writeable = False
+            cache.set((*array_cache_key, chunk_key), chunk_array, generation)
+        scatter_chunk_array(chunk_array, out, chunk_spec, chunk_selection, out_selection, drop_axes)
+
+    await concurrent_map(misses, _read_chunk, config.get("async.concurrency"))
+
+
+def chunk_cache_info() -> CacheInfo:
+    """
+    Return the statistics of the decoded chunk cache.
+
+    The cache is enabled by setting ``array.chunk_cache_size`` to the number of bytes of
+    decoded chunks to keep in memory.
+
+    Returns
+    -------
+    CacheInfo
+    """
+    return _chunk_cache.info()
+
+
+def clear_chunk_cache() -> None:
+    """
+    Remove all entries from the decoded chunk cache and reset its statistics.
+
+    The cache is only invalidated by writes, resizes, creation and deletion of arrays
+    through Zarr in this process. Call this function after chunks were modified by
+    other means.
+    """
+    _chunk_cache.clear()
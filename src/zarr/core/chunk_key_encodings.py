@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import itertools
 from abc import abstractmethod
 from dataclasses import dataclass
-from typing import Literal, TypedDict, cast
+from typing import TYPE_CHECKING, Literal, TypedDict, cast
 
 from zarr.abc.metadata import Metadata
 from zarr.core.common import (
@@ -11,6 +12,9 @@ from zarr.core.common import (
     parse_named_configuration,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
 SeparatorLiteral = Literal[".", "/"]
 
 
@@ -72,6 +76,11 @@ class ChunkKeyEncoding(Metadata):
     def encode_chunk_key(self, chunk_coords: ChunkCoords) -> str:
         pass
 
+    def encode_chunk_keys(self, dim_chunk_ixs: Sequence[Iterable[int]]) -> Iterator[str]:
+        """Encode the keys of all chunks in the Cartesian product of the chunk indices of
+        each dimension, in C order."""
+        return map(self.encode_chunk_key, itertools.product(*dim_chunk_ixs))
+
 
 @dataclass(frozen=True)
 class DefaultChunkKeyEncoding(ChunkKeyEncoding):
@@ -85,6 +94,11 @@ class DefaultChunkKeyEncoding(ChunkKeyEncoding):
     def encode_chunk_key(self, chunk_coords: ChunkCoords) -> str:
         return self.separator.join(map(str, ("c",) + chunk_coords))
 
+    def encode_chunk_keys(self, dim_chunk_ixs: Sequence[Iterable[int]]) -> Iterator[str]:
+        # the keys are joined from the encoded indices of each dimension
+        dim_parts = [[self.separator + str(ix) for ix in ixs] for ixs in dim_chunk_ixs]
+        return map("".join, itertools.product(["c"], *dim_parts))
+
 
 @dataclass(frozen=True)
 class V2ChunkKeyEncoding(ChunkKeyEncoding):
@@ -96,3 +110,11 @@ class V2ChunkKeyEncoding(ChunkKeyEncoding):
     def encode_chunk_key(self, chunk_coords: ChunkCoords) -> str:
         chunk_identifier = self.separator.join(map(str, chunk_coords))
         return "0" if chunk_identifier == "" else chunk_identifier
+
+    def encode_chunk_keys(self, dim_chunk_ixs: Sequence[Iterable[int]]) -> Iterator[str]:
+        # the keys are joined from the encoded indices of each dimension
+        if len(dim_chunk_ixs) == 0:
+            return iter(["0"])
+        dim_parts = [[str(ix) for ix in dim_chunk_ixs[0]]]
+        dim_parts += [[self.separator + str(ix) for ix in ixs] for ixs in dim_chunk_ixs[1:]]
+        return map("".join, itertools.product(*dim_parts))
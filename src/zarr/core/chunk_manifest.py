@@ -0,0 +1,485 @@
+"""
+Manifests of the chunks of arrays that exist in the store.
+
+When the ``chunk_manifest`` option of the configuration of an array is enabled, a bitmap
+of the chunks of the array that exist in the store is kept next to the metadata of the
+array, in the directory ``.zchunks``. Reads do not request the chunks that the manifest
+lists as absent, and counting the initialized chunks does not list the store. The
+manifest is created with the array, or by the first write to an existing array, and
+updated by writes and resizes, including those of arrays that do not enable the option.
+
+The manifest is stored as immutable segments, so that processes writing the same array
+never modify a shared object. A write stores the chunks that it adds in a new segment
+before writing them, and the chunks that it deletes in a segment that names the segments
+it removes them from. Segments are merged when they become numerous: the merged segment
+is written before the merged ones are deleted, and only segments that were read are
+deleted. Segments are never modified, so each process only reads a segment once, and
+loading a manifest that it has read before takes one request, which lists the segments.
+
+The manifest may list chunks that do not exist, which only costs a request, but never
+omits chunks that exist. Manifests that cannot be trusted, because one of their segments
+is unreadable, was deleted by a concurrent merge, or does not match the chunk grid of the
+array, are treated as absent: reads request every chunk, and the next write rebuilds the
+manifest by listing the chunks of the array. As for arrays without a manifest, writes to
+the same chunk must not overlap.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import uuid
+import weakref
+import zlib
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from zarr.core.buffer import default_buffer_prototype
+from zarr.core.common import concurrent_map, product
+from zarr.core.config import config
+from zarr.core.indexing import BasicIndexer, BlockIndexer, CoordinateIndexer, OrthogonalIndexer
+from zarr.storage._common import StorePath
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    import numpy.typing as npt
+
+    from zarr.abc.store import ByteRequest, ByteSetter, Store
+    from zarr.core.buffer import Buffer, BufferPrototype
+    from zarr.core.common import ChunkCoords
+    from zarr.core.indexing import Indexer
+    from zarr.core.metadata import ArrayMetadata
+
+# the directory of the segments of the manifest of an array, relative to the array
+_MANIFEST_DIR = ".zchunks"
+# the number of segments from which a write merges the segments of the manifest
+_MAX_SEGMENTS = 16
+
+
+@dataclass(frozen=True)
+class ChunkManifest:
+    """
+    A bitmap of the chunks of an array that exist in the store.
+
+    Attributes
+    ----------
+    bitmap : numpy.ndarray
+        Boolean array with the shape of the chunk grid, which is True for the chunks that
+        exist.
+    segments : tuple of str
+        Names of the segments of the stored manifest that the bitmap was read from.
+    """
+
+    bitmap: npt.NDArray[np.bool_]
+    segments: tuple[str, ...] = ()
+
+    def __contains__(self, chunk_coords: ChunkCoords) -> bool:
+        return bool(self.bitmap[chunk_coords])
+
+    def count(self) -> int:
+        """Return the number of chunks that exist."""
+        return int(np.count_nonzero(self.bitmap))
+
+    def chunk_coords(self) -> Iterator[ChunkCoords]:
+        """Iterate over the indices of the chunks that exist, in C order."""
+        return (tuple(chunk_coords) for chunk_coords in np.argwhere(self.bitmap).tolist())
+
+
+@dataclass(frozen=True)
+class _ManifestSegment:
+    """
+    A segment of a stored chunk manifest.
+
+    Attributes
+    ----------
+    bitmap : numpy.ndarray
+        Boolean array with the shape of the chunk grid, which is True for the chunks that
+        the segment adds to the manifest, or removes from it.
+    supersedes : tuple of str, optional
+        For segments that remove chunks, the names of the segments that the chunks are
+        removed from. Chunks added by other segments are kept.
+    """
+
+    bitmap: npt.NDArray[np.bool_]
+    supersedes: tuple[str, ...] | None = None
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> _ManifestSegment:
+        """
+        Decode a segment.
+
+        Raises
+        ------
+        ValueError
+            If ``data`` is not a valid segment.
+        """
+        try:
+            segment = json.loads(data)
+            chunk_grid_shape = tuple(segment["chunk_grid_shape"])
+            packed = np.frombuffer(
+                zlib.decompress(base64.b64decode(segment["chunks"])), dtype=np.uint8
+            )
+            supersedes = segment.get("supersedes")
+            if supersedes is not None:
+                supersedes = tuple(str(name) for name in supersedes)
+            if packed.size != -(-product(chunk_grid_shape) // 8):
+                raise ValueError("The bitmap does not match the chunk grid.")
+        except (KeyError, TypeError, ValueError, zlib.error) as e:
+            raise ValueError(f"Invalid chunk manifest segment: {e}") from e
+        bitmap = np.unpackbits(packed, count=product(chunk_grid_shape)).astype(bool)
+        return cls(bitmap.reshape(chunk_grid_shape), supersedes)
+
+    def to_bytes(self) -> bytes:
+        packed = np.packbits(self.bitmap, axis=None)
+        segment: dict[str, object] = {
+            "chunk_grid_shape": list(self.bitmap.shape),
+            "chunks": base64.b64encode(zlib.compress(packed.tobytes())).decode("ascii"),
+        }
+        if self.supersedes is not None:
+            segment["supersedes"] = list(self.supersedes)
+        return json.dumps(segment).encode()
+
+
+def _merge_segments(
+    segments: dict[str, _ManifestSegment], chunk_grid_shape: ChunkCoords
+) -> npt.NDArray[np.bool_]:
+    """Return the bitmap of the chunks that the ``segments`` of a manifest list, by name."""
+    removals = [segment for segment in segments.values() if segment.supersedes is not None]
+    bitmap = np.zeros(chunk_grid_shape, dtype=bool)
+    for name, segment in segments.items():
+        if segment.supersedes is None:
+            added = segment.bitmap
+            for removal in removals:
+                assert removal.supersedes is not None
+                if name in removal.supersedes:
+                    added = added & ~removal.bitmap
+            bitmap |= added
+    return bitmap
+
+
+# whether the arrays of this process have a manifest, by store and path
+_has_manifest: dict[tuple[int, str], bool] = {}
+
+
+def _remember_manifest(store_path: StorePath, exists: bool) -> None:
+    key = (id(store_path.store), store_path.path)
+    if key not in _has_manifest:
+        weakref.finalize(store_path.store, _has_manifest.pop, key, None)
+    _has_manifest[key] = exists
+
+
+async def has_chunk_manifest(store_path: StorePath) -> bool:
+    """
+    Return whether the array at ``store_path`` has a manifest, which its writes must update
+    even if they do not enable the option.
+
+    The answer is remembered for the lifetime of the store, so manifests created by other
+    processes after the first write of this process to the array are not updated by it.
+    """
+    exists = _has_manifest.get((id(store_path.store), store_path.path))
+    if exists is None:
+        exists = bool(await _list_segments(store_path))
+        _remember_manifest(store_path, exists)
+    return exists
+
+
+# the segments of the manifests that this process read or wrote, by store and path, and
+# then by name
+_segment_cache: dict[tuple[int, str], dict[str, _ManifestSegment]] = {}
+
+
+def _cache_segments(store_path: StorePath, segments: dict[str, _ManifestSegment]) -> None:
+    key = (id(store_path.store), store_path.path)
+    if key not in _segment_cache:
+        weakref.finalize(store_path.store, _segment_cache.pop, key, None)
+    _segment_cache[key] = segments
+
+
+def _cached_segments(store_path: StorePath) -> dict[str, _ManifestSegment] | None:
+    return _segment_cache.get((id(store_path.store), store_path.path))
+
+
+async def _list_segments(store_path: StorePath) -> list[str]:
+    prefix = (store_path / _MANIFEST_DIR).path + "/"
+    return [key.removeprefix(prefix) async for key in store_path.store.list_prefix(prefix)]
+
+
+async def _read_segment(store_path: StorePath, name: str) -> _ManifestSegment | None:
+    """Read a segment, or return None if it was deleted or cannot be decoded."""
+    value = await (store_path / _MANIFEST_DIR / name).get(prototype=default_buffer_prototype())
+    if value is None:
+        return None
+    try:
+        return _ManifestSegment.from_bytes(value.to_bytes())
+    except ValueError:
+        return None
+
+
+async def _read_segments(
+    store_path: StorePath,
+) -> tuple[list[str], dict[str, _ManifestSegment | None]]:
+    """Return the names of the segments of the manifest of the array at ``store_path``, and
+    the segments by name, which are None if they cannot be read. Only the segments that
+    this process has not read yet are read from the store."""
+    names = await _list_segments(store_path)
+    cached = _cached_segments(store_path) or {}
+    missing = [name for name in names if name not in cached]
+    read = await concurrent_map(
+        [(store_path, name) for name in missing], _read_segment, config.get("async.concurrency")
+    )
+    segments = {name: cached.get(name) for name in names}
+    segments.update(zip(missing, read, strict=True))
+    # the segments that were deleted by merges are forgotten
+    _cache_segments(
+        store_path, {name: segment for name, segment in segments.items() if segment is not None}
+    )
+    return names, segments
+
+
+def _trusted(
+    segments: dict[str, _ManifestSegment | None], chunk_grid_shape: ChunkCoords
+) -> dict[str, _ManifestSegment] | None:
+    """Return the segments if they form a manifest that can be trusted, or None."""
+    trusted: dict[str, _ManifestSegment] = {}
+    for name, segment in segments.items():
+        if segment is None or segment.bitmap.shape != chunk_grid_shape:
+            return None
+        trusted[name] = segment
+    return trusted
+
+
+async def _write_segment(store_path: StorePath, segment: _ManifestSegment) -> str:
+    """Write a new segment of the manifest of the array at ``store_path``, and return its
+    name."""
+    name = uuid.uuid4().hex
+    value = default_buffer_prototype().buffer.from_bytes(segment.to_bytes())
+    await (store_path / _MANIFEST_DIR / name).set(value)
+    _remember_manifest(store_path, True)
+    _cache_segments(store_path, {**(_cached_segments(store_path) or {}), name: segment})
+    return name
+
+
+async def _delete_segments(store_path: StorePath, names: Iterable[str]) -> None:
+    await concurrent_map(
+        [(store_path / _MANIFEST_DIR / name,) for name in names],
+        StorePath.delete,
+        config.get("async.concurrency"),
+    )
+
+
+async def create_chunk_manifest(store_path: StorePath, chunk_grid_shape: ChunkCoords) -> None:
+    """Create the manifest of the new array at ``store_path``, which has no chunks."""
+    await _write_segment(store_path, _ManifestSegment(np.zeros(chunk_grid_shape, dtype=bool)))
+
+
+def forget_chunk_manifest(store_path: StorePath) -> None:
+    """Record that the new array at ``store_path`` has no manifest."""
+    _remember_manifest(store_path, False)
+
+
+def _count_touched_chunks(indexer: Indexer) -> int | None:
+    """Return the number of chunks touched by the selection of ``indexer``, or None if it
+    cannot be counted without iterating over the chunks."""
+    if isinstance(indexer, BasicIndexer | OrthogonalIndexer | BlockIndexer):
+        return len(indexer.plan())
+    if isinstance(indexer, CoordinateIndexer):
+        return len(indexer.chunk_rixs)
+    return None
+
+
+def _load_requests(store_path: StorePath) -> int:
+    """Return the number of requests that loading the manifest of the array at
+    ``store_path`` is expected to take: one to list the segments, and one to read them if
+    this process has not read them yet."""
+    return 1 if _cached_segments(store_path) is not None else 2
+
+
+async def load_chunk_manifest(
+    store_path: StorePath, chunk_grid_shape: ChunkCoords, indexer: Indexer | None = None
+) -> ChunkManifest | None:
+    """
+    Read the manifest of the array at ``store_path``.
+
+    Returns None if the array has no manifest, or if the manifest cannot be trusted. Given
+    the ``indexer`` of a read, also returns None without reading the manifest if loading it
+    takes at least as many requests as the selection touches chunks, which are then all
+    requested.
+    """
+    if indexer is not None:
+        touched = _count_touched_chunks(indexer)
+        if touched is not None and touched <= _load_requests(store_path):
+            return None
+    names, segments = await _read_segments(store_path)
+    if not names:
+        return None
+    trusted = _trusted(segments, chunk_grid_shape)
+    if trusted is None:
+        return None
+    return ChunkManifest(_merge_segments(trusted, chunk_grid_shape), tuple(names))
+
+
+async def _list_chunks(
+    store_path: StorePath, metadata: ArrayMetadata, chunk_grid_shape: ChunkCoords
+) -> npt.NDArray[np.bool_]:
+    """Return the bitmap of the chunks of the array at ``store_path`` that are listed in the
+    store."""
+    prefix = store_path.path.rstrip("/")
+    prefix = prefix + "/" if prefix else ""
+    stored_keys = {key.removeprefix(prefix) async for key in store_path.store.list_prefix(prefix)}
+    chunk_keys = metadata.encode_chunk_keys([range(n) for n in chunk_grid_shape])
+    bitmap = np.fromiter(
+        (chunk_key in stored_keys for chunk_key in chunk_keys),
+        dtype=bool,
+        count=product(chunk_grid_shape),
+    )
+    return bitmap.reshape(chunk_grid_shape)
+
+
+def _touched_chunks(indexer: Indexer, chunk_grid_shape: ChunkCoords) -> npt.NDArray[np.bool_]:
+    """Return the bitmap of the chunks touched by the selection of ``indexer``."""
+    touched = np.zeros(chunk_grid_shape, dtype=bool)
+    if isinstance(indexer, BasicIndexer | OrthogonalIndexer | BlockIndexer):
+        touched[np.ix_(*indexer.plan().dim_chunk_ixs)] = True
+    elif isinstance(indexer, CoordinateIndexer):
+        touched[indexer.chunk_mixs] = True
+    else:
+        for chunk_coords, _, _ in indexer:
+            touched[chunk_coords] = True
+    return touched
+
+
+async def add_chunks(
+    store_path: StorePath, metadata: ArrayMetadata, chunk_grid_shape: ChunkCoords, indexer: Indexer
+) -> ChunkManifest:
+    """
+    Add the chunks touched by the selection of ``indexer`` to the manifest of the array at
+    ``store_path``, before they are written. The manifest is rebuilt if the array has none,
+    or if it cannot be trusted.
+
+    Returns the manifest from before the chunks were added, with the names of the segments
+    that hold the chunks after they were added.
+    """
+    touched = _touched_chunks(indexer, chunk_grid_shape)
+    names, segments = await _read_segments(store_path)
+    trusted = _trusted(segments, chunk_grid_shape) if names else None
+    if trusted is not None:
+        bitmap = _merge_segments(trusted, chunk_grid_shape)
+        if len(names) < _MAX_SEGMENTS:
+            added = touched & ~bitmap
+            if not added.any():
+                return ChunkManifest(bitmap, tuple(names))
+            name = await _write_segment(store_path, _ManifestSegment(added))
+            return ChunkManifest(bitmap, (*names, name))
+    else:
+        # the chunks of the segments that can be read are kept, since they may be written
+        # after they are listed
+        bitmap = await _list_chunks(store_path, metadata, chunk_grid_shape)
+        for segment in segments.values():
+            if (
+                segment is not None
+                and segment.supersedes is None
+                and segment.bitmap.shape == chunk_grid_shape
+            ):
+                bitmap |= segment.bitmap
+    name = await _write_segment(store_path, _ManifestSegment(bitmap | touched))
+    await _delete_segments(store_path, names)
+    return ChunkManifest(bitmap, (name,))
+
+
+async def discard_chunks(
+    store_path: StorePath,
+    manifest: ChunkManifest,
+    chunk_coords: Iterable[ChunkCoords],
+) -> None:
+    """Remove chunks from the ``manifest`` of the array at ``store_path``, after they were
+    deleted."""
+    removed = np.zeros(manifest.bitmap.shape, dtype=bool)
+    for coords in chunk_coords:
+        removed[coords] = True
+    await _write_segment(store_path, _ManifestSegment(removed, supersedes=manifest.segments))
+
+
+async def resize_chunk_manifest(
+    store_path: StorePath,
+    old_chunk_grid_shape: ChunkCoords,
+    new_chunk_grid_shape: ChunkCoords,
+    chunks_deleted: bool,
+) -> None:
+    """
+    Update the manifest of the array at ``store_path`` after the array was resized.
+
+    If the chunks outside of the new shape were not deleted, the manifest is deleted, since
+    those chunks would reappear if the array grows again.
+    """
+    names, segments = await _read_segments(store_path)
+    if not names:
+        return
+    trusted = _trusted(segments, old_chunk_grid_shape)
+    if chunks_deleted and trusted is not None:
+        old_bitmap = _merge_segments(trusted, old_chunk_grid_shape)
+        bitmap = np.zeros(new_chunk_grid_shape, dtype=bool)
+        overlap = tuple(
+            slice(0, min(old, new))
+            for old, new in zip(old_chunk_grid_shape, new_chunk_grid_shape, strict=True)
+        )
+        bitmap[overlap] = old_bitmap[overlap]
+        await _write_segment(store_path, _ManifestSegment(bitmap))
+    else:
+        _remember_manifest(store_path, False)
+    await _delete_segments(store_path, names)
+
+
+class _ManifestChunkPath(StorePath):
+    """Store path of a chunk of an array with a manifest, which records the deletion of
+    the chunk."""
+
+    def __init__(
+        self, store: Store, path: str, chunk_coords: ChunkCoords, deleted: list[ChunkCoords]
+    ) -> None:
+        super().__init__(store, path)
+        self.chunk_coords = chunk_coords
+        self._deleted = deleted
+
+    async def delete(self) -> None:
+        await super().delete()
+        self._deleted.append(self.chunk_coords)
+
+
+class _AbsentChunk:
+    """Byte getter and setter of a chunk that the manifest lists as absent, which reads
+    nothing from the store."""
+
+    def __init__(self, store_path: _ManifestChunkPath) -> None:
+        self.store_path = store_path
+
+    async def get(
+        self, prototype: BufferPrototype, byte_range: ByteRequest | None = None
+    ) -> Buffer | None:
+        return None
+
+    async def set(self, value: Buffer, byte_range: ByteRequest | None = None) -> None:
+        await self.store_path.set(value, byte_range)
+
+    async def delete(self) -> None:
+        await self.store_path.delete()
+
+    async def set_if_not_exists(self, default: Buffer) -> None:
+        await self.store_path.set_if_not_exists(default)
+
+
+def chunk_byte_setter(
+    store: Store,
+    path: str,
+    chunk_coords: ChunkCoords,
+    manifest: ChunkManifest,
+    deleted: list[ChunkCoords],
+) -> ByteSetter:
+    """Return the byte setter of a chunk of an array with a manifest. Chunks that are
+    deleted through it are appended to ``deleted``."""
+    store_path = _ManifestChunkPath(store, path, chunk_coords, deleted)
+    if chunk_coords in manifest:
+        return store_path
+    return _AbsentChunk(store_path)
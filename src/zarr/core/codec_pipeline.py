@@ -1,38 +1,55 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from itertools import islice, pairwise
 from typing import TYPE_CHECKING, Any, TypeVar
 from warnings import warn
 
+import numpy as np
+
 from zarr.abc.codec import (
     ArrayArrayCodec,
+    ArrayArrayCodecPartialDecodeMixin,
     ArrayBytesCodec,
+    ArrayBytesCodecDecodeIntoMixin,
     ArrayBytesCodecPartialDecodeMixin,
     ArrayBytesCodecPartialEncodeMixin,
     BytesBytesCodec,
+    BytesBytesCodecDecodeIntoMixin,
+    BytesBytesCodecPartialDecodeMixin,
     Codec,
     CodecPipeline,
 )
-from zarr.core.common import ChunkCoords, concurrent_map
+from zarr.abc.store import set_or_delete
+from zarr.core.buffer_pool import _get_buffer_pool, acquire_array
+from zarr.core.common import ChunkCoords, concurrent_map, decode_budget
 from zarr.core.config import config
 from zarr.core.indexing import SelectorTuple, is_scalar, is_total_slice
 from zarr.core.metadata.v2 import _default_fill_value
 from zarr.registry import register_pipeline
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Iterator
+    from collections.abc import Awaitable, Callable, Iterable, Iterator, Sequence
     from typing import Self
 
-    import numpy as np
+    import numpy.typing as npt
 
-    from zarr.abc.store import ByteGetter, ByteSetter
+    from zarr.abc.store import ByteGetter, ByteSetter, Store
     from zarr.core.array_spec import ArraySpec
-    from zarr.core.buffer import Buffer, BufferPrototype, NDBuffer
+    from zarr.core.buffer import Buffer, BufferPrototype, NDArrayLike, NDBuffer
+    from zarr.core.buffer_pool import BufferPool
     from zarr.core.chunk_grids import ChunkGrid
+    from zarr.core.indexing import ChunkBatchProjection
+
+    _ReadChunkInfo = tuple[ByteGetter, ArraySpec, SelectorTuple, SelectorTuple]
+    _WriteChunkInfo = tuple[ByteSetter, ArraySpec, SelectorTuple, SelectorTuple]
+    _ReadBatchInfo = tuple[Sequence[ByteGetter], Sequence[ArraySpec], ChunkBatchProjection]
+    _WriteBatchInfo = tuple[Sequence[ByteSetter], Sequence[ArraySpec], ChunkBatchProjection]
 
 T = TypeVar("T")
 U = TypeVar("U")
+V = TypeVar("V")
 
 
 def _unzip2(iterable: Iterable[tuple[T, U]]) -> tuple[list[T], list[U]]:
@@ -44,6 +61,88 @@ def _unzip2(iterable: Iterable[tuple[T, U]]) -> tuple[list[T], list[U]]:
     return (out0, out1)
 
 
+def _unzip3(iterable: Iterable[tuple[T, U, V]]) -> tuple[list[T], list[U], list[V]]:
+    out0: list[T] = []
+    out1: list[U] = []
+    out2: list[V] = []
+    for item0, item1, item2 in iterable:
+        out0.append(item0)
+        out1.append(item1)
+        out2.append(item2)
+    return (out0, out1, out2)
+
+
+def scatter_chunk_array(
+    chunk_array: NDBuffer | None,
+    out: NDBuffer,
+    chunk_spec: ArraySpec,
+    chunk_selection: SelectorTuple,
+    out_selection: SelectorTuple,
+    drop_axes: tuple[int, ...],
+) -> None:
+    """Write the selection of a decoded chunk into ``out``, or the fill value if the chunk
+    is missing."""
+    if chunk_array is not None:
+        tmp = chunk_array[chunk_selection]
+        if drop_axes != ():
+            tmp = tmp.squeeze(axis=drop_axes)
+        out[out_selection] = tmp
+    else:
+        fill_value = chunk_spec.fill_value
+        if fill_value is None:
+            fill_value = _default_fill_value(dtype=chunk_spec.dtype)
+        out[out_selection] = fill_value
+
+
+def scatter_chunk_batch(
+    chunk_arrays: Iterable[NDBuffer | None],
+    out: NDBuffer,
+    chunk_specs: Sequence[ArraySpec],
+    batch: ChunkBatchProjection,
+) -> None:
+    """Write the selected items of a run of decoded chunks into ``out``, or the fill value
+    for the missing chunks.
+
+    The items are gathered from the chunks by their flat index into a single array, which
+    is then written into ``out`` with one assignment."""
+    out_array = out.as_ndarray_like()
+    values: Any
+    if isinstance(batch.out_selection, slice):
+        # the items of the run are contiguous in the output, so they are gathered in place
+        values = out_array[batch.out_selection]
+    else:
+        values = np.empty_like(out_array, shape=(int(batch.chunk_offsets[-1]),))
+    # chunks of a regular grid share their shape
+    flat_selection = np.ravel_multi_index(batch.chunk_selection, chunk_specs[0].shape)
+    offsets = batch.chunk_offsets.tolist()
+    for chunk_array, chunk_spec, start, stop in zip(
+        chunk_arrays, chunk_specs, offsets[:-1], offsets[1:], strict=True
+    ):
+        if chunk_array is not None:
+            values[start:stop] = np.take(chunk_array.as_ndarray_like(), flat_selection[start:stop])
+        else:
+            fill_value = chunk_spec.fill_value
+            if fill_value is None:
+                fill_value = _default_fill_value(dtype=chunk_spec.dtype)
+            values[start:stop] = fill_value
+    if not isinstance(batch.out_selection, slice):
+        out[batch.out_selection] = values
+
+
+def _release_merged_chunk_array(
+    pool: BufferPool, chunk_array: NDBuffer, chunk_bytes: Buffer | None
+) -> None:
+    """Release a merged chunk to ``pool`` after it was encoded, unless the encoded bytes
+    are a view of it."""
+    chunk_ndarray: NDArrayLike | npt.NDArray[Any] = chunk_array.as_ndarray_like()
+    if chunk_bytes is not None and (
+        not isinstance(chunk_ndarray, np.ndarray)
+        or np.may_share_memory(chunk_bytes.as_array_like(), chunk_ndarray)
+    ):
+        return
+    pool.release(chunk_ndarray)
+
+
 def batched(iterable: Iterable[T], n: int) -> Iterable[tuple[T, ...]]:
     if n < 1:
         raise ValueError("n must be at least one")
@@ -56,6 +155,113 @@ def resolve_batched(codec: Codec, chunk_specs: Iterable[ArraySpec]) -> Iterable[
     return [codec.resolve_metadata(chunk_spec) for chunk_spec in chunk_specs]
 
 
+async def fetch_batch(
+    requests: Sequence[tuple[ByteGetter | None, BufferPrototype]],
+) -> list[Buffer | None]:
+    """Read the values of a batch of byte getters, in order.
+
+    The values of byte getters that expose the ``store`` and ``path`` that they read, such
+    as store paths, are read with a single ``Store.get_many`` call per store, which lets
+    stores batch the requests. Other byte getters are read one by one, with bounded
+    concurrency. Byte getters that are None are not read.
+    """
+    out: list[Buffer | None] = [None] * len(requests)
+    stores: dict[int, Store] = {}
+    # the positions of every key in the batch, per store
+    positions: dict[int, dict[str, list[int]]] = {}
+    others: list[tuple[int, ByteGetter, BufferPrototype]] = []
+    for i, (byte_getter, prototype) in enumerate(requests):
+        if byte_getter is None:
+            continue
+        store = getattr(byte_getter, "store", None)
+        path = getattr(byte_getter, "path", None)
+        if isinstance(path, str) and hasattr(store, "get_many"):
+            store_id = id(store)
+            stores[store_id] = store
+            positions.setdefault(store_id, {}).setdefault(path, []).append(i)
+        else:
+            others.append((i, byte_getter, prototype))
+
+    async def fetch_store(store_id: int) -> None:
+        store_positions = positions[store_id]
+        store_requests = [
+            (key, requests[key_positions[0]][1], None)
+            for key, key_positions in store_positions.items()
+        ]
+        async for key, value in stores[store_id].get_many(store_requests):
+            for i in store_positions[key]:
+                out[i] = value
+
+    async def fetch_other(i: int, byte_getter: ByteGetter, prototype: BufferPrototype) -> None:
+        out[i] = await byte_getter.get(prototype=prototype)
+
+    await asyncio.gather(
+        *(fetch_store(store_id) for store_id in stores),
+        concurrent_map(others, fetch_other, config.get("async.concurrency")),
+    )
+    return out
+
+
+_END_OF_STREAM = object()
+
+
+def _first_exception(exc: BaseException) -> BaseException:
+    while isinstance(exc, BaseExceptionGroup):
+        exc = exc.exceptions[0]
+    return exc
+
+
+async def streaming_map(
+    items: Iterable[Any],
+    stages: Sequence[Callable[[Any], Awaitable[Any]]],
+    limit: int,
+) -> None:
+    """Push each item through a chain of asynchronous stages.
+
+    Every stage is served by ``limit`` workers and consecutive stages are connected by
+    queues that hold at most ``limit`` items. An item moves on to the next stage as soon
+    as the current stage is done with it, so a slow item only holds up itself and the
+    number of items in flight stays bounded. The result of the last stage is discarded.
+
+    If any stage raises, all remaining work is cancelled and the first exception is
+    re-raised.
+    """
+    if limit < 1:
+        raise ValueError("limit must be at least one")
+    queues: list[asyncio.Queue[Any]] = [asyncio.Queue(maxsize=limit) for _ in stages]
+
+    async def feed() -> None:
+        for item in items:
+            await queues[0].put(item)
+        for _ in range(limit):
+            await queues[0].put(_END_OF_STREAM)
+
+    async def work(stage_idx: int) -> None:
+        stage = stages[stage_idx]
+        inbox = queues[stage_idx]
+        outbox = queues[stage_idx + 1] if stage_idx + 1 < len(stages) else None
+        while (item := await inbox.get()) is not _END_OF_STREAM:
+            result = await stage(item)
+            if outbox is not None:
+                await outbox.put(result)
+
+    async def run_stage(stage_idx: int) -> None:
+        async with asyncio.TaskGroup() as tg:
+            for _ in range(limit):
+                tg.create_task(work(stage_idx))
+        if stage_idx + 1 < len(stages):
+            for _ in range(limit):
+                await queues[stage_idx + 1].put(_END_OF_STREAM)
+
+    try:
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(feed())
+            for stage_idx in range(len(stages)):
+                tg.create_task(run_stage(stage_idx))
+    except BaseExceptionGroup as e:
+        raise _first_exception(e) from None
+
+
 @dataclass(frozen=True)
 class BatchedCodecPipeline(CodecPipeline):
     """Default codec pipeline.
@@ -63,18 +269,32 @@ class BatchedCodecPipeline(CodecPipeline):
     This batched codec pipeline divides the chunk batches into batches of a configurable
     batch size ("mini-batch"). Fetching, decoding, encoding and storing are performed in
     lock step for each mini-batch. Multiple mini-batches are processing concurrently.
+
+    In streaming mode (``codec_pipeline.streaming``), mini-batches are not used. Instead,
+    fetching, decoding and scattering (or merging, encoding and storing) run as separate
+    stages connected by bounded queues, and each chunk moves on to the next stage as soon
+    as its previous stage has finished. A slow fetch then delays only its own chunk.
+    Codec pipelines that support partial decoding or encoding always read and write through
+    the array-to-bytes codec and are not affected by this setting.
     """
 
     array_array_codecs: tuple[ArrayArrayCodec, ...]
     array_bytes_codec: ArrayBytesCodec
     bytes_bytes_codecs: tuple[BytesBytesCodec, ...]
     batch_size: int
+    streaming: bool = False
 
     def evolve_from_array_spec(self, array_spec: ArraySpec) -> Self:
         return type(self).from_codecs(c.evolve_from_array_spec(array_spec=array_spec) for c in self)
 
     @classmethod
-    def from_codecs(cls, codecs: Iterable[Codec], *, batch_size: int | None = None) -> Self:
+    def from_codecs(
+        cls,
+        codecs: Iterable[Codec],
+        *,
+        batch_size: int | None = None,
+        streaming: bool | None = None,
+    ) -> Self:
         array_array_codecs, array_bytes_codec, bytes_bytes_codecs = codecs_from_list(codecs)
 
         return cls(
@@ -82,22 +302,32 @@ class BatchedCodecPipeline(CodecPipeline):
             array_bytes_codec=array_bytes_codec,
             bytes_bytes_codecs=bytes_bytes_codecs,
             batch_size=batch_size or config.get("codec_pipeline.batch_size"),
+            streaming=(
+                config.get("codec_pipeline.streaming", False) if streaming is None else streaming
+            ),
         )
 
     @property
     def supports_partial_decode(self) -> bool:
         """Determines whether the codec pipeline supports partial decoding.
 
-        Currently, only codec pipelines with a single ArrayBytesCodec that supports
-        partial decoding can support partial decoding. This limitation is due to the fact
-        that ArrayArrayCodecs can change the slice selection leading to non-contiguous
-        slices and BytesBytesCodecs can change the chunk bytes in a way that slice
-        selections cannot be attributed to byte ranges anymore which renders partial
-        decoding infeasible.
-
-        This limitation may softened in the future."""
-        return (len(self.array_array_codecs) + len(self.bytes_bytes_codecs)) == 0 and isinstance(
-            self.array_bytes_codec, ArrayBytesCodecPartialDecodeMixin
+        A codec pipeline supports partial decoding if its ArrayBytesCodec does and all
+        other codecs can pass partial reads through: ArrayArrayCodecs have to map slice
+        selections to selections of their encoded chunk (e.g. transpose), and
+        BytesBytesCodecs have to store the decoded bytes as a contiguous byte range
+        (e.g. crc32c). Compressors change the chunk bytes in a way that slice selections
+        cannot be attributed to byte ranges anymore which renders partial decoding
+        infeasible."""
+        return (
+            all(
+                isinstance(codec, ArrayArrayCodecPartialDecodeMixin)
+                for codec in self.array_array_codecs
+            )
+            and isinstance(self.array_bytes_codec, ArrayBytesCodecPartialDecodeMixin)
+            and all(
+                isinstance(codec, BytesBytesCodecPartialDecodeMixin)
+                for codec in self.bytes_bytes_codecs
+            )
         )
 
     @property
@@ -190,8 +420,46 @@ class BatchedCodecPipeline(CodecPipeline):
         batch_info: Iterable[tuple[ByteGetter, SelectorTuple, ArraySpec]],
     ) -> Iterable[NDBuffer | None]:
         assert self.supports_partial_decode
-        assert isinstance(self.array_bytes_codec, ArrayBytesCodecPartialDecodeMixin)
-        return await self.array_bytes_codec.decode_partial(batch_info)
+        byte_getters: Iterable[ByteGetter]
+        selections: Iterable[SelectorTuple]
+        byte_getters, selections, chunk_specs = _unzip3(batch_info)
+        (
+            aa_codecs_with_spec,
+            ab_codec_with_spec,
+            bb_codecs_with_spec,
+        ) = self._codecs_with_resolved_metadata_batched(chunk_specs)
+
+        for bb_codec, chunk_spec_batch in bb_codecs_with_spec[::-1]:
+            assert isinstance(bb_codec, BytesBytesCodecPartialDecodeMixin)
+            byte_getters = [
+                bb_codec.resolve_byte_getter(byte_getter, chunk_spec)
+                for byte_getter, chunk_spec in zip(byte_getters, chunk_spec_batch, strict=False)
+            ]
+
+        selection_batches: list[Iterable[SelectorTuple]] = []
+        for aa_codec, chunk_spec_batch in aa_codecs_with_spec:
+            assert isinstance(aa_codec, ArrayArrayCodecPartialDecodeMixin)
+            selection_batches.append(selections)
+            selections = [
+                aa_codec.resolve_selection(selection, chunk_spec)
+                for selection, chunk_spec in zip(selections, chunk_spec_batch, strict=False)
+            ]
+
+        ab_codec, chunk_spec_batch = ab_codec_with_spec
+        assert isinstance(ab_codec, ArrayBytesCodecPartialDecodeMixin)
+        chunk_array_batch = await ab_codec.decode_partial(
+            zip(byte_getters, selections, chunk_spec_batch, strict=False)
+        )
+
+        for (aa_codec, chunk_spec_batch), selection_batch in zip(
+            aa_codecs_with_spec[::-1], selection_batches[::-1], strict=False
+        ):
+            assert isinstance(aa_codec, ArrayArrayCodecPartialDecodeMixin)
+            chunk_array_batch = await aa_codec.decode_partial(
+                zip(chunk_array_batch, selection_batch, chunk_spec_batch, strict=False)
+            )
+
+        return chunk_array_batch
 
     async def encode_batch(
         self,
@@ -228,12 +496,107 @@ class BatchedCodecPipeline(CodecPipeline):
         assert isinstance(self.array_bytes_codec, ArrayBytesCodecPartialEncodeMixin)
         await self.array_bytes_codec.encode_partial(batch_info)
 
+    def _decode_into_target(
+        self,
+        chunk_spec: ArraySpec,
+        chunk_selection: SelectorTuple,
+        out: NDBuffer,
+        out_selection: SelectorTuple,
+        drop_axes: tuple[int, ...],
+    ) -> npt.NDArray[Any] | None:
+        """Return the region of ``out`` that a chunk can be decoded into, or None.
+
+        Chunks are decoded into ``out`` if the whole chunk is selected and its region of
+        ``out`` is contiguous, which is the case for chunks that span the trailing
+        dimensions of the output."""
+        if (
+            self.array_array_codecs
+            or drop_axes
+            or not isinstance(self.array_bytes_codec, ArrayBytesCodecDecodeIntoMixin)
+            # worker processes would decode into a copy of ``out``
+            or config.get("codec_pipeline.executor") == "process"
+            or not is_total_slice(chunk_selection, chunk_spec.shape)
+        ):
+            return None
+        out_array: NDArrayLike | npt.NDArray[Any] = out.as_ndarray_like()
+        if not isinstance(out_array, np.ndarray) or out_array.dtype != chunk_spec.dtype:
+            return None
+        if isinstance(out_selection, tuple):
+            if not all(isinstance(dim_sel, slice) for dim_sel in out_selection):
+                return None
+        elif not isinstance(out_selection, slice):
+            return None
+        target = out_array[out_selection]
+        if (
+            target.shape != chunk_spec.shape
+            or not target.flags.c_contiguous
+            or not target.flags.writeable
+        ):
+            return None
+        return target
+
+    async def _decode_into(
+        self, chunk_bytes: Buffer, chunk_spec: ArraySpec, out: npt.NDArray[Any]
+    ) -> bool:
+        """Decode a chunk into ``out``, a region returned by ``_decode_into_target``.
+
+        Without bytes-to-bytes codecs, the array-to-bytes codec decodes the chunk into
+        ``out``. Otherwise, the innermost bytes-to-bytes codec decodes into the bytes of
+        ``out``, if the array-to-bytes codec lays out the chunk as they are in memory.
+        Returns False, leaving ``out`` untouched, if the chunk cannot be decoded into it."""
+        _, (ab_codec, (ab_spec,)), bb_codecs_with_spec = (
+            self._codecs_with_resolved_metadata_batched([chunk_spec])
+        )
+        assert isinstance(ab_codec, ArrayBytesCodecDecodeIntoMixin)
+        if not bb_codecs_with_spec:
+            return await ab_codec.decode_into(chunk_bytes, ab_spec, out)
+        inner_codec, (inner_spec,) = bb_codecs_with_spec[0]
+        if not isinstance(inner_codec, BytesBytesCodecDecodeIntoMixin):
+            return False
+        target = ab_codec.resolve_decode_target(ab_spec, out)
+        if target is None:
+            return False
+        for bb_codec, (bb_spec,) in bb_codecs_with_spec[:0:-1]:
+            (decoded,) = await bb_codec.decode([(chunk_bytes, bb_spec)])
+            assert decoded is not None
+            chunk_bytes = decoded
+        await inner_codec.decode_into(chunk_bytes, inner_spec, target)
+        return True
+
+    @property
+    def _encodes_chunk_views(self) -> bool:
+        """Whether chunks are encoded into, and decoded from, views of their memory.
+
+        This is the case for array-to-bytes codecs that lay out the items as they are in
+        memory, without bytes-to-bytes codecs. Their chunks are not taken from the buffer
+        pool, since the encoded bytes would hold on to the memory of the pool, and since
+        decoding them does not allocate."""
+        ab_codec = self.array_bytes_codec
+        return not self.bytes_bytes_codecs and (
+            isinstance(ab_codec, ArrayBytesCodecDecodeIntoMixin)
+            and type(ab_codec).resolve_decode_target
+            is not ArrayBytesCodecDecodeIntoMixin.resolve_decode_target
+        )
+
+    def _acquire_decode_array(self, chunk_spec: ArraySpec, pool: BufferPool) -> NDBuffer | None:
+        """Return an array from ``pool`` that a chunk can be decoded into with
+        ``_decode_into``, or None."""
+        if (
+            self.array_array_codecs
+            or not isinstance(self.array_bytes_codec, ArrayBytesCodecDecodeIntoMixin)
+            or self._encodes_chunk_views
+            or config.get("codec_pipeline.executor") == "process"
+        ):
+            return None
+        return acquire_array(pool, chunk_spec.prototype, chunk_spec.shape, chunk_spec.dtype)
+
     async def read_batch(
         self,
         batch_info: Iterable[tuple[ByteGetter, ArraySpec, SelectorTuple, SelectorTuple]],
         out: NDBuffer,
         drop_axes: tuple[int, ...] = (),
     ) -> None:
+        pool = _get_buffer_pool()
         if self.supports_partial_decode:
             chunk_array_batch = await self.decode_partial_batch(
                 [
@@ -246,6 +609,9 @@ class BatchedCodecPipeline(CodecPipeline):
             ):
                 if chunk_array is not None:
                     out[out_selection] = chunk_array
+                    if pool is not None:
+                        # partial decoders may return arrays from the buffer pool
+                        pool.release(chunk_array.as_ndarray_like())
                 else:
                     fill_value = chunk_spec.fill_value
 
@@ -259,35 +625,120 @@ class BatchedCodecPipeline(CodecPipeline):
 
                     out[out_selection] = fill_value
         else:
-            chunk_bytes_batch = await concurrent_map(
+            batch_info = list(batch_info)
+            chunk_bytes_batch = await fetch_batch(
                 [
                     (byte_getter, array_spec.prototype)
                     for byte_getter, array_spec, _, _ in batch_info
+                ]
+            )
+            # chunks that fill a contiguous region of ``out`` are decoded directly into it,
+            # and the other chunks into arrays from the buffer pool, if it is enabled
+            pooled: dict[int, NDBuffer] = {}
+            decode_into_batch: list[tuple[int, Buffer, ArraySpec, npt.NDArray[Any]]] = []
+            for i, (chunk_bytes, (_, chunk_spec, chunk_selection, out_selection)) in enumerate(
+                zip(chunk_bytes_batch, batch_info, strict=False)
+            ):
+                if chunk_bytes is None:
+                    continue
+                target = self._decode_into_target(
+                    chunk_spec, chunk_selection, out, out_selection, drop_axes
+                )
+                if target is None and pool is not None:
+                    chunk_array = self._acquire_decode_array(chunk_spec, pool)
+                    if chunk_array is not None:
+                        pooled[i] = chunk_array
+                        target = chunk_array.as_numpy_array()
+                if target is not None:
+                    decode_into_batch.append((i, chunk_bytes, chunk_spec, target))
+            decoded_into = await concurrent_map(
+                [
+                    (chunk_bytes, chunk_spec, target)
+                    for _, chunk_bytes, chunk_spec, target in decode_into_batch
                 ],
-                lambda byte_getter, prototype: byte_getter.get(prototype),
+                self._decode_into,
                 config.get("async.concurrency"),
             )
+            decoded = {
+                i
+                for (i, _, _, _), success in zip(decode_into_batch, decoded_into, strict=True)
+                if success
+            }
+            undecoded = [
+                (chunk_bytes, chunk_info)
+                for i, (chunk_bytes, chunk_info) in enumerate(
+                    zip(chunk_bytes_batch, batch_info, strict=False)
+                )
+                if i not in decoded
+            ]
             chunk_array_batch = await self.decode_batch(
-                [
-                    (chunk_bytes, chunk_spec)
-                    for chunk_bytes, (_, chunk_spec, _, _) in zip(
-                        chunk_bytes_batch, batch_info, strict=False
-                    )
-                ],
+                [(chunk_bytes, chunk_spec) for chunk_bytes, (_, chunk_spec, _, _) in undecoded],
             )
-            for chunk_array, (_, chunk_spec, chunk_selection, out_selection) in zip(
-                chunk_array_batch, batch_info, strict=False
+            for chunk_array, (_, (_, chunk_spec, chunk_selection, out_selection)) in zip(
+                chunk_array_batch, undecoded, strict=False
             ):
-                if chunk_array is not None:
-                    tmp = chunk_array[chunk_selection]
-                    if drop_axes != ():
-                        tmp = tmp.squeeze(axis=drop_axes)
-                    out[out_selection] = tmp
-                else:
-                    fill_value = chunk_spec.fill_value
-                    if fill_value is None:
-                        fill_value = _default_fill_value(dtype=chunk_spec.dtype)
-                    out[out_selection] = fill_value
+                scatter_chunk_array(
+                    chunk_array, out, chunk_spec, chunk_selection, out_selection, drop_axes
+                )
+            for i, chunk_array in pooled.items():
+                if i in decoded:
+                    _, chunk_spec, chunk_selection, out_selection = batch_info[i]
+                    scatter_chunk_array(
+                        chunk_array, out, chunk_spec, chunk_selection, out_selection, drop_axes
+                    )
+                assert pool is not None
+                pool.release(chunk_array.as_ndarray_like())
+
+    async def _read_streaming(
+        self,
+        batch_info: Iterable[tuple[ByteGetter, ArraySpec, SelectorTuple, SelectorTuple]],
+        out: NDBuffer,
+        drop_axes: tuple[int, ...] = (),
+    ) -> None:
+        async def fetch(chunk_info: _ReadChunkInfo) -> tuple[Buffer | None, _ReadChunkInfo]:
+            byte_getter, chunk_spec, _, _ = chunk_info
+            return await byte_getter.get(prototype=chunk_spec.prototype), chunk_info
+
+        pool = _get_buffer_pool()
+
+        async def decode(
+            fetched: tuple[Buffer | None, _ReadChunkInfo],
+        ) -> tuple[NDBuffer | None, _ReadChunkInfo, bool] | None:
+            chunk_bytes, chunk_info = fetched
+            _, chunk_spec, chunk_selection, out_selection = chunk_info
+            if chunk_bytes is not None:
+                target = self._decode_into_target(
+                    chunk_spec, chunk_selection, out, out_selection, drop_axes
+                )
+                if target is not None and await self._decode_into(chunk_bytes, chunk_spec, target):
+                    return None
+                if target is None and pool is not None:
+                    pooled_array = self._acquire_decode_array(chunk_spec, pool)
+                    if pooled_array is not None:
+                        if await self._decode_into(
+                            chunk_bytes, chunk_spec, pooled_array.as_numpy_array()
+                        ):
+                            return pooled_array, chunk_info, True
+                        pool.release(pooled_array.as_ndarray_like())
+            (chunk_array,) = await self.decode_batch([(chunk_bytes, chunk_spec)])
+            return chunk_array, chunk_info, False
+
+        async def scatter(decoded: tuple[NDBuffer | None, _ReadChunkInfo, bool] | None) -> None:
+            if decoded is None:
+                # the chunk was decoded into ``out``
+                return
+            chunk_array, (_, chunk_spec, chunk_selection, out_selection), is_pooled = decoded
+            scatter_chunk_array(
+                chunk_array, out, chunk_spec, chunk_selection, out_selection, drop_axes
+            )
+            if is_pooled:
+                assert pool is not None
+                assert chunk_array is not None
+                pool.release(chunk_array.as_ndarray_like())
+
+        await streaming_map(
+            batch_info, [fetch, decode, scatter], limit=config.get("async.concurrency")
+        )
 
     def _merge_chunk_array(
         self,
@@ -297,10 +748,22 @@ class BatchedCodecPipeline(CodecPipeline):
         chunk_spec: ArraySpec,
         chunk_selection: SelectorTuple,
         drop_axes: tuple[int, ...],
+        pool: BufferPool | None = None,
     ) -> NDBuffer:
         if is_total_slice(chunk_selection, chunk_spec.shape) and value.shape == chunk_spec.shape:
             return value
-        if existing_chunk_array is None:
+        chunk_array: NDBuffer | None = None
+        if pool is not None and not self._encodes_chunk_views:
+            chunk_array = acquire_array(
+                pool, chunk_spec.prototype, chunk_spec.shape, chunk_spec.dtype, chunk_spec.order
+            )
+        if chunk_array is not None:
+            if existing_chunk_array is None:
+                if chunk_spec.fill_value is not None:
+                    chunk_array.fill(chunk_spec.fill_value)
+            else:
+                chunk_array[...] = existing_chunk_array
+        elif existing_chunk_array is None:
             chunk_array = chunk_spec.prototype.nd_buffer.create(
                 shape=chunk_spec.shape,
                 dtype=chunk_spec.dtype,
@@ -350,24 +813,15 @@ class BatchedCodecPipeline(CodecPipeline):
 
         else:
             # Read existing bytes if not total slice
-            async def _read_key(
-                byte_setter: ByteSetter | None, prototype: BufferPrototype
-            ) -> Buffer | None:
-                if byte_setter is None:
-                    return None
-                return await byte_setter.get(prototype=prototype)
-
             chunk_bytes_batch: Iterable[Buffer | None]
-            chunk_bytes_batch = await concurrent_map(
+            chunk_bytes_batch = await fetch_batch(
                 [
                     (
                         None if is_total_slice(chunk_selection, chunk_spec.shape) else byte_setter,
                         chunk_spec.prototype,
                     )
                     for byte_setter, chunk_spec, chunk_selection, _ in batch_info
-                ],
-                _read_key,
-                config.get("async.concurrency"),
+                ]
             )
             chunk_array_decoded = await self.decode_batch(
                 [
@@ -378,53 +832,116 @@ class BatchedCodecPipeline(CodecPipeline):
                 ],
             )
 
+            pool = _get_buffer_pool()
             chunk_array_merged = [
                 self._merge_chunk_array(
-                    chunk_array, value, out_selection, chunk_spec, chunk_selection, drop_axes
+                    chunk_array, value, out_selection, chunk_spec, chunk_selection, drop_axes, pool
                 )
                 for chunk_array, (_, chunk_spec, chunk_selection, out_selection) in zip(
                     chunk_array_decoded, batch_info, strict=False
                 )
             ]
-            chunk_array_batch: list[NDBuffer | None] = []
-            for chunk_array, (_, chunk_spec, _, _) in zip(
-                chunk_array_merged, batch_info, strict=False
-            ):
-                if chunk_array is None:
-                    chunk_array_batch.append(None)  # type: ignore[unreachable]
-                else:
-                    if not chunk_spec.config.write_empty_chunks and chunk_array.all_equal(
-                        chunk_spec.fill_value
-                    ):
-                        chunk_array_batch.append(None)
-                    else:
-                        chunk_array_batch.append(chunk_array)
-
-            chunk_bytes_batch = await self.encode_batch(
+            await self._encode_and_store_batch(
                 [
-                    (chunk_array, chunk_spec)
-                    for chunk_array, (_, chunk_spec, _, _) in zip(
-                        chunk_array_batch, batch_info, strict=False
+                    (byte_setter, chunk_array, chunk_spec)
+                    for chunk_array, (byte_setter, chunk_spec, _, _) in zip(
+                        chunk_array_merged, batch_info, strict=False
                     )
                 ],
+                pool,
             )
 
-            async def _write_key(byte_setter: ByteSetter, chunk_bytes: Buffer | None) -> None:
-                if chunk_bytes is None:
-                    await byte_setter.delete()
-                else:
-                    await byte_setter.set(chunk_bytes)
+    async def _encode_and_store_batch(
+        self,
+        batch_info: Iterable[tuple[ByteSetter, NDBuffer, ArraySpec]],
+        pool: BufferPool | None = None,
+    ) -> None:
+        """Encode merged chunks and write them to the store, deleting the chunks that are
+        empty. Merged chunks from ``pool`` are released once they are encoded."""
+        batch_info = list(batch_info)
+        chunk_array_batch: list[NDBuffer | None] = [
+            self._drop_empty_chunk_array(chunk_array, chunk_spec)
+            for _, chunk_array, chunk_spec in batch_info
+        ]
 
-            await concurrent_map(
-                [
-                    (byte_setter, chunk_bytes)
-                    for chunk_bytes, (byte_setter, _, _, _) in zip(
-                        chunk_bytes_batch, batch_info, strict=False
-                    )
-                ],
-                _write_key,
-                config.get("async.concurrency"),
+        chunk_bytes_batch = await self.encode_batch(
+            [
+                (chunk_array, chunk_spec)
+                for chunk_array, (_, _, chunk_spec) in zip(
+                    chunk_array_batch, batch_info, strict=False
+                )
+            ],
+        )
+        if pool is not None:
+            for chunk_bytes, (_, chunk_array, _) in zip(
+                chunk_bytes_batch, batch_info, strict=False
+            ):
+                _release_merged_chunk_array(pool, chunk_array, chunk_bytes)
+
+        await concurrent_map(
+            [
+                (byte_setter, chunk_bytes)
+                for chunk_bytes, (byte_setter, _, _) in zip(
+                    chunk_bytes_batch, batch_info, strict=False
+                )
+            ],
+            set_or_delete,
+            config.get("async.concurrency"),
+        )
+
+    def _drop_empty_chunk_array(
+        self, chunk_array: NDBuffer | None, chunk_spec: ArraySpec
+    ) -> NDBuffer | None:
+        if chunk_array is None:
+            return None
+        if not chunk_spec.config.write_empty_chunks and chunk_array.all_equal(
+            chunk_spec.fill_value
+        ):
+            return None
+        return chunk_array
+
+    async def _write_streaming(
+        self,
+        batch_info: Iterable[tuple[ByteSetter, ArraySpec, SelectorTuple, SelectorTuple]],
+        value: NDBuffer,
+        drop_axes: tuple[int, ...] = (),
+    ) -> None:
+        async def fetch(chunk_info: _WriteChunkInfo) -> tuple[Buffer | None, _WriteChunkInfo]:
+            byte_setter, chunk_spec, chunk_selection, _ = chunk_info
+            if is_total_slice(chunk_selection, chunk_spec.shape):
+                return None, chunk_info
+            return await byte_setter.get(prototype=chunk_spec.prototype), chunk_info
+
+        pool = _get_buffer_pool()
+
+        async def merge_and_encode(
+            fetched: tuple[Buffer | None, _WriteChunkInfo],
+        ) -> tuple[Buffer | None, _WriteChunkInfo]:
+            existing_bytes, chunk_info = fetched
+            _, chunk_spec, chunk_selection, out_selection = chunk_info
+            (existing_chunk_array,) = await self.decode_batch([(existing_bytes, chunk_spec)])
+            merged_chunk_array = self._merge_chunk_array(
+                existing_chunk_array,
+                value,
+                out_selection,
+                chunk_spec,
+                chunk_selection,
+                drop_axes,
+                pool,
             )
+            chunk_array = self._drop_empty_chunk_array(merged_chunk_array, chunk_spec)
+            (chunk_bytes,) = await self.encode_batch([(chunk_array, chunk_spec)])
+            if pool is not None:
+                _release_merged_chunk_array(pool, merged_chunk_array, chunk_bytes)
+            return chunk_bytes, chunk_info
+
+        async def store(encoded: tuple[Buffer | None, _WriteChunkInfo]) -> None:
+            chunk_bytes, (byte_setter, _, _, _) = encoded
+            await set_or_delete(byte_setter, chunk_bytes)
+
+        await streaming_map(
+            batch_info, [fetch, merge_and_encode, store], limit=config.get("async.concurrency")
+        )
 
     async def decode(
         self,
@@ -450,14 +967,27 @@ class BatchedCodecPipeline(CodecPipeline):
         out: NDBuffer,
         drop_axes: tuple[int, ...] = (),
     ) -> None:
-        await concurrent_map(
-            [
-                (single_batch_info, out, drop_axes)
-                for single_batch_info in batched(batch_info, self.batch_size)
+        if self.streaming and not self.supports_partial_decode:
+            await self._read_streaming(batch_info, out, drop_axes)
+            return
+
+        async def read_batch(
+            single_batch_info: tuple[
+                tuple[ByteGetter, ArraySpec, SelectorTuple, SelectorTuple], ...
             ],
-            self.read_batch,
-            config.get("async.concurrency"),
-        )
+        ) -> None:
+            await self.read_batch(single_batch_info, out, drop_axes)
+
+        # mini-batches are taken from the chunk iterator as workers become free, so that
+        # the projections of later chunks are computed while earlier chunks are fetched.
+        # Partial decoders (e.g. sharding) decode the inner chunks of all the mini-batches
+        # in flight within one shared budget, instead of a budget per mini-batch.
+        with decode_budget(config.get("async.concurrency")):
+            await streaming_map(
+                batched(batch_info, self.batch_size),
+                [read_batch],
+                limit=config.get("async.concurrency"),
+            )
 
     async def write(
         self,
@@ -465,15 +995,92 @@ class BatchedCodecPipeline(CodecPipeline):
         value: NDBuffer,
         drop_axes: tuple[int, ...] = (),
     ) -> None:
-        await concurrent_map(
-            [
-                (single_batch_info, value, drop_axes)
-                for single_batch_info in batched(batch_info, self.batch_size)
+        if self.streaming and not self.supports_partial_encode:
+            await self._write_streaming(batch_info, value, drop_axes)
+            return
+
+        async def write_batch(
+            single_batch_info: tuple[
+                tuple[ByteSetter, ArraySpec, SelectorTuple, SelectorTuple], ...
             ],
-            self.write_batch,
-            config.get("async.concurrency"),
+        ) -> None:
+            await self.write_batch(single_batch_info, value, drop_axes)
+
+        await streaming_map(
+            batched(batch_info, self.batch_size),
+            [write_batch],
+            limit=config.get("async.concurrency"),
         )
 
+    async def read_batches(self, batch_info: Iterable[_ReadBatchInfo], out: NDBuffer) -> None:
+        if self.supports_partial_decode:
+            await super().read_batches(batch_info, out)
+            return
+
+        async def read_batch(single_batch_info: _ReadBatchInfo) -> None:
+            byte_getters, chunk_specs, batch = single_batch_info
+            chunk_bytes_batch = await fetch_batch(
+                [
+                    (byte_getter, chunk_spec.prototype)
+                    for byte_getter, chunk_spec in zip(byte_getters, chunk_specs, strict=True)
+                ]
+            )
+            chunk_array_batch = await self.decode_batch(
+                zip(chunk_bytes_batch, chunk_specs, strict=True)
+            )
+            scatter_chunk_batch(chunk_array_batch, out, chunk_specs, batch)
+
+        await streaming_map(batch_info, [read_batch], limit=config.get("async.concurrency"))
+
+    async def write_batches(self, batch_info: Iterable[_WriteBatchInfo], value: NDBuffer) -> None:
+        if self.supports_partial_encode:
+            await super().write_batches(batch_info, value)
+            return
+
+        async def write_batch(single_batch_info: _WriteBatchInfo) -> None:
+            byte_setters, chunk_specs, batch = single_batch_info
+            chunk_bytes_batch = await fetch_batch(
+                [
+                    (byte_setter, chunk_spec.prototype)
+                    for byte_setter, chunk_spec in zip(byte_setters, chunk_specs, strict=True)
+                ]
+            )
+            chunk_array_decoded = await self.decode_batch(
+                zip(chunk_bytes_batch, chunk_specs, strict=True)
+            )
+            # the items of the run are gathered from the value array at once
+            batch_value = value if value.shape == () else value[batch.out_selection]
+            offsets = batch.chunk_offsets.tolist()
+            pool = _get_buffer_pool()
+            await self._encode_and_store_batch(
+                (
+                    (
+                        byte_setter,
+                        self._merge_chunk_array(
+                            chunk_array,
+                            batch_value,
+                            slice(start, stop),
+                            chunk_spec,
+                            tuple(dim_sel[start:stop] for dim_sel in batch.chunk_selection),
+                            (),
+                            pool,
+                        ),
+                        chunk_spec,
+                    )
+                    for byte_setter, chunk_array, chunk_spec, start, stop in zip(
+                        byte_setters,
+                        chunk_array_decoded,
+                        chunk_specs,
+                        offsets[:-1],
+                        offsets[1:],
+                        strict=True,
+                    )
+                ),
+                pool,
+            )
+
+        await streaming_map(batch_info, [write_batch], limit=config.get("async.concurrency"))
+
 
 def codecs_from_list(
     codecs: Iterable[Codec],
@@ -485,11 +1092,26 @@ def codecs_from_list(
     bytes_bytes: tuple[BytesBytesCodec, ...] = ()
 
     if any(isinstance(codec, ShardingCodec) for codec in codecs) and len(tuple(codecs)) > 1:
-        warn(
-            "Combining a `sharding_indexed` codec disables partial reads and "
-            "writes, which may lead to inefficient performance.",
-            stacklevel=3,
-        )
+        if all(
+            isinstance(
+                codec,
+                ShardingCodec
+                | ArrayArrayCodecPartialDecodeMixin
+                | BytesBytesCodecPartialDecodeMixin,
+            )
+            for codec in codecs
+        ):
+            warn(
+                "Combining a `sharding_indexed` codec disables partial "
+                "writes, which may lead to inefficient performance.",
+                stacklevel=3,
+            )
+        else:
+            warn(
+                "Combining a `sharding_indexed` codec disables partial reads and "
+                "writes, which may lead to inefficient performance.",
+                stacklevel=3,
+            )
 
     for prev_codec, cur_codec in pairwise((None, *codecs)):
         if isinstance(cur_codec, ArrayArrayCodec):
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import functools
 import operator
 import warnings
 from collections.abc import Iterable, Mapping
+from contextvars import ContextVar
 from enum import Enum
 from itertools import starmap
 from typing import (
@@ -68,6 +70,47 @@ async def concurrent_map(
         return await asyncio.gather(*[asyncio.ensure_future(run(item)) for item in items])
 
 
+# the concurrency budget shared by the decodes of a read, see ``decode_budget``
+_decode_budget: ContextVar[asyncio.Semaphore | None] = ContextVar("_decode_budget", default=None)
+
+
+@contextlib.contextmanager
+def decode_budget(limit: int) -> Iterator[None]:
+    """Share a budget of ``limit`` concurrent decodes between the ``decode_map`` calls made
+    in this context, including those of the tasks that are started in it."""
+    token = _decode_budget.set(asyncio.Semaphore(limit))
+    try:
+        yield
+    finally:
+        _decode_budget.reset(token)
+
+
+async def decode_map(
+    items: Iterable[T],
+    func: Callable[..., Awaitable[V]],
+    limit: int | None = None,
+) -> list[V]:
+    """
+    Like ``concurrent_map``, but within the decode budget of the current context, if there
+    is one, instead of a budget of ``limit`` of its own.
+
+    ``func`` runs outside of the budget, so that the decodes that it nests (e.g. of the
+    inner chunks of nested shards) do not wait for the budget held by their callers.
+    """
+    budget = _decode_budget.get()
+    if budget is None:
+        return await concurrent_map(items, func, limit)
+
+    async def run(item: tuple[Any]) -> V:
+        async with budget:
+            _decode_budget.set(None)
+            return await func(*item)
+
+    # every task runs in a copy of the current context, so clearing the budget in a task
+    # does not clear it for the others
+    return await asyncio.gather(*[asyncio.ensure_future(run(item)) for item in items])
+
+
 E = TypeVar("E", bound=Enum)
 
 
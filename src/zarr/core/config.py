@@ -65,7 +65,10 @@ config = Config(
             "default_zarr_format": 3,
             "array": {
                 "order": "C",
+                "chunk_cache_size": 0,
+                "buffer_pool_size": 0,
                 "write_empty_chunks": False,
+                "chunk_manifest": False,
                 "v2_default_compressor": {
                     "numeric": {"id": "zstd", "level": 0, "checksum": False},
                     "string": {"id": "zstd", "level": 0, "checksum": False},
@@ -100,6 +103,16 @@ config = Config(
             "codec_pipeline": {
                 "path": "zarr.core.codec_pipeline.BatchedCodecPipeline",
                 "batch_size": 1,
+                "coordinate_batch_nbytes": 2**24,
+                "streaming": False,
+                "executor": "thread",
+            },
+            "metadata_cache": {"ttl": 0, "size": 2**24},
+            "sharding": {
+                "index_cache_size": 0,
+                "read_coalesce_max_gap": 2**16,
+                "verify_partial_checksums": True,
+                "write_mode": "rewrite",
             },
             "codecs": {
                 "blosc": "zarr.codecs.blosc.BloscCodec",
@@ -7,7 +7,7 @@ import operator
 from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
 from enum import Enum
-from functools import reduce
+from functools import lru_cache, reduce
 from types import EllipsisType
 from typing import (
     TYPE_CHECKING,
@@ -375,52 +375,59 @@ class SliceDimIndexer:
         object.__setattr__(self, "nitems", max(0, ceildiv((stop - start), step)))
         object.__setattr__(self, "nchunks", ceildiv(dim_len, dim_chunk_len))
 
-    def __iter__(self) -> Iterator[ChunkDimProjection]:
+    def projections(self) -> tuple[npt.NDArray[np.intp], list[slice], list[slice]]:
+        """Return the indices of the chunks touched by the selection, with the selections
+        of items from each chunk and in the output array.
+
+        The projections of all chunks are computed at once, with array operations.
+        """
+        step = self.step
+
         # figure out the range of chunks we need to visit
         dim_chunk_ix_from = 0 if self.start == 0 else self.start // self.dim_chunk_len
         dim_chunk_ix_to = ceildiv(self.stop, self.dim_chunk_len)
+        dim_chunk_ixs = np.arange(dim_chunk_ix_from, dim_chunk_ix_to, dtype=np.intp)
+
+        # compute offsets for chunks within overall array, accounting for trailing chunk
+        dim_offsets = dim_chunk_ixs * self.dim_chunk_len
+        dim_limits = np.minimum(self.dim_len, dim_offsets + self.dim_chunk_len)
+
+        # where the selection starts before a chunk, it continues in the chunk at the
+        # next multiple of the step, and the number of previous items provides the
+        # offset into the output array
+        starts_before = self.start < dim_offsets
+        dim_chunk_sel_starts = np.where(
+            starts_before, (self.start - dim_offsets) % step, self.start - dim_offsets
+        )
+        dim_out_offsets = np.where(starts_before, -((self.start - dim_offsets) // step), 0)
+        dim_chunk_sel_stops = np.minimum(self.stop, dim_limits) - dim_offsets
+        dim_chunk_nitems = -((dim_chunk_sel_starts - dim_chunk_sel_stops) // step)
+
+        # If there are no elements on the selection within a chunk, then skip it
+        nonempty = dim_chunk_nitems > 0
+        if not nonempty.all():
+            dim_chunk_ixs = dim_chunk_ixs[nonempty]
+            dim_chunk_sel_starts = dim_chunk_sel_starts[nonempty]
+            dim_chunk_sel_stops = dim_chunk_sel_stops[nonempty]
+            dim_out_offsets = dim_out_offsets[nonempty]
+            dim_chunk_nitems = dim_chunk_nitems[nonempty]
+
+        dim_chunk_sels = list(
+            map(
+                slice,
+                dim_chunk_sel_starts.tolist(),
+                dim_chunk_sel_stops.tolist(),
+                itertools.repeat(step),
+            )
+        )
+        dim_out_sels = list(
+            map(slice, dim_out_offsets.tolist(), (dim_out_offsets + dim_chunk_nitems).tolist())
+        )
+        return dim_chunk_ixs, dim_chunk_sels, dim_out_sels
 
-        # iterate over chunks in range
-        for dim_chunk_ix in range(dim_chunk_ix_from, dim_chunk_ix_to):
-            # compute offsets for chunk within overall array
-            dim_offset = dim_chunk_ix * self.dim_chunk_len
-            dim_limit = min(self.dim_len, (dim_chunk_ix + 1) * self.dim_chunk_len)
-
-            # determine chunk length, accounting for trailing chunk
-            dim_chunk_len = dim_limit - dim_offset
-
-            if self.start < dim_offset:
-                # selection starts before current chunk
-                dim_chunk_sel_start = 0
-                remainder = (dim_offset - self.start) % self.step
-                if remainder:
-                    dim_chunk_sel_start += self.step - remainder
-                # compute number of previous items, provides offset into output array
-                dim_out_offset = ceildiv((dim_offset - self.start), self.step)
-
-            else:
-                # selection starts within current chunk
-                dim_chunk_sel_start = self.start - dim_offset
-                dim_out_offset = 0
-
-            if self.stop > dim_limit:
-                # selection ends after current chunk
-                dim_chunk_sel_stop = dim_chunk_len
-
-            else:
-                # selection ends within current chunk
-                dim_chunk_sel_stop = self.stop - dim_offset
-
-            dim_chunk_sel = slice(dim_chunk_sel_start, dim_chunk_sel_stop, self.step)
-            dim_chunk_nitems = ceildiv((dim_chunk_sel_stop - dim_chunk_sel_start), self.step)
-
-            # If there are no elements on the selection within this chunk, then skip
-            if dim_chunk_nitems == 0:
-                continue
-
-            dim_out_sel = slice(dim_out_offset, dim_out_offset + dim_chunk_nitems)
-
-            yield ChunkDimProjection(dim_chunk_ix, dim_chunk_sel, dim_out_sel)
+    def __iter__(self) -> Iterator[ChunkDimProjection]:
+        dim_chunk_ixs, dim_chunk_sels, dim_out_sels = self.projections()
+        return map(ChunkDimProjection, dim_chunk_ixs.tolist(), dim_chunk_sels, dim_out_sels)
 
 
 def check_selection_length(selection: SelectionNormalized, shape: ChunkCoords) -> None:
@@ -501,6 +508,174 @@ class ChunkProjection(NamedTuple):
     out_selection: tuple[Selector, ...] | npt.NDArray[np.intp] | slice
 
 
+@dataclass(frozen=True)
+class ChunkProjectionPlan:
+    """The chunk projections of a basic or orthogonal selection.
+
+    The chunks touched by such a selection are the Cartesian product of the chunks touched
+    in each dimension, so rather than a ``ChunkProjection`` per chunk, the plan holds the
+    projections of each dimension and combines them into the projections of individual
+    chunks while it is iterated over. Creating a plan takes time proportional to the sum,
+    not the product, of the numbers of chunks touched in each dimension.
+
+    Attributes
+    ----------
+    dim_chunk_ixs
+        Indices of the chunks touched in each dimension.
+    dim_chunk_sels
+        Selection of items from each chunk touched in each dimension.
+    dim_out_sels
+        Selection of items in the output array for each chunk touched in each dimension,
+        or None for the dimensions that are dropped from the output.
+    dim_out_ix_sels
+        The output selections of ``dim_out_sels`` as index arrays, like the items of
+        ``ix_``, for advanced indexing; or None for basic indexing. Chunks with an index
+        array in ``dim_out_sels`` in any dimension use these in all dimensions.
+    """
+
+    dim_chunk_ixs: tuple[npt.NDArray[np.intp], ...]
+    dim_chunk_sels: tuple[Sequence[Selector], ...]
+    dim_out_sels: tuple[Sequence[Selector] | None, ...]
+    dim_out_ix_sels: tuple[Sequence[npt.NDArray[np.intp]], ...] | None = None
+
+    def __len__(self) -> int:
+        return product(tuple(len(dim_chunk_ixs) for dim_chunk_ixs in self.dim_chunk_ixs))
+
+    @property
+    def chunk_coords(self) -> npt.NDArray[np.intp]:
+        """The indices of all chunks touched by the selection, in C order, as an array of
+        shape ``(len(plan), ndim)``."""
+        if not self.dim_chunk_ixs:
+            return np.zeros((1, 0), dtype=np.intp)
+        grids = np.meshgrid(*self.dim_chunk_ixs, indexing="ij")
+        return np.stack([grid.ravel() for grid in grids], axis=-1)
+
+    def __iter__(self) -> Iterator[ChunkProjection]:
+        chunk_coords = itertools.product(
+            *(dim_chunk_ixs.tolist() for dim_chunk_ixs in self.dim_chunk_ixs)
+        )
+        chunk_sels = itertools.product(*self.dim_chunk_sels)
+        dim_out_sels = [out_sels for out_sels in self.dim_out_sels if out_sels is not None]
+        out_sels = itertools.product(*dim_out_sels)
+        if self.dim_out_ix_sels is None:
+            return map(ChunkProjection, chunk_coords, chunk_sels, out_sels)
+
+        # special case for non-monotonic indices
+        is_advanced = itertools.product(
+            *([not isinstance(out_sel, slice) for out_sel in out_sels] for out_sels in dim_out_sels)
+        )
+        out_ix_sels = itertools.product(*self.dim_out_ix_sels)
+        return map(
+            ChunkProjection,
+            chunk_coords,
+            chunk_sels,
+            (
+                out_ix_sel if any(advanced) else out_sel
+                for out_sel, out_ix_sel, advanced in zip(
+                    out_sels, out_ix_sels, is_advanced, strict=True
+                )
+            ),
+        )
+
+
+class ChunkBatchProjection(NamedTuple):
+    """A mapping of items from a run of chunks to output array, for coordinate and mask
+    selections. The items of all chunks of the run are held in flat arrays, so that they
+    can be moved to or from the output array with a single vectorized operation.
+
+    Attributes
+    ----------
+    chunk_coords
+        Indices of the chunks.
+    chunk_offsets
+        Offsets of the items of each chunk in the item arrays, followed by the number of
+        items, so that the items of chunk ``i`` are ``chunk_offsets[i]:chunk_offsets[i + 1]``.
+    chunk_selection
+        Coordinates of the items in their chunk, one array per dimension.
+    out_selection
+        Selection of the items in target (output) array.
+    """
+
+    chunk_coords: tuple[ChunkCoords, ...]
+    chunk_offsets: npt.NDArray[np.intp]
+    chunk_selection: tuple[npt.NDArray[np.intp], ...]
+    out_selection: npt.NDArray[np.intp] | slice
+
+    def projections(self) -> Iterator[ChunkProjection]:
+        """Split the batch into the projections of its chunks."""
+        offsets = self.chunk_offsets.tolist()
+        for chunk_coords, start, stop in zip(
+            self.chunk_coords, offsets[:-1], offsets[1:], strict=True
+        ):
+            out_selection: npt.NDArray[np.intp] | slice
+            if isinstance(self.out_selection, slice):
+                out_selection = slice(
+                    self.out_selection.start + start, self.out_selection.start + stop
+                )
+            else:
+                out_selection = self.out_selection[start:stop]
+            chunk_selection = tuple(dim_sel[start:stop] for dim_sel in self.chunk_selection)
+            yield ChunkProjection(chunk_coords, chunk_selection, out_selection)
+
+
+def _projection_plan(
+    dim_indexers: Sequence[
+        IntDimIndexer | SliceDimIndexer | IntArrayDimIndexer | BoolArrayDimIndexer
+    ],
+    is_advanced: bool = False,
+    chunk_shape: ChunkCoords = (),
+    shape: ChunkCoords = (),
+) -> ChunkProjectionPlan:
+    """Return the projection plan of the selection made by ``dim_indexers``.
+
+    For advanced indexing, the selections are converted to index arrays like ``ix_``
+    does, once per chunk and dimension rather than once per chunk. ``chunk_shape`` and
+    ``shape`` are then the shapes of the chunks and of the output array.
+    """
+    dim_chunk_ixs = []
+    dim_chunk_sels: list[Sequence[Selector]] = []
+    dim_out_sels: list[Sequence[Selector] | None] = []
+    for dim_indexer in dim_indexers:
+        chunk_sels: Sequence[Selector]
+        out_sels: Sequence[Selector | None]
+        if isinstance(dim_indexer, SliceDimIndexer):
+            chunk_ixs, chunk_sels, out_sels = dim_indexer.projections()
+        else:
+            projections = list(dim_indexer)
+            chunk_ixs = np.array([p.dim_chunk_ix for p in projections], dtype=np.intp)
+            chunk_sels = [p.dim_chunk_sel for p in projections]
+            out_sels = [p.dim_out_sel for p in projections]
+        dim_chunk_ixs.append(chunk_ixs)
+        dim_chunk_sels.append(chunk_sels)
+        # only integer selections drop their dimension, and have no output selections
+        dim_out_sels.append(
+            None if isinstance(dim_indexer, IntDimIndexer) else cast(Sequence[Selector], out_sels)
+        )
+
+    if not is_advanced:
+        return ChunkProjectionPlan(tuple(dim_chunk_ixs), tuple(dim_chunk_sels), tuple(dim_out_sels))
+
+    # N.B., numpy doesn't support orthogonal indexing directly as yet, so need to work
+    # around via index arrays that broadcast against each other, like np.ix_
+    ndim = len(dim_indexers)
+    dim_chunk_sels = [
+        [_ix_dim(chunk_sel, dim_chunk_len, axis, ndim) for chunk_sel in chunk_sels]
+        for axis, (chunk_sels, dim_chunk_len) in enumerate(
+            zip(dim_chunk_sels, chunk_shape, strict=True)
+        )
+    ]
+    out_ndim = len(shape)
+    dim_out_ix_sels = tuple(
+        [_ix_dim(out_sel, dim_len, axis, out_ndim) for out_sel in out_sels]
+        for axis, (out_sels, dim_len) in enumerate(
+            zip([out_sels for out_sels in dim_out_sels if out_sels is not None], shape, strict=True)
+        )
+    )
+    return ChunkProjectionPlan(
+        tuple(dim_chunk_ixs), tuple(dim_chunk_sels), tuple(dim_out_sels), dim_out_ix_sels
+    )
+
+
 def is_slice(s: Any) -> TypeGuard[slice]:
     return isinstance(s, slice)
 
@@ -567,15 +742,12 @@ class BasicIndexer(Indexer):
         )
         object.__setattr__(self, "drop_axes", ())
 
-    def __iter__(self) -> Iterator[ChunkProjection]:
-        for dim_projections in itertools.product(*self.dim_indexers):
-            chunk_coords = tuple(p.dim_chunk_ix for p in dim_projections)
-            chunk_selection = tuple(p.dim_chunk_sel for p in dim_projections)
-            out_selection = tuple(
-                p.dim_out_sel for p in dim_projections if p.dim_out_sel is not None
-            )
+    def plan(self) -> ChunkProjectionPlan:
+        """Return the projections of all chunks touched by the selection."""
+        return _projection_plan(self.dim_indexers)
 
-            yield ChunkProjection(chunk_coords, chunk_selection, out_selection)
+    def __iter__(self) -> Iterator[ChunkProjection]:
+        return iter(self.plan())
 
 
 @dataclass(frozen=True)
@@ -814,6 +986,23 @@ def ix_(selection: Any, shape: ChunkCoords) -> npt.NDArray[np.intp]:
     return cast(npt.NDArray[np.intp], selection)
 
 
+def _ix_dim(dim_sel: Selector, dim_len: int, axis: int, ndim: int) -> npt.NDArray[np.intp]:
+    """Convert the selection of a single dimension to the index array that ``ix_`` returns
+    for it, in a selection of ``ndim`` dimensions."""
+    index: npt.NDArray[Any]
+    if isinstance(dim_sel, slice):
+        index = np.arange(*dim_sel.indices(dim_len))
+    elif is_integer(dim_sel):
+        index = np.array([dim_sel])
+    elif is_bool_array(dim_sel):
+        index = np.nonzero(dim_sel)[0]
+    else:
+        index = np.asarray(dim_sel)
+    shape = [1] * ndim
+    shape[axis] = index.size
+    return index.astype(np.intp, copy=False).reshape(shape)
+
+
 def oindex(a: npt.NDArray[Any], selection: Selection) -> npt.NDArray[Any]:
     """Implementation of orthogonal indexing with slices and ints."""
     selection = replace_ellipsis(selection, a.shape)
@@ -899,29 +1088,12 @@ class OrthogonalIndexer(Indexer):
         object.__setattr__(self, "is_advanced", is_advanced)
         object.__setattr__(self, "drop_axes", drop_axes)
 
-    def __iter__(self) -> Iterator[ChunkProjection]:
-        for dim_projections in itertools.product(*self.dim_indexers):
-            chunk_coords = tuple(p.dim_chunk_ix for p in dim_projections)
-            chunk_selection: tuple[Selector, ...] | npt.NDArray[Any] = tuple(
-                p.dim_chunk_sel for p in dim_projections
-            )
-            out_selection: tuple[Selector, ...] | npt.NDArray[Any] = tuple(
-                p.dim_out_sel for p in dim_projections if p.dim_out_sel is not None
-            )
+    def plan(self) -> ChunkProjectionPlan:
+        """Return the projections of all chunks touched by the selection."""
+        return _projection_plan(self.dim_indexers, self.is_advanced, self.chunk_shape, self.shape)
 
-            # handle advanced indexing arrays orthogonally
-            if self.is_advanced:
-                # N.B., numpy doesn't support orthogonal indexing directly as yet,
-                # so need to work around via np.ix_. Also np.ix_ does not support a
-                # mixture of arrays and slices or integers, so need to convert slices
-                # and integers into ranges.
-                chunk_selection = ix_(chunk_selection, self.chunk_shape)
-
-                # special case for non-monotonic indices
-                if not is_basic_selection(out_selection):
-                    out_selection = ix_(out_selection, self.shape)
-
-            yield ChunkProjection(chunk_coords, chunk_selection, out_selection)
+    def __iter__(self) -> Iterator[ChunkProjection]:
+        return iter(self.plan())
 
 
 @dataclass(frozen=True)
@@ -1023,15 +1195,12 @@ class BlockIndexer(Indexer):
         object.__setattr__(self, "shape", shape)
         object.__setattr__(self, "drop_axes", ())
 
-    def __iter__(self) -> Iterator[ChunkProjection]:
-        for dim_projections in itertools.product(*self.dim_indexers):
-            chunk_coords = tuple(p.dim_chunk_ix for p in dim_projections)
-            chunk_selection = tuple(p.dim_chunk_sel for p in dim_projections)
-            out_selection = tuple(
-                p.dim_out_sel for p in dim_projections if p.dim_out_sel is not None
-            )
+    def plan(self) -> ChunkProjectionPlan:
+        """Return the projections of all chunks touched by the selection."""
+        return _projection_plan(self.dim_indexers)
 
-            yield ChunkProjection(chunk_coords, chunk_selection, out_selection)
+    def __iter__(self) -> Iterator[ChunkProjection]:
+        return iter(self.plan())
 
 
 @dataclass(frozen=True)
@@ -1174,31 +1343,37 @@ class CoordinateIndexer(Indexer):
         object.__setattr__(self, "shape", shape)
         object.__setattr__(self, "drop_axes", ())
 
-    def __iter__(self) -> Iterator[ChunkProjection]:
-        # iterate over chunks
-        for i, chunk_rix in enumerate(self.chunk_rixs):
-            chunk_coords = tuple(m[i] for m in self.chunk_mixs)
-            if chunk_rix == 0:
-                start = 0
-            else:
-                start = self.chunk_nitems_cumsum[chunk_rix - 1]
-            stop = self.chunk_nitems_cumsum[chunk_rix]
-            out_selection: slice | npt.NDArray[np.intp]
+    def batches(self, max_chunks: int) -> Iterator[ChunkBatchProjection]:
+        """Return the projections of runs of at most ``max_chunks`` consecutive chunks
+        touched by the selection."""
+        if max_chunks < 1:
+            raise ValueError("max_chunks must be at least one")
+        # the items are grouped by chunk, so the items of a run of chunks are contiguous
+        stop = 0
+        for i in range(0, len(self.chunk_rixs), max_chunks):
+            chunk_rixs = self.chunk_rixs[i : i + max_chunks]
+            start = stop
+            chunk_stops = self.chunk_nitems_cumsum[chunk_rixs]
+            stop = int(chunk_stops[-1])
+            chunk_offsets = np.concatenate(([start], chunk_stops)) - start
+            dim_chunk_ixs = [dim_mixs[i : i + max_chunks].tolist() for dim_mixs in self.chunk_mixs]
+            chunk_coords = tuple(zip(*dim_chunk_ixs, strict=True))
+            # the coordinates within a chunk are the remainders of the array coordinates
+            chunk_selection = tuple(
+                dim_sel[start:stop] % dim_chunk_len
+                for dim_sel, dim_chunk_len in zip(self.selection, self.chunk_shape, strict=True)
+            )
+            out_selection: npt.NDArray[np.intp] | slice
             if self.sel_sort is None:
                 out_selection = slice(start, stop)
             else:
                 out_selection = self.sel_sort[start:stop]
+            yield ChunkBatchProjection(chunk_coords, chunk_offsets, chunk_selection, out_selection)
 
-            chunk_offsets = tuple(
-                dim_chunk_ix * dim_chunk_len
-                for dim_chunk_ix, dim_chunk_len in zip(chunk_coords, self.chunk_shape, strict=True)
-            )
-            chunk_selection = tuple(
-                dim_sel[start:stop] - dim_chunk_offset
-                for (dim_sel, dim_chunk_offset) in zip(self.selection, chunk_offsets, strict=True)
-            )
-
-            yield ChunkProjection(chunk_coords, chunk_selection, out_selection)
+    def __iter__(self) -> Iterator[ChunkProjection]:
+        # the chunk selections are computed for many chunks at a time
+        for batch in self.batches(max_chunks=1024):
+            yield from batch.projections()
 
 
 @dataclass(frozen=True)
@@ -1345,16 +1520,58 @@ def decode_morton(z: int, chunk_shape: ChunkCoords) -> ChunkCoords:
     return tuple(out)
 
 
+def decode_morton_vectorized(
+    z: npt.NDArray[np.intp], chunk_shape: ChunkCoords
+) -> npt.NDArray[np.intp]:
+    """Decode an array of Morton codes at once, like :func:`decode_morton`.
+
+    Returns an array of shape ``(len(z), len(chunk_shape))`` with one coordinate per row.
+    """
+    bits = tuple(math.ceil(math.log2(c)) for c in chunk_shape)
+    max_coords_bits = max(bits, default=0)
+    input_bit = 0
+    out = np.zeros((len(z), len(chunk_shape)), dtype=np.intp)
+
+    for coord_bit in range(max_coords_bits):
+        for dim in range(len(chunk_shape)):
+            if coord_bit < bits[dim]:
+                out[:, dim] |= ((z >> input_bit) & 1) << coord_bit
+                input_bit += 1
+    return out
+
+
+@lru_cache(maxsize=16)
+def _morton_order(chunk_shape: ChunkCoords) -> npt.NDArray[np.intp]:
+    if product(chunk_shape) == 0:
+        return np.empty((0, len(chunk_shape)), dtype=np.intp)
+    # Morton codes below 2 ** sum(bits) decode to distinct coordinates that cover the
+    # whole (power-of-two padded) grid, so no deduplication is needed
+    nbits = sum(math.ceil(math.log2(c)) for c in chunk_shape)
+    order = decode_morton_vectorized(np.arange(2**nbits, dtype=np.intp), chunk_shape)
+    order = order[np.all(order < np.array(chunk_shape), axis=1)]
+    order.flags.writeable = False
+    return order
+
+
+@lru_cache(maxsize=16)
+def _morton_order_coords(chunk_shape: ChunkCoords) -> tuple[ChunkCoords, ...]:
+    return tuple(map(tuple, _morton_order(chunk_shape).tolist()))
+
+
+@lru_cache(maxsize=16)
+def morton_order_permutation(chunk_shape: ChunkCoords) -> npt.NDArray[np.intp]:
+    """The flat C-order indices of the chunks of ``chunk_shape``, in Morton order.
+
+    The returned array is cached per ``chunk_shape`` and read-only.
+    """
+    order = _morton_order(chunk_shape)
+    permutation: npt.NDArray[np.intp] = np.ravel_multi_index(tuple(order.T), chunk_shape)
+    permutation.flags.writeable = False
+    return permutation
+
+
 def morton_order_iter(chunk_shape: ChunkCoords) -> Iterator[ChunkCoords]:
-    i = 0
-    order: list[ChunkCoords] = []
-    while len(order) < product(chunk_shape):
-        m = decode_morton(i, chunk_shape)
-        if m not in order and all(x < y for x, y in zip(m, chunk_shape, strict=False)):
-            order.append(m)
-        i += 1
-    for j in range(product(chunk_shape)):
-        yield order[j]
+    return iter(_morton_order_coords(tuple(chunk_shape)))
 
 
 def c_order_iter(chunks_per_shard: ChunkCoords) -> Iterator[ChunkCoords]:
@@ -11,6 +11,7 @@ import numcodecs.abc
 from zarr.abc.metadata import Metadata
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
     from typing import Any, Literal, Self
 
     import numpy.typing as npt
@@ -26,7 +27,7 @@ import numpy as np
 
 from zarr.core.array_spec import ArrayConfig, ArraySpec
 from zarr.core.chunk_grids import RegularChunkGrid
-from zarr.core.chunk_key_encodings import parse_separator
+from zarr.core.chunk_key_encodings import V2ChunkKeyEncoding, parse_separator
 from zarr.core.common import JSON, ZARRAY_JSON, ZATTRS_JSON, MemoryOrder, parse_shapelike
 from zarr.core.config import config, parse_indexing_order
 from zarr.core.metadata.common import parse_attributes
@@ -212,6 +213,11 @@ class ArrayV2Metadata(Metadata):
         chunk_identifier = self.dimension_separator.join(map(str, chunk_coords))
         return "0" if chunk_identifier == "" else chunk_identifier
 
+    def encode_chunk_keys(self, dim_chunk_ixs: Sequence[Iterable[int]]) -> Iterator[str]:
+        return V2ChunkKeyEncoding(separator=self.dimension_separator).encode_chunk_keys(
+            dim_chunk_ixs
+        )
+
     def update_shape(self, shape: ChunkCoords) -> Self:
         return replace(self, shape=shape)
 
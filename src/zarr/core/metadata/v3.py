@@ -7,7 +7,7 @@ from zarr.abc.metadata import Metadata
 from zarr.core.buffer.core import default_buffer_prototype
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator
     from typing import Self
 
     from zarr.core.buffer import Buffer, BufferPrototype
@@ -387,6 +387,9 @@ class ArrayV3Metadata(Metadata):
     def encode_chunk_key(self, chunk_coords: ChunkCoords) -> str:
         return self.chunk_key_encoding.encode_chunk_key(chunk_coords)
 
+    def encode_chunk_keys(self, dim_chunk_ixs: Sequence[Iterable[int]]) -> Iterator[str]:
+        return self.chunk_key_encoding.encode_chunk_keys(dim_chunk_ixs)
+
     def to_buffer_dict(self, prototype: BufferPrototype) -> dict[str, Buffer]:
         d = _replace_special_floats(self.to_dict())
         return {ZARR_JSON: prototype.buffer.from_bytes(json.dumps(d, cls=V3JsonEncoder).encode())}
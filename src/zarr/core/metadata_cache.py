@@ -0,0 +1,113 @@
+"""
+An in-memory cache of the metadata documents read from stores, shared by all stores of
+the process.
+
+The cache is enabled by setting ``metadata_cache.ttl`` to the number of seconds for
+which metadata documents, and the absence of metadata documents, are remembered. It
+holds the documents stored under the keys ``zarr.json``, ``.zarray``, ``.zgroup``,
+``.zattrs`` and ``.zmetadata``.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from zarr.core._lru import CacheInfo, LRUCache, StoreToken, store_token
+from zarr.core.common import (
+    ZARR_JSON,
+    ZARRAY_JSON,
+    ZATTRS_JSON,
+    ZGROUP_JSON,
+    ZMETADATA_V2_JSON,
+)
+from zarr.core.config import config
+
+if TYPE_CHECKING:
+    from zarr.abc.store import Store
+    from zarr.core.buffer import Buffer, BufferPrototype
+
+__all__ = ["clear_metadata_cache", "metadata_cache_info"]
+
+_METADATA_KEYS = frozenset({ZARR_JSON, ZARRAY_JSON, ZGROUP_JSON, ZATTRS_JSON, ZMETADATA_V2_JSON})
+
+_MetadataCacheKey = tuple[StoreToken, str]
+
+# missing documents are cached as None
+_metadata_cache: LRUCache[_MetadataCacheKey, Buffer | None] = LRUCache(
+    0,
+    sizeof=lambda value: 64 + (0 if value is None else len(value)),
+    # the documents are looked up by store, for invalidation
+    groups=lambda key: ((key[0],),),
+)
+
+
+def _is_metadata_key(key: str) -> bool:
+    return key.rpartition("/")[2] in _METADATA_KEYS
+
+
+def _get_metadata_cache() -> LRUCache[_MetadataCacheKey, Buffer | None] | None:
+    ttl = config.get("metadata_cache.ttl", 0)
+    if ttl <= 0:
+        return None
+    max_nbytes = config.get("metadata_cache.size")
+    if max_nbytes != _metadata_cache.max_nbytes:
+        _metadata_cache.resize(max_nbytes)
+    _metadata_cache.ttl = ttl
+    return _metadata_cache
+
+
+async def _get_metadata(store: Store, key: str, prototype: BufferPrototype) -> Buffer | None:
+    """Read the metadata document ``key`` from ``store``, through the cache if it is
+    enabled."""
+    cache = _get_metadata_cache()
+    if cache is None:
+        return await store.get(key, prototype=prototype)
+    cache_key = (cache.track_store(store), key)
+    value = cache.get(cache_key)
+    if value is not None:
+        return prototype.buffer.from_buffer(value)
+    if cache_key in cache:
+        # a cached missing document
+        return None
+    generation = cache.generation
+    value = await store.get(key, prototype=prototype)
+    cache.set(cache_key, value, generation)
+    return value
+
+
+def _invalidate_metadata(store: Store, key: str, *, prefix: bool = False) -> None:
+    """Remove the metadata document ``key`` of ``store`` from the cache, or all
+    documents in the directory ``key`` if ``prefix`` is True."""
+    token = store_token(store)
+    if not prefix:
+        _metadata_cache.pop((token, key))
+    else:
+        directory = key.rstrip("/") + "/" if key.rstrip("/") else ""
+        _metadata_cache.pop_matching(
+            lambda cache_key: cache_key[1].startswith(directory), group=(token,)
+        )
+
+
+def metadata_cache_info() -> CacheInfo:
+    """
+    Return the statistics of the metadata cache.
+
+    The cache is enabled by setting ``metadata_cache.ttl`` to the number of seconds for
+    which metadata documents are remembered.
+
+    Returns
+    -------
+    CacheInfo
+    """
+    return _metadata_cache.info()
+
+
+def clear_metadata_cache() -> None:
+    """
+    Remove all entries from the metadata cache and reset its statistics.
+
+    The cache is only invalidated by writes through Zarr arrays, groups and store paths
+    in this process. Call this function after metadata was modified by other means,
+    instead of waiting for the cached documents to expire.
+    """
+    _metadata_cache.clear()
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import asyncio
 import atexit
+import functools
 import logging
+import multiprocessing
 import threading
-from concurrent.futures import ThreadPoolExecutor, wait
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait
 from typing import TYPE_CHECKING, TypeVar
 
 from typing_extensions import ParamSpec
@@ -12,7 +14,7 @@ from typing_extensions import ParamSpec
 from zarr.core.config import config
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Coroutine
+    from collections.abc import AsyncIterator, Callable, Coroutine
     from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -29,6 +31,9 @@ loop: list[asyncio.AbstractEventLoop | None] = [
 ]  # global event loop for any non-async instance
 _lock: threading.Lock | None = None  # global lock placeholder
 _executor: ThreadPoolExecutor | None = None  # global executor placeholder
+_process_executor: ProcessPoolExecutor | None = None  # global codec process pool placeholder
+
+CODEC_EXECUTORS = ("thread", "process", "inline")
 
 
 class SyncError(Exception):
@@ -60,12 +65,68 @@ def _get_executor() -> ThreadPoolExecutor:
     return _executor
 
 
+def _get_process_executor() -> ProcessPoolExecutor:
+    """Return Zarr Process Pool Executor used for codec work
+
+    The executor is allocated on first use. Worker processes are started with the
+    ``spawn`` method, so they do not inherit the event loop thread of this process.
+    """
+    global _process_executor
+    if not _process_executor:
+        max_workers = config.get("threading.max_workers", None)
+        logger.debug("Creating Zarr ProcessPoolExecutor with max_workers=%s", max_workers)
+        _process_executor = ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+        )
+    return _process_executor
+
+
+async def run_codec_function(func: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+    """Run a CPU-bound codec function on the configured codec executor.
+
+    The executor is selected with the ``codec_pipeline.executor`` config value:
+
+    - ``"thread"`` runs ``func`` in the Zarr thread pool (the default),
+    - ``"process"`` runs ``func`` in a pool of worker processes, which sidesteps the GIL
+      for codecs that hold it. ``func`` and its arguments must be picklable,
+    - ``"inline"`` runs ``func`` directly on the event loop.
+
+    Parameters
+    ----------
+    func : Callable
+        The function to run.
+    *args, **kwargs
+        Arguments passed to ``func``.
+
+    Returns
+    -------
+    The return value of ``func``.
+    """
+    executor = config.get("codec_pipeline.executor", "thread")
+    if executor == "thread":
+        return await asyncio.to_thread(func, *args, **kwargs)
+    if executor == "process":
+        return await asyncio.get_running_loop().run_in_executor(
+            _get_process_executor(), functools.partial(func, *args, **kwargs)
+        )
+    if executor == "inline":
+        return func(*args, **kwargs)
+    raise ValueError(
+        f"Invalid value for codec_pipeline.executor: {executor!r}. "
+        f"Expected one of {CODEC_EXECUTORS}."
+    )
+
+
 def cleanup_resources() -> None:
-    global _executor
+    global _executor, _process_executor
     if _executor:
         _executor.shutdown(wait=True, cancel_futures=True)
     _executor = None
 
+    if _process_executor:
+        _process_executor.shutdown(wait=True, cancel_futures=True)
+    _process_executor = None
+
     if loop[0] is not None:
         with _get_lock():
             # Stop the event loop safely
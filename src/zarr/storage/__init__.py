@@ -3,6 +3,7 @@ import warnings
 from types import ModuleType
 from typing import Any
 
+from zarr.storage._caching import CachingStore
 from zarr.storage._common import StoreLike, StorePath
 from zarr.storage._fsspec import FsspecStore
 from zarr.storage._local import LocalStore
@@ -12,6 +13,7 @@ from zarr.storage._wrapper import WrapperStore
 from zarr.storage._zip import ZipStore
 
 __all__ = [
+    "CachingStore",
     "FsspecStore",
     "GpuMemoryStore",
     "LocalStore",
@@ -0,0 +1,437 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from zarr.abc.store import OffsetByteRequest, RangeByteRequest, Store, SuffixByteRequest
+from zarr.core._lru import CacheInfo, LRUCache
+from zarr.storage._wrapper import WrapperStore
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from types import TracebackType
+    from typing import Self
+
+    from zarr.abc.store import ByteRequest
+    from zarr.core.buffer import Buffer, BufferPrototype
+    from zarr.core.common import BytesLike
+
+# the prefix of the names of the files of cached values, in the directory of their key
+_RANGE_PREFIX = "#"
+
+
+def _byte_range_token(byte_range: ByteRequest | None) -> str:
+    if byte_range is None:
+        return "full"
+    elif isinstance(byte_range, RangeByteRequest):
+        return f"range-{byte_range.start}-{byte_range.end}"
+    elif isinstance(byte_range, OffsetByteRequest):
+        return f"offset-{byte_range.offset}"
+    elif isinstance(byte_range, SuffixByteRequest):
+        return f"suffix-{byte_range.suffix}"
+    else:
+        raise TypeError(f"Unexpected byte_range, got {byte_range}.")
+
+
+def _write_file(path: Path, value: Buffer) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(value.as_buffer_like())
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _remove_files(paths: Iterable[Path]) -> None:
+    for path in paths:
+        path.unlink(missing_ok=True)
+
+
+def _remove_cached_files(directories: Iterable[Path]) -> None:
+    """Remove the cached values in each of ``directories``, but not its subdirectories."""
+    for directory in directories:
+        _remove_files(directory.glob(f"{_RANGE_PREFIX}*"))
+
+
+def _key_groups(key: str) -> list[tuple[str, str]]:
+    """Return the groups of the cache entries of ``key``: the key itself, and every
+    directory that contains it."""
+    groups = [("key", key), ("dir", "")]
+    groups.extend(("dir", key[: i + 1]) for i, char in enumerate(key) if char == "/")
+    return groups
+
+
+def _scan_cache_dir(root: Path) -> list[tuple[str, int]]:
+    """Return the cached files below ``root`` with their sizes, least recently used
+    first."""
+    files = []
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            if filename.startswith(_RANGE_PREFIX):
+                path = Path(dirpath, filename)
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                files.append((stat.st_mtime, path.relative_to(root).as_posix(), stat.st_size))
+    files.sort()
+    return [(name, size) for _, name, size in files]
+
+
+class CachingStore(WrapperStore[Store]):
+    """
+    Store wrapper that caches the values read from the wrapped store in memory, and
+    optionally in a local directory.
+
+    Both tiers are least-recently-used caches bounded by a number of bytes. Byte range
+    requests are cached separately from whole values. Values read from the wrapped store
+    are written to the on-disk cache by a background thread, which ``close`` waits for.
+    Writes and deletes go to the wrapped store and invalidate the cached values of the
+    modified keys.
+
+    Parameters
+    ----------
+    store : Store
+        Store to wrap, typically a slow remote store.
+    max_memory : int
+        Capacity of the in-memory cache, in bytes. 0 disables it.
+    cache_dir : str or Path, optional
+        Directory of the on-disk cache. It can be shared by several processes, and
+        values cached by earlier processes are reused.
+    max_disk : int
+        Capacity of the on-disk cache, in bytes.
+
+    Notes
+    -----
+    Changes made to the wrapped store by other means than this store are not detected,
+    so cached values may be stale for stores that are modified concurrently.
+    """
+
+    max_memory: int
+    cache_dir: Path | None
+    max_disk: int
+
+    def __init__(
+        self,
+        store: Store,
+        *,
+        max_memory: int = 2**28,
+        cache_dir: str | Path | None = None,
+        max_disk: int = 2**33,
+    ) -> None:
+        super().__init__(store)
+        self.max_memory = max_memory
+        self.max_disk = max_disk
+        # entries are grouped by key and by directory, so that invalidations do not scan
+        # the whole cache
+        self._memory_cache: LRUCache[tuple[str, str], Buffer] = LRUCache(
+            max_memory, sizeof=len, groups=lambda cache_key: _key_groups(cache_key[0])
+        )
+        self._disk_cache: LRUCache[str, int] | None = None
+        # the files of the entries evicted from the disk cache, to be removed
+        self._evicted: list[Path] = []
+        self._disk_cache_loaded = False
+        # the thread writing the values read from the wrapped store to the disk cache
+        self._disk_writer: ThreadPoolExecutor | None = None
+        # taken to modify the disk cache, so that a value written to disk is only cached if
+        # its key was not modified since it was read, and to load the disk cache once
+        self._disk_lock = threading.Lock()
+        self._disk_load_lock = threading.Lock()
+        if cache_dir is None:
+            self.cache_dir = None
+        else:
+            # values of different stores are cached in different directories
+            store_token = hashlib.sha1(str(store).encode(), usedforsecurity=False).hexdigest()
+            self.cache_dir = Path(cache_dir) / store_token
+            self._disk_cache = LRUCache(
+                max_disk,
+                sizeof=lambda nbytes: nbytes,
+                on_evict=lambda name, _: self._evicted.append(self._disk_path(name)),
+                groups=lambda name: _key_groups(name.rpartition("/")[0]),
+            )
+
+    def __str__(self) -> str:
+        return f"caching-{self._store}"
+
+    def __repr__(self) -> str:
+        return f"CachingStore({self._store!r})"
+
+    def __eq__(self, value: object) -> bool:
+        return isinstance(value, type(self)) and self.__getstate__() == value.__getstate__()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # the cached values are not pickled, only the configuration of the caches
+        return {
+            "store": self._store,
+            "max_memory": self.max_memory,
+            "cache_dir": None if self.cache_dir is None else self.cache_dir.parent,
+            "max_disk": self.max_disk,
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__(**state)  # type: ignore[misc]
+
+    def __enter__(self) -> Self:
+        self._store.__enter__()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        # docstring inherited
+        # the values being written to the disk cache are written before the store is closed
+        if self._disk_writer is not None:
+            self._disk_writer.shutdown(wait=True)
+            self._disk_writer = None
+        super().close()
+
+    def cache_info(self) -> dict[str, CacheInfo]:
+        """
+        Return the statistics of the in-memory cache, and of the on-disk cache if it is
+        enabled.
+
+        The values cached on disk by earlier processes are accounted for once this store
+        first reads or writes its cache directory.
+
+        Returns
+        -------
+        dict
+            ``CacheInfo`` under the keys ``"memory"`` and ``"disk"``.
+        """
+        info: dict[str, CacheInfo] = {"memory": self._memory_cache.info()}
+        if self._disk_cache is not None:
+            info["disk"] = self._disk_cache.info()
+        return info
+
+    def _disk_path(self, name: str) -> Path:
+        assert self.cache_dir is not None
+        return self.cache_dir / name
+
+    def _remove_evicted(self) -> None:
+        """Remove the files of the entries evicted from the disk cache."""
+        with self._disk_lock:
+            evicted, self._evicted = self._evicted, []
+        _remove_files(evicted)
+
+    def _load_disk_cache(self) -> None:
+        """Account for the values cached in the cache directory by earlier processes."""
+        assert self._disk_cache is not None
+        assert self.cache_dir is not None
+        with self._disk_load_lock:
+            if self._disk_cache_loaded:
+                return
+            files = _scan_cache_dir(self.cache_dir)
+            with self._disk_lock:
+                for name, nbytes in files:
+                    # values cached by this process while scanning are more recent
+                    if name not in self._disk_cache:
+                        self._disk_cache.set(name, nbytes)
+                self._disk_cache_loaded = True
+        self._remove_evicted()
+
+    async def _flush_disk_writes(self) -> None:
+        """Wait for the values being written to the disk cache."""
+        if self._disk_writer is not None:
+            # the writes run in order, so this runs once the pending writes are done
+            await asyncio.wrap_future(self._disk_writer.submit(lambda: None))
+
+    async def _invalidate_keys(self, keys: Iterable[str]) -> None:
+        """Remove the cached values of ``keys``."""
+        # the invalidations of both tiers are counted by the generation of the memory cache
+        keys = set(keys)
+        with self._disk_lock:
+            for key in keys:
+                self._memory_cache.pop_group(("key", key))
+                if self._disk_cache is not None:
+                    self._disk_cache.pop_group(("key", key))
+        if self._disk_cache is not None:
+            # the values of a key are files in the directory named after the key
+            await asyncio.to_thread(_remove_cached_files, [self._disk_path(key) for key in keys])
+
+    async def _invalidate_prefix(self, prefix: str) -> None:
+        """Remove the cached values of all keys in the directory ``prefix``."""
+        prefix = prefix.rstrip("/")
+        directory = prefix + "/" if prefix else ""
+        with self._disk_lock:
+            self._memory_cache.pop_group(("dir", directory))
+            if self._disk_cache is not None:
+                self._disk_cache.pop_group(("dir", directory))
+        if self._disk_cache is not None:
+            await asyncio.to_thread(shutil.rmtree, self._disk_path(prefix), ignore_errors=True)
+
+    async def _read_disk(self, name: str, prototype: BufferPrototype) -> Buffer | None:
+        if self._disk_cache is None:
+            return None
+        if not self._disk_cache_loaded:
+            await asyncio.to_thread(self._load_disk_cache)
+        path = self._disk_path(name)
+        try:
+            data = await asyncio.to_thread(path.read_bytes)
+        except FileNotFoundError:
+            self._disk_cache.get(name)  # record the miss
+            with self._disk_lock:
+                self._disk_cache.pop(name)
+            return None
+        # files cached by other processes are not known to this process yet
+        if self._disk_cache.get(name) is None:
+            with self._disk_lock:
+                self._disk_cache.set(name, len(data))
+            if self._evicted:
+                await asyncio.to_thread(self._remove_evicted)
+        await asyncio.to_thread(os.utime, path)
+        return prototype.buffer.from_bytes(data)
+
+    def _write_disk(self, name: str, value: Buffer, generation: int) -> None:
+        """Write a value read from the wrapped store to the disk cache, in the thread of
+        the disk writer."""
+        assert self._disk_cache is not None
+        self._load_disk_cache()
+        path = self._disk_path(name)
+        _write_file(path, value)
+        with self._disk_lock:
+            # the key was modified while its value was written
+            stale = generation != self._memory_cache.generation
+            if not stale:
+                self._disk_cache.set(name, len(value))
+        if stale:
+            path.unlink(missing_ok=True)
+        self._remove_evicted()
+
+    def _cache(self, key: str, token: str, value: Buffer, generation: int) -> None:
+        """Cache a value read from the wrapped store, writing it to disk in the
+        background."""
+        if generation != self._memory_cache.generation:
+            return
+        self._memory_cache.set((key, token), value, generation)
+        if self._disk_cache is not None and len(value) <= self.max_disk:
+            if self._disk_writer is None:
+                # one thread writes the values in the order in which they were read
+                self._disk_writer = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="zarr-caching-store"
+                )
+            self._disk_writer.submit(
+                self._write_disk, f"{key}/{_RANGE_PREFIX}{token}", value, generation
+            )
+
+    async def get(
+        self,
+        key: str,
+        prototype: BufferPrototype,
+        byte_range: ByteRequest | None = None,
+    ) -> Buffer | None:
+        # docstring inherited
+        token = _byte_range_token(byte_range)
+        value = self._memory_cache.get((key, token))
+        if value is not None:
+            return prototype.buffer.from_buffer(value)
+        name = f"{key}/{_RANGE_PREFIX}{token}"
+        value = await self._read_disk(name, prototype)
+        if value is not None:
+            self._memory_cache.set((key, token), value)
+            return value
+
+        generation = self._memory_cache.generation
+        value = await self._store.get(key, prototype, byte_range)
+        if value is not None:
+            self._cache(key, token, value, generation)
+        return value
+
+    async def get_partial_values(
+        self,
+        prototype: BufferPrototype,
+        key_ranges: Iterable[tuple[str, ByteRequest | None]],
+    ) -> list[Buffer | None]:
+        # docstring inherited
+        key_ranges = list(key_ranges)
+        out: list[Buffer | None] = [None] * len(key_ranges)
+        misses = []
+        for i, (key, byte_range) in enumerate(key_ranges):
+            token = _byte_range_token(byte_range)
+            value = self._memory_cache.get((key, token))
+            if value is None:
+                value = await self._read_disk(f"{key}/{_RANGE_PREFIX}{token}", prototype)
+                if value is not None:
+                    self._memory_cache.set((key, token), value)
+            if value is None:
+                misses.append(i)
+            else:
+                out[i] = prototype.buffer.from_buffer(value)
+        if not misses:
+            return out
+
+        generation = self._memory_cache.generation
+        values = await self._store.get_partial_values(prototype, [key_ranges[i] for i in misses])
+        for i, value in zip(misses, values, strict=True):
+            out[i] = value
+            if value is not None:
+                key, byte_range = key_ranges[i]
+                self._cache(key, _byte_range_token(byte_range), value, generation)
+        return out
+
+    async def clear(self) -> None:
+        # docstring inherited
+        try:
+            await self._store.clear()
+        finally:
+            await self._invalidate_prefix("")
+
+    async def set(self, key: str, value: Buffer) -> None:
+        # docstring inherited
+        try:
+            await self._store.set(key, value)
+        finally:
+            await self._invalidate_keys([key])
+
+    async def set_if_not_exists(self, key: str, value: Buffer) -> None:
+        # docstring inherited
+        try:
+            await self._store.set_if_not_exists(key, value)
+        finally:
+            await self._invalidate_keys([key])
+
+    async def _set_many(self, values: Iterable[tuple[str, Buffer]]) -> None:
+        values = list(values)
+        try:
+            await self._store._set_many(values)
+        finally:
+            await self._invalidate_keys(key for key, _ in values)
+
+    async def delete(self, key: str) -> None:
+        # docstring inherited
+        try:
+            await self._store.delete(key)
+        finally:
+            await self._invalidate_keys([key])
+
+    async def set_partial_values(
+        self, key_start_values: Iterable[tuple[str, int, BytesLike]]
+    ) -> None:
+        # docstring inherited
+        key_start_values = list(key_start_values)
+        try:
+            await self._store.set_partial_values(key_start_values)
+        finally:
+            await self._invalidate_keys(key for key, _, _ in key_start_values)
+
+    async def delete_dir(self, prefix: str) -> None:
+        # docstring inherited
+        try:
+            await self._store.delete_dir(prefix)
+        finally:
+            await self._invalidate_prefix(prefix)
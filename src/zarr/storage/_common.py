@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Any, Literal
 from zarr.abc.store import ByteRequest, Store
 from zarr.core.buffer import Buffer, default_buffer_prototype
 from zarr.core.common import ZARR_JSON, ZARRAY_JSON, ZGROUP_JSON, AccessModeLiteral, ZarrFormat
+from zarr.core.metadata_cache import _get_metadata, _invalidate_metadata, _is_metadata_key
 from zarr.errors import ContainsArrayAndGroupError, ContainsArrayError, ContainsGroupError
 from zarr.storage._local import LocalStore
 from zarr.storage._memory import MemoryStore
@@ -24,6 +25,19 @@ def _dereference_path(root: str, path: str) -> str:
     return path.rstrip("/")
 
 
+def _invalidate_chunk_caches(store: Store, key: str, *, prefix: bool = False) -> None:
+    """Remove what the process caches about the chunk ``key`` of ``store``, or about all
+    chunks in the directory ``key`` if ``prefix`` is True."""
+    # imported here because the sharding codec and the codec pipeline depend on StorePath
+    from zarr.codecs.sharding import _invalidate_shard_indexes
+    from zarr.core.chunk_cache import _invalidate_chunks_in_dir
+
+    _invalidate_shard_indexes(store, key, prefix=prefix)
+    if prefix:
+        # decoded chunks are cached by array, and arrays are deleted as directories
+        _invalidate_chunks_in_dir(store, key)
+
+
 class StorePath:
     """
     Path-like interface for a Store.
@@ -121,6 +135,8 @@ class StorePath:
         """
         if prototype is None:
             prototype = default_buffer_prototype()
+        if byte_range is None and _is_metadata_key(self.path):
+            return await _get_metadata(self.store, self.path, prototype=prototype)
         return await self.store.get(self.path, prototype=prototype, byte_range=byte_range)
 
     async def set(self, value: Buffer, byte_range: ByteRequest | None = None) -> None:
@@ -141,7 +157,13 @@ class StorePath:
         """
         if byte_range is not None:
             raise NotImplementedError("Store.set does not have partial writes yet")
-        await self.store.set(self.path, value)
+        try:
+            await self.store.set(self.path, value)
+        finally:
+            if _is_metadata_key(self.path):
+                _invalidate_metadata(self.store, self.path)
+            else:
+                _invalidate_chunk_caches(self.store, self.path)
 
     async def delete(self) -> None:
         """
@@ -152,13 +174,23 @@ class StorePath:
         NotImplementedError
             If the store does not support deletion.
         """
-        await self.store.delete(self.path)
+        try:
+            await self.store.delete(self.path)
+        finally:
+            if _is_metadata_key(self.path):
+                _invalidate_metadata(self.store, self.path)
+            else:
+                _invalidate_chunk_caches(self.store, self.path)
 
     async def delete_dir(self) -> None:
         """
         Delete all keys with the given prefix from the store.
         """
-        await self.store.delete_dir(self.path)
+        try:
+            await self.store.delete_dir(self.path)
+        finally:
+            _invalidate_metadata(self.store, self.path, prefix=True)
+            _invalidate_chunk_caches(self.store, self.path, prefix=True)
 
     async def set_if_not_exists(self, default: Buffer) -> None:
         """
@@ -169,7 +201,13 @@ class StorePath:
         default : Buffer
             The buffer to store if the key is not already present.
         """
-        await self.store.set_if_not_exists(self.path, default)
+        try:
+            await self.store.set_if_not_exists(self.path, default)
+        finally:
+            if _is_metadata_key(self.path):
+                _invalidate_metadata(self.store, self.path)
+            else:
+                _invalidate_chunk_caches(self.store, self.path)
 
     async def exists(self) -> bool:
         """
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import warnings
+from collections import defaultdict
+from itertools import islice
 from typing import TYPE_CHECKING, Any
 
 from zarr.abc.store import (
@@ -10,10 +12,11 @@ from zarr.abc.store import (
     Store,
     SuffixByteRequest,
 )
+from zarr.core.config import config
 from zarr.storage._common import _dereference_path
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Iterable
+    from collections.abc import AsyncGenerator, AsyncIterator, Iterable
 
     from fsspec.asyn import AsyncFileSystem
 
@@ -257,6 +260,7 @@ class FsspecStore(Store):
         # write data
         if byte_range:
             raise NotImplementedError
+        # not `value.as_buffer_like()`: clients such as botocore only accept `bytes` payloads
         await self.fs._pipe_file(path, value.to_bytes())
 
     async def delete(self, key: str) -> None:
@@ -316,6 +320,25 @@ class FsspecStore(Store):
 
         return [None if isinstance(r, Exception) else prototype.buffer.from_bytes(r) for r in res]
 
+    async def get_many(
+        self, requests: Iterable[tuple[str, BufferPrototype, ByteRequest | None]]
+    ) -> AsyncGenerator[tuple[str, Buffer | None], None]:
+        # docstring inherited
+        if not self._is_open:
+            await self._open()
+        # each batch of requests is read by a single call to _cat_ranges, which lets the
+        # file system combine them
+        requests = iter(requests)
+        while batch := list(islice(requests, config.get("async.concurrency"))):
+            key_ranges: defaultdict[BufferPrototype, list[tuple[str, ByteRequest | None]]]
+            key_ranges = defaultdict(list)
+            for key, prototype, byte_range in batch:
+                key_ranges[prototype].append((key, byte_range))
+            for prototype, prototype_key_ranges in key_ranges.items():
+                values = await self.get_partial_values(prototype, prototype_key_ranges)
+                for (key, _), value in zip(prototype_key_ranges, values, strict=True):
+                    yield key, value
+
     async def set_partial_values(
         self, key_start_values: Iterable[tuple[str, int, BytesLike]]
     ) -> None:
@@ -357,3 +380,15 @@ class FsspecStore(Store):
         else:
             # fsspec doesn't have typing. We'll need to assume or verify this is true
             return int(size)
+
+    async def getsize_prefix(self, prefix: str) -> int:
+        # docstring inherited
+        # the file system returns the sizes of the files with their listing
+        infos = await self.fs._find(
+            f"{self.path}/{prefix}", detail=True, maxdepth=None, withdirs=False
+        )
+        sizes = [info.get("size") for info in infos.values()]
+        if any(size is None for size in sizes):
+            # Not all filesystems support size. Fall back to querying each key
+            return await super().getsize_prefix(prefix)
+        return sum(int(size) for size in sizes)
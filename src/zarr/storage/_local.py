@@ -1,9 +1,17 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import functools
 import io
+import itertools
+import mmap
 import os
 import shutil
+import tempfile
+import threading
+import time
+from collections import defaultdict
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -17,11 +25,14 @@ from zarr.abc.store import (
 from zarr.core.buffer import Buffer
 from zarr.core.buffer.core import default_buffer_prototype
 from zarr.core.common import concurrent_map
+from zarr.core.config import config
+from zarr.storage._utils import _byte_range_bounds
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Iterable
+    from collections.abc import AsyncIterator, Callable, Generator, Iterable, Iterator
 
     from zarr.core.buffer import BufferPrototype
+    from zarr.core.common import BytesLike
 
 
 def _get(path: Path, prototype: BufferPrototype, byte_range: ByteRequest | None) -> Buffer:
@@ -41,26 +52,242 @@ def _get(path: Path, prototype: BufferPrototype, byte_range: ByteRequest | None)
         return prototype.buffer.from_bytes(f.read())
 
 
+def _map(path: Path) -> memoryview:
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # empty files cannot be mapped
+            return memoryview(b"")
+        # the mapping stays valid after the file is closed, and is released once the last
+        # buffer viewing it is garbage collected
+        return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+def _get_mmap(path: Path, prototype: BufferPrototype, byte_range: ByteRequest | None) -> Buffer:
+    view = _map(path)
+    start, stop = _byte_range_bounds(byte_range, len(view))
+    return prototype.buffer.from_bytes(view[start:stop])
+
+
+def _pread(fd: int, start: int, stop: int) -> bytes:
+    data = os.pread(fd, stop - start, start)
+    if len(data) == stop - start:
+        return data
+    # short reads are rare for regular files, but allowed
+    chunks = [data]
+    start += len(data)
+    while start < stop and (data := os.pread(fd, stop - start, start)):
+        chunks.append(data)
+        start += len(data)
+    return b"".join(chunks)
+
+
+def _seek_read(f: io.RawIOBase, start: int, stop: int) -> bytes | memoryview:
+    # used where os.pread is not available, e.g. on Windows
+    f.seek(start)
+    view = memoryview(bytearray(stop - start))
+    nread = 0
+    while nread < len(view) and (n := f.readinto(view[nread:])):
+        nread += n
+    return view[:nread]
+
+
+def _get_ranges(
+    path: Path,
+    prototype: BufferPrototype,
+    byte_ranges: list[ByteRequest | None],
+    use_mmap: bool = False,
+) -> list[Buffer | None]:
+    """Read several byte ranges of one file, opening it only once.
+
+    Adjacent and overlapping ranges are served by a single read. Returns ``None`` for
+    every range if the file does not exist.
+    """
+    try:
+        if use_mmap:
+            view = _map(path)
+            bounds = [_byte_range_bounds(byte_range, len(view)) for byte_range in byte_ranges]
+            return [prototype.buffer.from_bytes(view[start:stop]) for start, stop in bounds]
+        with path.open("rb", buffering=0) as f:
+            fd = f.fileno()
+            read: Callable[[int, int], bytes | memoryview] = (
+                functools.partial(_pread, fd)
+                if hasattr(os, "pread")
+                else functools.partial(_seek_read, f)
+            )
+            size = os.fstat(fd).st_size
+            bounds = [_byte_range_bounds(byte_range, size) for byte_range in byte_ranges]
+            out: list[Buffer | None] = [None] * len(bounds)
+            order = sorted(range(len(bounds)), key=lambda i: bounds[i])
+            while order:
+                # coalesce the following ranges that start before the read ends
+                group_start, group_stop = bounds[order[0]]
+                n = 1
+                while n < len(order) and bounds[order[n]][0] <= group_stop:
+                    group_stop = max(group_stop, bounds[order[n]][1])
+                    n += 1
+                data = memoryview(read(group_start, group_stop))
+                for i in order[:n]:
+                    start, stop = bounds[i]
+                    out[i] = prototype.buffer.from_bytes(
+                        data[start - group_start : stop - group_start]
+                    )
+                order = order[n:]
+            return out
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+        return [None] * len(byte_ranges)
+
+
 def _put(
     path: Path,
     value: Buffer,
-    start: int | None = None,
     exclusive: bool = False,
-) -> int | None:
+    replace_in: Path | None = None,
+) -> int:
     path.parent.mkdir(parents=True, exist_ok=True)
-    if start is not None:
-        with path.open("r+b") as f:
-            f.seek(start)
-            f.write(value.as_numpy_array().tobytes())
-        return None
+    if replace_in is not None and not exclusive:
+        return _replace(replace_in, path, value)
+    view = value.as_buffer_like()
+    if exclusive:
+        mode = "xb"
     else:
-        view = memoryview(value.as_numpy_array().tobytes())
-        if exclusive:
-            mode = "xb"
-        else:
-            mode = "wb"
-        with path.open(mode=mode) as f:
-            return f.write(view)
+        mode = "wb"
+    with path.open(mode=mode) as f:
+        return f.write(view)
+
+
+def _put_partial(
+    path: Path,
+    start_values: list[tuple[int, BytesLike]],
+    replace_in: Path | None = None,
+) -> None:
+    """Write several values into one existing file, in the order given."""
+    if replace_in is None:
+        with path.open("r+b") as f:
+            for start, value in start_values:
+                f.seek(start)
+                f.write(value)
+        return
+    # Memory-mapping stores patch a copy of the file and move it over ``path``, like
+    # whole-value writes, so that buffers that were read before are never modified.
+    data = bytearray(path.read_bytes())
+    for start, value in start_values:
+        view = memoryview(value).cast("B")
+        if start > len(data):
+            # like writing past the end of a file, leave a gap of zeros
+            data.extend(bytes(start - len(data)))
+        data[start : start + len(view)] = view
+    _replace(replace_in, path, data)
+
+
+# Whole-value writes of memory-mapping stores go through temporary files in this
+# directory of the store root. It is not part of the store's namespace and never listed.
+_TMP_DIR = ".zarr-tmp"
+# temporary files that were not modified for this long were left behind by a crash
+_STALE_TMP_SECONDS = 3600
+
+
+def _replace(root: Path, path: Path, value: Buffer | BytesLike) -> int:
+    # Write to a temporary file and move it over ``path``, so that memory maps of the
+    # previous file keep seeing its full contents. Truncating a mapped file would make
+    # reads of the mapped memory fail with SIGBUS.
+    tmp_dir = root / _TMP_DIR
+    tmp_dir.mkdir(exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=tmp_dir, prefix=f"{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            nbytes = f.write(value.as_buffer_like() if isinstance(value, Buffer) else value)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return nbytes
+
+
+def _remove_stale_tmp_files(root: Path) -> None:
+    """Remove the temporary files of writes that were interrupted by a crash."""
+    cutoff = time.time() - _STALE_TMP_SECONDS
+    try:
+        with os.scandir(root / _TMP_DIR) as it:
+            for entry in it:
+                with contextlib.suppress(FileNotFoundError):
+                    if entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+
+
+def _walk(root: Path, prefix: str) -> Iterator[tuple[str, os.DirEntry[str]]]:
+    """Yield the keys of all files below ``root / prefix``, relative to ``root``, with
+    their directory entries.
+
+    Like ``Path.rglob``, symbolic links to files are listed, but symbolic links to
+    directories are not followed.
+    """
+    if prefix.partition("/")[0] == _TMP_DIR:
+        return
+    stack = [prefix]
+    while stack:
+        dir_key = stack.pop()
+        try:
+            with os.scandir(root / dir_key) as it:
+                for entry in it:
+                    if not dir_key and entry.name == _TMP_DIR:
+                        continue
+                    key = f"{dir_key}/{entry.name}" if dir_key else entry.name
+                    # DirEntry caches the file type, so this does not stat every file
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(key)
+                    elif entry.is_file():
+                        yield key, entry
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+
+
+def _walk_keys(root: Path, prefix: str) -> Generator[str, None, None]:
+    for key, _ in _walk(root, prefix):
+        yield key
+
+
+def _sum_sizes(root: Path, prefix: str) -> int:
+    """Return the total size of all files below ``root / prefix``."""
+    nbytes = 0
+    for _, entry in _walk(root, prefix):
+        # files deleted while walking are skipped
+        with contextlib.suppress(FileNotFoundError):
+            nbytes += entry.stat().st_size
+    return nbytes
+
+
+def _next_batch(keys: Iterator[str], stop: threading.Event, size: int = 1000) -> list[str]:
+    batch = []
+    for key in keys:
+        batch.append(key)
+        if len(batch) == size or stop.is_set():
+            break
+    return batch
+
+
+async def _iter_in_thread(keys: Generator[str, None, None]) -> AsyncIterator[str]:
+    """Iterate over a blocking generator of keys in batches, in a worker thread.
+
+    The next batch is read while the current one is consumed. If the iteration stops
+    early, the worker thread stops reading and the generator is closed, which releases
+    the directories that it holds open.
+    """
+    stop = threading.Event()
+    # the reads are shielded from cancellation, because the worker thread cannot be
+    # interrupted and the generator must not be closed while the thread is using it
+    pending = asyncio.ensure_future(asyncio.to_thread(_next_batch, keys, stop))
+    try:
+        while batch := await asyncio.shield(pending):
+            pending = asyncio.ensure_future(asyncio.to_thread(_next_batch, keys, stop))
+            for key in batch:
+                yield key
+    finally:
+        stop.set()
+        with contextlib.suppress(Exception):
+            await pending
+        keys.close()
 
 
 class LocalStore(Store):
@@ -73,6 +300,13 @@ class LocalStore(Store):
         Directory to use as root of store.
     read_only : bool
         Whether the store is read-only
+    mmap : bool
+        Whether to read files through memory maps instead of copying their contents.
+        Buffers returned by ``get`` are then read-only views of the mapped files, and
+        range requests are slices of the mapping. Writes, including partial writes,
+        replace files instead of modifying them in place, so buffers that were read
+        before stay valid and unchanged. Files must not be truncated by other writers
+        while they are mapped.
 
     Attributes
     ----------
@@ -81,6 +315,7 @@ class LocalStore(Store):
     supports_partial_writes
     supports_listing
     root
+    mmap
     """
 
     supports_writes: bool = True
@@ -89,8 +324,9 @@ class LocalStore(Store):
     supports_listing: bool = True
 
     root: Path
+    mmap: bool
 
-    def __init__(self, root: Path | str, *, read_only: bool = False) -> None:
+    def __init__(self, root: Path | str, *, read_only: bool = False, mmap: bool = False) -> None:
         super().__init__(read_only=read_only)
         if isinstance(root, str):
             root = Path(root)
@@ -99,10 +335,12 @@ class LocalStore(Store):
                 f'"root" must be a string or Path instance. Got an object with type {type(root)} instead.'
             )
         self.root = root
+        self.mmap = mmap
 
     async def _open(self) -> None:
         if not self.read_only:
             self.root.mkdir(parents=True, exist_ok=True)
+            await asyncio.to_thread(_remove_stale_tmp_files, self.root)
         return await super()._open()
 
     async def clear(self) -> None:
@@ -120,6 +358,10 @@ class LocalStore(Store):
     def __eq__(self, other: object) -> bool:
         return isinstance(other, type(self)) and self.root == other.root
 
+    @property
+    def _get_fn(self) -> Callable[[Path, BufferPrototype, ByteRequest | None], Buffer]:
+        return _get_mmap if self.mmap else _get
+
     async def get(
         self,
         key: str,
@@ -135,7 +377,7 @@ class LocalStore(Store):
         path = self.root / key
 
         try:
-            return await asyncio.to_thread(_get, path, prototype, byte_range)
+            return await asyncio.to_thread(self._get_fn, path, prototype, byte_range)
         except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
             return None
 
@@ -145,12 +387,27 @@ class LocalStore(Store):
         key_ranges: Iterable[tuple[str, ByteRequest | None]],
     ) -> list[Buffer | None]:
         # docstring inherited
-        args = []
+        if not self._is_open:
+            await self._open()
+        # group the requests by file, so that each file is opened once
+        requests: dict[str, list[tuple[int, ByteRequest | None]]] = defaultdict(list)
+        nrequests = 0
         for key, byte_range in key_ranges:
             assert isinstance(key, str)
-            path = self.root / key
-            args.append((_get, path, prototype, byte_range))
-        return await concurrent_map(args, asyncio.to_thread, limit=None)  # TODO: fix limit
+            requests[key].append((nrequests, byte_range))
+            nrequests += 1
+
+        async def _get_key(key: str, indexed_ranges: list[tuple[int, ByteRequest | None]]) -> None:
+            byte_ranges = [byte_range for _, byte_range in indexed_ranges]
+            values = await asyncio.to_thread(
+                _get_ranges, self.root / key, prototype, byte_ranges, self.mmap
+            )
+            for (index, _), value in zip(indexed_ranges, values, strict=True):
+                out[index] = value
+
+        out: list[Buffer | None] = [None] * nrequests
+        await concurrent_map(list(requests.items()), _get_key, config.get("async.concurrency"))
+        return out
 
     async def set(self, key: str, value: Buffer) -> None:
         # docstring inherited
@@ -171,19 +428,29 @@ class LocalStore(Store):
         if not isinstance(value, Buffer):
             raise TypeError("LocalStore.set(): `value` must a Buffer instance")
         path = self.root / key
-        await asyncio.to_thread(_put, path, value, start=None, exclusive=exclusive)
+        await asyncio.to_thread(
+            _put,
+            path,
+            value,
+            exclusive=exclusive,
+            replace_in=self.root if self.mmap else None,
+        )
 
     async def set_partial_values(
         self, key_start_values: Iterable[tuple[str, int, bytes | bytearray | memoryview]]
     ) -> None:
         # docstring inherited
         self._check_writable()
-        args = []
+        # group the values by file, so that the writes into one file do not race
+        start_values: dict[str, list[tuple[int, BytesLike]]] = defaultdict(list)
         for key, start, value in key_start_values:
             assert isinstance(key, str)
-            path = self.root / key
-            args.append((_put, path, value, start))
-        await concurrent_map(args, asyncio.to_thread, limit=None)  # TODO: fix limit
+            start_values[key].append((start, value))
+        args = [
+            (_put_partial, self.root / key, values, self.root if self.mmap else None)
+            for key, values in start_values.items()
+        ]
+        await concurrent_map(args, asyncio.to_thread, config.get("async.concurrency"))
 
     async def delete(self, key: str) -> None:
         """
@@ -213,18 +480,17 @@ class LocalStore(Store):
 
     async def list(self) -> AsyncIterator[str]:
         # docstring inherited
-        to_strip = self.root.as_posix() + "/"
-        for p in list(self.root.rglob("*")):
-            if p.is_file():
-                yield p.as_posix().replace(to_strip, "")
+        keys = _iter_in_thread(_walk_keys(self.root, ""))
+        async with contextlib.aclosing(keys):
+            async for key in keys:
+                yield key
 
     async def list_prefix(self, prefix: str) -> AsyncIterator[str]:
         # docstring inherited
-        to_strip = self.root.as_posix() + "/"
-        prefix = prefix.rstrip("/")
-        for p in (self.root / prefix).rglob("*"):
-            if p.is_file():
-                yield p.as_posix().replace(to_strip, "")
+        keys = _iter_in_thread(_walk_keys(self.root, prefix.strip("/")))
+        async with contextlib.aclosing(keys):
+            async for key in keys:
+                yield key
 
     async def list_dir(self, prefix: str) -> AsyncIterator[str]:
         # docstring inherited
@@ -232,9 +498,17 @@ class LocalStore(Store):
         try:
             key_iter = base.iterdir()
             for key in key_iter:
+                if key.parent == self.root and key.name == _TMP_DIR:
+                    continue
                 yield key.relative_to(base).as_posix()
         except (FileNotFoundError, NotADirectoryError):
             pass
 
     async def getsize(self, key: str) -> int:
         return os.path.getsize(self.root / key)
+
+    async def getsize_prefix(self, prefix: str) -> int:
+        # docstring inherited
+        # the sizes come from the directory listing, so this is a single pass over the
+        # directory tree
+        return await asyncio.to_thread(_sum_sizes, self.root, prefix.strip("/"))
@@ -1,22 +1,144 @@
 from __future__ import annotations
 
+import bisect
+import itertools
 from logging import getLogger
-from typing import TYPE_CHECKING, Self
+from typing import TYPE_CHECKING, Any, Self
+
+import numpy as np
 
 from zarr.abc.store import ByteRequest, Store
-from zarr.core.buffer import Buffer, gpu
+from zarr.core.buffer import Buffer, cpu, default_buffer_prototype, gpu
 from zarr.core.common import concurrent_map
 from zarr.storage._utils import _normalize_byte_range_index
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Iterable, MutableMapping
+    from collections.abc import AsyncIterator, Iterable, Iterator, MutableMapping
+
+    import numpy.typing as npt
 
     from zarr.core.buffer import BufferPrototype
+    from zarr.core.common import BytesLike
 
 
 logger = getLogger(__name__)
 
 
+class _SortedKeys:
+    """A sorted set of keys, kept as a list of sorted blocks of bounded length.
+
+    Adding or removing a key bisects to its block and moves at most the keys of that
+    block, and the keys in a range are found by bisection.
+    """
+
+    _BLOCK_SIZE = 1024
+
+    def __init__(self, keys: Iterable[str] = ()) -> None:
+        sorted_keys = sorted(keys)
+        n = self._BLOCK_SIZE
+        self._blocks = [sorted_keys[i : i + n] for i in range(0, len(sorted_keys), n)]
+        self._maxes = [block[-1] for block in self._blocks]
+
+    def add(self, key: str) -> None:
+        if not self._blocks:
+            self._blocks.append([key])
+            self._maxes.append(key)
+            return
+        i = min(bisect.bisect_left(self._maxes, key), len(self._maxes) - 1)
+        block = self._blocks[i]
+        j = bisect.bisect_left(block, key)
+        if j < len(block) and block[j] == key:
+            return
+        block.insert(j, key)
+        self._maxes[i] = block[-1]
+        if len(block) > 2 * self._BLOCK_SIZE:
+            half = len(block) // 2
+            self._blocks[i : i + 1] = [block[:half], block[half:]]
+            self._maxes[i : i + 1] = [block[half - 1], block[-1]]
+
+    def discard(self, key: str) -> None:
+        i = bisect.bisect_left(self._maxes, key)
+        if i == len(self._maxes):
+            return
+        block = self._blocks[i]
+        j = bisect.bisect_left(block, key)
+        if j < len(block) and block[j] == key:
+            del block[j]
+            if block:
+                self._maxes[i] = block[-1]
+            else:
+                del self._blocks[i]
+                del self._maxes[i]
+
+    def clear(self) -> None:
+        self._blocks = []
+        self._maxes = []
+
+    def iter_from(self, key: str) -> Iterator[str]:
+        """Iterate over the keys that are not less than ``key``, in sorted order.
+
+        The keys must not be modified while iterating.
+        """
+        i = bisect.bisect_left(self._maxes, key)
+        if i == len(self._blocks):
+            return
+        block = self._blocks[i]
+        yield from itertools.islice(block, bisect.bisect_left(block, key), None)
+        for block in itertools.islice(self._blocks, i + 1, None):
+            yield from block
+
+    def first_from(self, key: str) -> str | None:
+        """Return the smallest key that is not less than ``key``."""
+        return next(self.iter_from(key), None)
+
+
+class _SortedKeyDict(dict[str, Buffer]):
+    """A dict that keeps a sorted index of its keys up to date with its modifications."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.sorted_keys = _SortedKeys(self)
+
+    def __reduce__(self) -> tuple[type[Self], tuple[dict[str, Buffer]]]:
+        return type(self), (dict(self),)
+
+    def __setitem__(self, key: str, value: Buffer) -> None:
+        if key not in self:
+            self.sorted_keys.add(key)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self.sorted_keys.discard(key)
+
+    def __ior__(self, other: Any) -> Self:  # type: ignore[override]
+        self.update(other)
+        return self
+
+    def pop(self, key: str, *default: Any) -> Any:
+        if key in self:
+            self.sorted_keys.discard(key)
+        return super().pop(key, *default)
+
+    def popitem(self) -> tuple[str, Buffer]:
+        key, value = super().popitem()
+        self.sorted_keys.discard(key)
+        return key, value
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self) -> None:
+        super().clear()
+        self.sorted_keys.clear()
+
+
 class MemoryStore(Store):
     """
     In-memory store.
@@ -34,6 +156,13 @@ class MemoryStore(Store):
     supports_deletes
     supports_partial_writes
     supports_listing
+
+    Notes
+    -----
+    If no ``store_dict`` is given, the store keeps its values in a dict that maintains a
+    sorted index of its keys, and ``list_prefix`` and ``list_dir`` bisect that index. A
+    ``store_dict`` provided by the caller may be modified by other means, so listing
+    it scans all of its keys.
     """
 
     supports_writes: bool = True
@@ -51,12 +180,28 @@ class MemoryStore(Store):
     ) -> None:
         super().__init__(read_only=read_only)
         if store_dict is None:
-            store_dict = {}
+            store_dict = _SortedKeyDict()
         self._store_dict = store_dict
+        # the over-allocated arrays backing the values written by ``set_partial_values``,
+        # with the value that was stored last for each key
+        self._partial_values: dict[str, tuple[npt.NDArray[np.int8], Buffer]] = {}
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        # the stored values are pickled without the unused capacity of their arrays
+        state["_partial_values"] = {}
+        return state
+
+    @property
+    def _sorted_keys(self) -> _SortedKeys | None:
+        if isinstance(self._store_dict, _SortedKeyDict):
+            return self._store_dict.sorted_keys
+        return None
 
     async def clear(self) -> None:
         # docstring inherited
         self._store_dict.clear()
+        self._partial_values.clear()
 
     def __str__(self) -> str:
         return f"memory://{id(self._store_dict)}"
@@ -119,24 +264,53 @@ class MemoryStore(Store):
             self._store_dict[key] = buf
         else:
             self._store_dict[key] = value
+            self._partial_values.pop(key, None)
 
     async def set_if_not_exists(self, key: str, value: Buffer) -> None:
         # docstring inherited
         self._check_writable()
         await self._ensure_open()
-        self._store_dict.setdefault(key, value)
+        if key not in self._store_dict:
+            self._store_dict[key] = value
 
     async def delete(self, key: str) -> None:
         # docstring inherited
         self._check_writable()
         try:
             del self._store_dict[key]
+            self._partial_values.pop(key, None)
         except KeyError:
             logger.debug("Key %s does not exist.", key)
 
-    async def set_partial_values(self, key_start_values: Iterable[tuple[str, int, bytes]]) -> None:
+    async def set_partial_values(
+        self, key_start_values: Iterable[tuple[str, int, BytesLike]]
+    ) -> None:
         # docstring inherited
-        raise NotImplementedError
+        self._check_writable()
+        await self._ensure_open()
+        for key, start, value in key_start_values:
+            view = np.frombuffer(value, dtype="b")
+            stop = start + len(view)
+            old = self._store_dict.get(key)
+            old_nbytes = 0 if old is None else len(old)
+            nbytes = max(old_nbytes, stop)
+            backing, written = self._partial_values.get(key, (None, None))
+            if old is None or old is not written or backing is None or len(backing) < nbytes:
+                # Values are patched and extended within an array with spare capacity, which
+                # grows geometrically, so appending to a value does not copy it every time.
+                # The array is replaced when the value was set by other means since.
+                grown = np.zeros(max(nbytes, 2 * old_nbytes), dtype="b")
+                if old is not None:
+                    grown[:old_nbytes] = old.as_numpy_array()
+                backing = grown
+            # values may extend an existing value or be written past its end, the gap is
+            # left zeroed. Like writes of byte ranges with ``set``, the bytes are modified in
+            # place, also in the buffers that were read before.
+            backing[start:stop] = view
+            buffer_cls = default_buffer_prototype().buffer if old is None else type(old)
+            written = buffer_cls.from_buffer(cpu.Buffer.from_array_like(backing[:nbytes]))
+            self._store_dict[key] = written
+            self._partial_values[key] = (backing, written)
 
     async def list(self) -> AsyncIterator[str]:
         # docstring inherited
@@ -145,29 +319,55 @@ class MemoryStore(Store):
 
     async def list_prefix(self, prefix: str) -> AsyncIterator[str]:
         # docstring inherited
-        # note: we materialize all dict keys into a list here so we can mutate the dict in-place (e.g. in delete_prefix)
-        for key in list(self._store_dict):
-            if key.startswith(prefix):
-                yield key
+        # note: the keys are materialized into a list, so that the store can be modified
+        # while iterating (e.g. in delete_prefix)
+        sorted_keys = self._sorted_keys
+        if sorted_keys is None:
+            keys = [key for key in self._store_dict if key.startswith(prefix)]
+        else:
+            keys = list(
+                itertools.takewhile(
+                    lambda key: key.startswith(prefix), sorted_keys.iter_from(prefix)
+                )
+            )
+        for key in keys:
+            yield key
+
+    async def getsize_prefix(self, prefix: str) -> int:
+        # docstring inherited
+        return sum([len(self._store_dict[key]) async for key in self.list_prefix(prefix)])
 
     async def list_dir(self, prefix: str) -> AsyncIterator[str]:
         # docstring inherited
         prefix = prefix.rstrip("/")
-
-        if prefix == "":
-            keys_unique = {k.split("/")[0] for k in self._store_dict}
-        else:
-            # Our dictionary doesn't contain directory markers, but we want to include
-            # a pseudo directory when there's a nested item and we're listing an
-            # intermediate level.
+        if prefix != "":
+            prefix += "/"
+
+        # Our dictionary doesn't contain directory markers, but we want to include
+        # a pseudo directory when there's a nested item and we're listing an
+        # intermediate level.
+        sorted_keys = self._sorted_keys
+        if sorted_keys is None:
             keys_unique = {
-                key.removeprefix(prefix + "/").split("/")[0]
+                key.removeprefix(prefix).split("/")[0]
                 for key in self._store_dict
-                if key.startswith(prefix + "/") and key != prefix
+                if key.startswith(prefix) and key != prefix
             }
+            for key in keys_unique:
+                yield key
+            return
 
-        for key in keys_unique:
-            yield key
+        seen: set[str] = set()
+        key = sorted_keys.first_from(prefix)
+        while key is not None and key.startswith(prefix):
+            child, sep, _ = key.removeprefix(prefix).partition("/")
+            if child and child not in seen:
+                seen.add(child)
+                yield child
+            # skip the keys below this child: they sort before child + "0", as "0"
+            # follows "/". The index is searched again after every key, so the store
+            # can be modified while listing.
+            key = sorted_keys.first_from(prefix + child + ("0" if sep else "\x00"))
 
 
 class GpuMemoryStore(MemoryStore):
@@ -223,7 +423,9 @@ class GpuMemoryStore(MemoryStore):
         -------
         GpuMemoryStore
         """
-        gpu_store_dict = {k: gpu.Buffer.from_buffer(v) for k, v in store_dict.items()}
+        gpu_store_dict = _SortedKeyDict(
+            {k: gpu.Buffer.from_buffer(v) for k, v in store_dict.items()}
+        )
         return cls(gpu_store_dict)
 
     async def set(self, key: str, value: Buffer, byte_range: tuple[int, int] | None = None) -> None:
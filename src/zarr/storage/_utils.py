@@ -66,3 +66,17 @@ def _normalize_byte_range_index(data: Buffer, byte_range: ByteRequest | None) ->
     else:
         raise ValueError(f"Unexpected byte_range, got {byte_range}.")
     return (start, stop)
+
+
+def _byte_range_bounds(byte_range: ByteRequest | None, size: int) -> tuple[int, int]:
+    """Return the start and stop offsets of ``byte_range`` within a value of ``size`` bytes."""
+    if byte_range is None:
+        return 0, size
+    elif isinstance(byte_range, RangeByteRequest):
+        return min(byte_range.start, size), min(byte_range.end, size)
+    elif isinstance(byte_range, OffsetByteRequest):
+        return min(byte_range.offset, size), size
+    elif isinstance(byte_range, SuffixByteRequest):
+        return max(0, size - byte_range.suffix), size
+    else:
+        raise TypeError(f"Unexpected byte_range, got {byte_range}.")
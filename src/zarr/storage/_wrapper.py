@@ -129,11 +129,20 @@ class WrapperStore(Store, Generic[T_Store]):
     async def delete_dir(self, prefix: str) -> None:
         return await self._store.delete_dir(prefix)
 
+    async def getsize(self, key: str) -> int:
+        return await self._store.getsize(key)
+
+    async def getsize_prefix(self, prefix: str) -> int:
+        return await self._store.getsize_prefix(prefix)
+
     def close(self) -> None:
         self._store.close()
 
-    async def _get_many(
+    def get_many(
         self, requests: Iterable[tuple[str, BufferPrototype, ByteRequest | None]]
     ) -> AsyncGenerator[tuple[str, Buffer | None], None]:
-        async for req in self._store._get_many(requests):
-            yield req
+        # wrappers that override ``get`` must see every read, so they only batch reads
+        # through their own ``get``
+        if type(self).get is not WrapperStore.get:
+            return super().get_many(requests)
+        return self._store.get_many(requests)
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import asyncio
+import mmap
 import os
+import struct
 import threading
 import time
 import zipfile
+import zlib
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple
 
 from zarr.abc.store import (
     ByteRequest,
@@ -14,13 +18,45 @@ from zarr.abc.store import (
     Store,
     SuffixByteRequest,
 )
+from zarr.core._lru import LRUCache
 from zarr.core.buffer import Buffer, BufferPrototype
+from zarr.core.config import config
+from zarr.storage._utils import _byte_range_bounds
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Iterable
+    from collections.abc import AsyncGenerator, AsyncIterator, Iterable
 
 ZipStoreAccessModeLiteral = Literal["r", "w", "a"]
 
+# the fixed-size part of a local file header, see section 4.3.7 of the ZIP specification
+_LOCAL_FILE_HEADER = struct.Struct("<4s5H3L2H")
+_LOCAL_FILE_HEADER_SIGNATURE = b"PK\x03\x04"
+# the number of bytes of decompressed members kept for the byte range reads of a mapped
+# archive; larger members are decompressed by every read
+_INFLATED_CACHE_NBYTES = 2**26
+
+
+class _ZipMember(NamedTuple):
+    """The location of the data of an archive member."""
+
+    offset: int
+    compress_size: int
+    compress_type: int
+    crc: int
+
+
+def _locate_member(view: memoryview, info: zipfile.ZipInfo) -> _ZipMember | None:
+    """Find the data of an archive member in the mapped archive, or return ``None`` if
+    the member cannot be read from the mapping directly."""
+    if info.flag_bits & 0x1 or info.compress_type not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+        # encrypted members and other compression methods are left to zipfile
+        return None
+    header = _LOCAL_FILE_HEADER.unpack_from(view, info.header_offset)
+    if header[0] != _LOCAL_FILE_HEADER_SIGNATURE:
+        raise zipfile.BadZipFile(f"Bad magic number for file header of {info.filename!r}")
+    offset = info.header_offset + _LOCAL_FILE_HEADER.size + header[-2] + header[-1]
+    return _ZipMember(offset, info.compress_size, info.compress_type, info.CRC)
+
 
 class ZipStore(Store):
     """
@@ -65,6 +101,9 @@ class ZipStore(Store):
 
     _zf: zipfile.ZipFile
     _lock: threading.RLock
+    _view: memoryview | None
+    _members: dict[str, _ZipMember | None]
+    _inflated: LRUCache[str, bytes]
 
     def __init__(
         self,
@@ -101,6 +140,12 @@ class ZipStore(Store):
             compression=self.compression,
             allowZip64=self.allowZip64,
         )
+        self._view = None
+        self._members = {}
+        self._inflated = LRUCache(_INFLATED_CACHE_NBYTES, sizeof=len)
+        if self._zmode == "r":
+            with self.path.open("rb") as f:
+                self._view = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
 
         self._is_open = True
 
@@ -120,6 +165,9 @@ class ZipStore(Store):
         super().close()
         with self._lock:
             self._zf.close()
+            # the mapping is released once no buffers view it anymore
+            self._view = None
+            self._inflated.clear()
 
     async def clear(self) -> None:
         # docstring inherited
@@ -165,6 +213,56 @@ class ZipStore(Store):
         except KeyError:
             return None
 
+    def _get_mapped(
+        self,
+        view: memoryview,
+        key: str,
+        prototype: BufferPrototype,
+        byte_range: ByteRequest | None = None,
+    ) -> Buffer | None:
+        # the archive cannot change in mode 'r', so this needs no lock
+        try:
+            member = self._members[key]
+        except KeyError:
+            try:
+                info = self._zf.getinfo(key)
+            except KeyError:
+                return None
+            member = self._members[key] = _locate_member(view, info)
+        if member is None:
+            with self._lock:
+                return self._get(key, prototype=prototype, byte_range=byte_range)
+
+        data = view[member.offset : member.offset + member.compress_size]
+        if member.compress_type == zipfile.ZIP_DEFLATED:
+            # a deflated member is decompressed and verified as a whole, so the members
+            # read by byte ranges, e.g. shards, are kept decompressed for the next reads
+            decompressed = self._inflated.get(key)
+            if decompressed is None:
+                decompressed = zlib.decompress(data, -zlib.MAX_WBITS)
+                if zlib.crc32(decompressed) != member.crc:
+                    raise zipfile.BadZipFile(f"Bad CRC-32 for file {key!r}")
+                if byte_range is not None:
+                    self._inflated.set(key, decompressed)
+            data = memoryview(decompressed)
+        start, stop = _byte_range_bounds(byte_range, len(data))
+        return prototype.buffer.from_bytes(data[start:stop])
+
+    def _get_values(
+        self, requests: Iterable[tuple[str, BufferPrototype, ByteRequest | None]]
+    ) -> list[Buffer | None]:
+        view = self._view
+        if view is None:
+            with self._lock:
+                return [
+                    self._get(key, prototype=prototype, byte_range=byte_range)
+                    for key, prototype, byte_range in requests
+                ]
+        return [
+            self._get_mapped(view, key, prototype=prototype, byte_range=byte_range)
+            for key, prototype, byte_range in requests
+        ]
+
     async def get(
         self,
         key: str,
@@ -174,6 +272,10 @@ class ZipStore(Store):
         # docstring inherited
         assert isinstance(key, str)
 
+        if self._view is not None:
+            return await asyncio.to_thread(
+                self._get_mapped, self._view, key, prototype=prototype, byte_range=byte_range
+            )
         with self._lock:
             return self._get(key, prototype=prototype, byte_range=byte_range)
 
@@ -183,11 +285,34 @@ class ZipStore(Store):
         key_ranges: Iterable[tuple[str, ByteRequest | None]],
     ) -> list[Buffer | None]:
         # docstring inherited
-        out = []
-        with self._lock:
-            for key, byte_range in key_ranges:
-                out.append(self._get(key, prototype=prototype, byte_range=byte_range))
-        return out
+        requests = [(key, prototype, byte_range) for key, byte_range in key_ranges]
+        if self._view is not None:
+            return await asyncio.to_thread(self._get_values, requests)
+        return self._get_values(requests)
+
+    async def get_many(
+        self, requests: Iterable[tuple[str, BufferPrototype, ByteRequest | None]]
+    ) -> AsyncGenerator[tuple[str, Buffer | None], None]:
+        # docstring inherited
+        requests = list(requests)
+        if self._view is None:
+            for (key, _, _), value in zip(requests, self._get_values(requests), strict=True):
+                yield key, value
+            return
+        # the members of a mapped archive are read in batches, one thread per batch,
+        # rather than one thread per member
+        batch_size = config.get("async.concurrency")
+        batches = [requests[i : i + batch_size] for i in range(0, len(requests), batch_size)]
+
+        async def read_batch(
+            batch: list[tuple[str, BufferPrototype, ByteRequest | None]],
+        ) -> list[tuple[str, Buffer | None]]:
+            values = await asyncio.to_thread(self._get_values, batch)
+            return [(key, value) for (key, _, _), value in zip(batch, values, strict=True)]
+
+        for batch_values in asyncio.as_completed([read_batch(batch) for batch in batches]):
+            for item in await batch_values:
+                yield item
 
     def _set(self, key: str, value: Buffer) -> None:
         # generally, this should be called inside a lock
@@ -198,7 +323,7 @@ class ZipStore(Store):
             keyinfo.external_attr |= 0x10  # MS-DOS directory flag
         else:
             keyinfo.external_attr = 0o644 << 16  # ?rw-r--r--
-        self._zf.writestr(keyinfo, value.to_bytes())
+        self._zf.writestr(keyinfo, value.as_buffer_like())
 
     async def set(self, key: str, value: Buffer) -> None:
         # docstring inherited
@@ -257,6 +382,22 @@ class ZipStore(Store):
             if key.startswith(prefix):
                 yield key
 
+    async def getsize(self, key: str) -> int:
+        # docstring inherited
+        with self._lock:
+            try:
+                return self._zf.getinfo(key).file_size
+            except KeyError:
+                raise FileNotFoundError(key) from None
+
+    async def getsize_prefix(self, prefix: str) -> int:
+        # docstring inherited
+        # the sizes are read from the central directory
+        with self._lock:
+            return sum(
+                info.file_size for info in self._zf.infolist() if info.filename.startswith(prefix)
+            )
+
     async def list_dir(self, prefix: str) -> AsyncIterator[str]:
         # docstring inherited
         prefix = prefix.rstrip("/")
@@ -137,14 +137,14 @@ class StoreTests(Generic[S, B]):
 
     async def test_get_many(self, store: S) -> None:
         """
-        Ensure that multiple keys can be retrieved at once with the _get_many method.
+        Ensure that multiple keys can be retrieved at once with the get_many method.
         """
         keys = tuple(map(str, range(10)))
         values = tuple(f"{k}".encode() for k in keys)
         for k, v in zip(keys, values, strict=False):
             await self.set(store, k, self.buffer_cls.from_bytes(v))
         observed_buffers = await _collect_aiterator(
-            store._get_many(
+            store.get_many(
                 zip(
                     keys,
                     (default_buffer_prototype(),) * len(keys),
@@ -157,6 +157,12 @@ class StoreTests(Generic[S, B]):
         expected_kvs = sorted(((k, b) for k, b in zip(keys, values, strict=False)))
         assert observed_kvs == expected_kvs
 
+        # missing keys are retrieved as None
+        observed_buffers = await _collect_aiterator(
+            store.get_many([("missing", default_buffer_prototype(), None)])
+        )
+        assert observed_buffers == (("missing", None),)
+
     @pytest.mark.parametrize("key", ["zarr.json", "c/0", "foo/c/0.0", "foo/0/0"])
     @pytest.mark.parametrize("data", [b"\x01\x02\x03\x04", b""])
     async def test_set(self, store: S, key: str, data: bytes) -> None:
@@ -225,6 +231,15 @@ class StoreTests(Generic[S, B]):
             obs.to_bytes() == exp.to_bytes() for obs, exp in zip(observed, expected, strict=True)
         )
 
+    async def test_set_partial_values(self, store: S) -> None:
+        if not store.supports_partial_writes:
+            pytest.skip("store does not support partial writes")
+        await self.set(store, "foo/c/0", self.buffer_cls.from_bytes(b"0123456789"))
+        # overwrite a range and extend the value past its end
+        await store.set_partial_values([("foo/c/0", 2, b"ab"), ("foo/c/0", 10, b"xyz")])
+        observed = await self.get(store, "foo/c/0")
+        assert observed.to_bytes() == b"01ab456789xyz"
+
     async def test_exists(self, store: S) -> None:
         assert not await store.exists("foo")
         await store.set("foo/zarr.json", self.buffer_cls.from_bytes(b"bar"))
@@ -304,6 +319,31 @@ class StoreTests(Generic[S, B]):
             expected = tuple(sorted(expected))
             assert observed == expected
 
+    async def test_getsize(self, store: S) -> None:
+        """
+        Ensure that the size of a value can be retrieved with the getsize method.
+        """
+        await self.set(store, "foo/zarr.json", self.buffer_cls.from_bytes(b"0123456789"))
+        assert await store.getsize("foo/zarr.json") == 10
+        with pytest.raises(FileNotFoundError):
+            await store.getsize("foo/missing")
+
+    async def test_getsize_prefix(self, store: S) -> None:
+        """
+        Ensure that the getsize_prefix method returns the total size of the values under a
+        prefix.
+        """
+        store_dict = {
+            "foo/zarr.json": self.buffer_cls.from_bytes(b"0123456789"),
+            "foo/c/0/0": self.buffer_cls.from_bytes(b"01234"),
+            "foo/c/0/1": self.buffer_cls.from_bytes(b"012"),
+            "bar/c/0": self.buffer_cls.from_bytes(b"0"),
+        }
+        await store._set_many(store_dict.items())
+        assert await store.getsize_prefix("foo/c") == 8
+        assert await store.getsize_prefix("foo") == 18
+        assert await store.getsize_prefix("") == 19
+
     async def test_list_dir(self, store: S) -> None:
         root = "foo"
         store_dict = {
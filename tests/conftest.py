@@ -11,15 +11,20 @@ from hypothesis import HealthCheck, Verbosity, settings
 
 from zarr import AsyncGroup, config
 from zarr.abc.store import Store
+from zarr.codecs.sharding import clear_shard_index_cache, shard_index_cache_info
+from zarr.core.buffer_pool import buffer_pool_info, clear_buffer_pool
+from zarr.core.chunk_cache import chunk_cache_info, clear_chunk_cache
+from zarr.core.metadata_cache import clear_metadata_cache, metadata_cache_info
 from zarr.core.sync import sync
 from zarr.storage import FsspecStore, LocalStore, MemoryStore, StorePath, ZipStore
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Callable, Generator
     from typing import Any, Literal
 
     from _pytest.compat import LEGACY_PATH
 
+    from zarr.core._lru import CacheInfo
     from zarr.core.common import ChunkCoords, MemoryOrder, ZarrFormat
 
 
@@ -120,6 +125,49 @@ def reset_config() -> Generator[None, None, None]:
     config.reset()
 
 
+@dataclass(frozen=True)
+class ProcessCache:
+    """A cache shared by all arrays of the process, and the setting that enables it."""
+
+    name: str
+    enable: dict[str, Any]
+    clear: Callable[[], None]
+    info: Callable[[], CacheInfo]
+
+
+PROCESS_CACHES = {
+    cache.name: cache
+    for cache in [
+        ProcessCache(
+            "chunk_cache", {"array.chunk_cache_size": 2**20}, clear_chunk_cache, chunk_cache_info
+        ),
+        ProcessCache(
+            "metadata_cache", {"metadata_cache.ttl": 60}, clear_metadata_cache, metadata_cache_info
+        ),
+        ProcessCache(
+            "shard_index_cache",
+            {"sharding.index_cache_size": 2**20},
+            clear_shard_index_cache,
+            shard_index_cache_info,
+        ),
+        ProcessCache(
+            "buffer_pool", {"array.buffer_pool_size": 2**24}, clear_buffer_pool, buffer_pool_info
+        ),
+    ]
+}
+
+
+@pytest.fixture
+def process_cache(request: pytest.FixtureRequest) -> Generator[ProcessCache, None, None]:
+    """Enable the process-wide cache named by the parameter of the test. The cache is
+    cleared before and after the test."""
+    cache = PROCESS_CACHES[request.param]
+    cache.clear()
+    with config.set(cache.enable):
+        yield cache
+    cache.clear()
+
+
 @dataclass
 class ArrayRequest:
     shape: ChunkCoords
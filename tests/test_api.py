@@ -23,6 +23,7 @@ from zarr.api.synchronous import (
     save_array,
     save_group,
 )
+from zarr.core.array_spec import ArrayConfig
 from zarr.core.common import JSON, MemoryOrder, ZarrFormat
 from zarr.errors import MetadataValidationError
 from zarr.storage import MemoryStore
@@ -131,6 +132,18 @@ async def test_open_array(memory_store: MemoryStore) -> None:
         open(store="doesnotexist", mode="r")
 
 
+def test_open_array_config(memory_store: MemoryStore) -> None:
+    zarr.create_array(memory_store, shape=(10,), chunks=(5,), dtype="int32")
+    z = zarr.open_array(memory_store)
+    assert z._async_array._config == ArrayConfig.from_dict({})
+    # the runtime configuration applies to existing arrays, too
+    z = zarr.open_array(memory_store, config={"write_empty_chunks": True, "order": "F"})
+    assert z._async_array._config.write_empty_chunks
+    assert z._async_array._config.order == "F"
+    z[:] = 0
+    assert z.nchunks_initialized == 2
+
+
 @pytest.mark.parametrize("store", ["memory"], indirect=True)
 async def test_create_group(store: Store, zarr_format: ZarrFormat) -> None:
     attrs = {"foo": 100}
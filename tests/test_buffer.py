@@ -151,3 +151,12 @@ def test_numpy_buffer_prototype() -> None:
     ndbuffer = cpu.buffer_prototype.nd_buffer.create(shape=(1, 2), dtype=np.dtype("int64"))
     assert isinstance(buffer.as_array_like(), np.ndarray)
     assert isinstance(ndbuffer.as_ndarray_like(), np.ndarray)
+
+
+def test_buffer_as_buffer_like() -> None:
+    data = np.arange(10, dtype="b")
+    view = cpu.Buffer.from_array_like(data).as_buffer_like()
+    assert view.format == "B"
+    assert view.tobytes() == data.tobytes()
+    # no copy is made of data in host memory
+    assert np.shares_memory(np.asarray(view), data)
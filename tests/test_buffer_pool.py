@@ -0,0 +1,99 @@
+from typing import Any
+
+import numcodecs
+import numpy as np
+import pytest
+
+import zarr
+from zarr.core.buffer_pool import BufferPool
+
+from .conftest import ProcessCache
+
+
+def test_buffer_pool_reuses_released_blocks() -> None:
+    pool = BufferPool(2**20)
+    a = pool.acquire(100_000)
+    assert a.nbytes == 100_000
+    pool.release(a.view("int32").reshape(100, 250))
+    assert pool.info().size == 1
+    assert pool.info().nbytes == 2**17
+
+    # requests of the same size class reuse the block
+    b = pool.acquire(70_000)
+    assert np.shares_memory(a, b)
+    assert pool.info().hits == 1
+    assert pool.info().misses == 1
+
+    # releasing twice, and releasing arrays that do not come from the pool, is a no-op
+    pool.release(b)
+    pool.release(b)
+    pool.release(np.empty(100_000, dtype=np.uint8))
+    assert pool.info().size == 1
+
+    # small requests are not pooled
+    pool.release(pool.acquire(100))
+    assert pool.info().size == 1
+    assert pool.info().misses == 1
+
+
+def test_buffer_pool_capacity() -> None:
+    pool = BufferPool(2**18)
+    blocks = [pool.acquire(2**17) for _ in range(3)]
+    for block in blocks:
+        pool.release(block)
+    info = pool.info()
+    assert (info.size, info.nbytes, info.evictions) == (2, 2**18, 1)
+
+    pool.resize(2**17)
+    assert pool.info().size == 1
+    pool.clear()
+    assert pool.info().size == 0
+    with pytest.raises(ValueError, match="non-negative"):
+        BufferPool(-1)
+
+
+@pytest.mark.parametrize("process_cache", ["buffer_pool"], indirect=True)
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"shards": (200, 400)},
+        {"zarr_format": 2},
+        {"zarr_format": 2, "filters": [numcodecs.Delta(dtype="int32")], "order": "F"},
+    ],
+)
+@pytest.mark.parametrize("streaming", [True, False])
+def test_buffer_pool_roundtrip(
+    process_cache: ProcessCache, kwargs: dict[str, Any], streaming: bool
+) -> None:
+    data = np.zeros((400, 400), dtype="int32")
+    with zarr.config.set({"codec_pipeline.streaming": streaming}):
+        a = zarr.create_array(
+            {}, shape=data.shape, chunks=(100, 200), dtype=data.dtype, fill_value=0, **kwargs
+        )
+        for i in range(3):
+            # partial writes merge the written items into the chunks
+            a[5:395, 5:395] = i + 1
+            data[5:395, 5:395] = i + 1
+            np.testing.assert_array_equal(a[3:397, 3:397], data[3:397, 3:397])
+        a.vindex[[1, 399], [2, 300]] = -1
+        data[[1, 399], [2, 300]] = -1
+        np.testing.assert_array_equal(a[:], data)
+    info = process_cache.info()
+    assert info.hits > 0
+    assert info.nbytes <= info.max_nbytes
+
+
+@pytest.mark.parametrize("process_cache", ["buffer_pool"], indirect=True)
+def test_buffer_pool_uncompressed_chunks(process_cache: ProcessCache) -> None:
+    # the encoded bytes of uncompressed chunks are views of the chunks, so they do not
+    # use the pool
+    data = np.arange(400 * 400, dtype="int32").reshape(400, 400)
+    a = zarr.create_array(
+        {}, shape=data.shape, chunks=(100, 200), dtype=data.dtype, compressors=None
+    )
+    a[:] = data
+    a[5:395, 5:395] = 0
+    data[5:395, 5:395] = 0
+    np.testing.assert_array_equal(a[3:397, 3:397], data[3:397, 3:397])
+    assert process_cache.info().misses == 0
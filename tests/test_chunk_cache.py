@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+import zarr
+from zarr.core.chunk_cache import chunk_cache_info
+from zarr.storage import LoggingStore, MemoryStore
+
+
+pytestmark = [
+    pytest.mark.parametrize("process_cache", ["chunk_cache"], indirect=True),
+    pytest.mark.usefixtures("process_cache"),
+]
+
+
+def test_chunk_cache() -> None:
+    store = LoggingStore(MemoryStore())
+    data = np.arange(100, dtype="int32")
+    a = zarr.create_array(store, shape=data.shape, chunks=(10,), dtype=data.dtype)
+    a[:] = data
+
+    np.testing.assert_array_equal(a[5:25], data[5:25])
+    assert chunk_cache_info().size == 3
+    gets = store.counter["get"]
+
+    # repeated reads of the same chunks do not touch the store
+    np.testing.assert_array_equal(a[5:25], data[5:25])
+    np.testing.assert_array_equal(a[21], data[21])
+    assert store.counter["get"] == gets
+    assert chunk_cache_info().hits == 4
+
+    # the returned data is a writable copy of the cached chunks
+    result = a[:10]
+    result[:] = -1
+    np.testing.assert_array_equal(a[:10], data[:10])
+
+
+def test_chunk_cache_invalidated_by_writes() -> None:
+    data = np.arange(100, dtype="int32")
+    a = zarr.create_array(MemoryStore(), shape=data.shape, chunks=(10,), dtype=data.dtype)
+    a[:] = data
+    np.testing.assert_array_equal(a[:], data)
+    assert chunk_cache_info().size == 10
+
+    a[15:25] = 0
+    data[15:25] = 0
+    assert chunk_cache_info().size == 8
+    np.testing.assert_array_equal(a[:], data)
+
+    a.resize((50,))
+    assert chunk_cache_info().size == 0
+    np.testing.assert_array_equal(a[:], data[:50])
+
+
+def test_chunk_cache_keyed_by_metadata() -> None:
+    store = MemoryStore()
+    a = zarr.create_array(store, shape=(10,), chunks=(10,), dtype="int32")
+    a[:] = 1
+    np.testing.assert_array_equal(a[:], 1)
+
+    # a new array at the same path with other metadata does not see the cached chunks
+    b = zarr.create_array(store, shape=(10,), chunks=(10,), dtype="int16", overwrite=True)
+    b[:] = 2
+    np.testing.assert_array_equal(zarr.open_array(store)[:], np.full(10, 2, dtype="int16"))
+
+    # changing attributes keeps the cached chunks valid
+    b.attrs["foo"] = "bar"
+    hits = chunk_cache_info().hits
+    np.testing.assert_array_equal(zarr.open_array(store)[:], 2)
+    assert chunk_cache_info().hits == hits + 1
+
+
+def test_chunk_cache_invalidated_by_overwrite_and_delete() -> None:
+    store = MemoryStore()
+    a = zarr.create_array(store, name="x", shape=(10,), chunks=(5,), dtype="int32")
+    a[:] = 7
+    np.testing.assert_array_equal(a[:], 7)
+    assert chunk_cache_info().size == 2
+
+    # a new array with the same metadata at the same path starts out empty
+    b = zarr.create_array(store, name="x", shape=(10,), chunks=(5,), dtype="int32", overwrite=True)
+    assert chunk_cache_info().size == 0
+    np.testing.assert_array_equal(b[:], 0)
+
+    b[:] = 7
+    np.testing.assert_array_equal(b[:], 7)
+    root = zarr.open_group(store)
+    del root["x"]
+    assert chunk_cache_info().size == 0
+    c = zarr.create_array(store, name="x", shape=(10,), chunks=(5,), dtype="int32")
+    np.testing.assert_array_equal(c[:], 0)
+
+
+def test_chunk_cache_bypassed_by_sharding() -> None:
+    a = zarr.create_array(MemoryStore(), shape=(100,), chunks=(10,), shards=(50,), dtype="int32")
+    a[:] = 1
+    np.testing.assert_array_equal(a[:], 1)
+    assert chunk_cache_info().size == 0
@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+import zarr
+from zarr.core import chunk_manifest
+from zarr.core.chunk_manifest import ChunkManifest, _ManifestSegment
+from zarr.core.sync import sync
+from zarr.storage import LocalStore, LoggingStore, MemoryStore
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _segment_keys(store: MemoryStore, path: str = "") -> list[str]:
+    prefix = f"{path}/.zchunks/" if path else ".zchunks/"
+    return [key for key in store._store_dict if key.startswith(prefix)]
+
+
+def test_chunk_manifest_segment_to_bytes() -> None:
+    bitmap = np.zeros((3, 7), dtype=bool)
+    bitmap[0, 1] = bitmap[2, 6] = True
+    segment = _ManifestSegment.from_bytes(_ManifestSegment(bitmap, ("a", "b")).to_bytes())
+    np.testing.assert_array_equal(segment.bitmap, bitmap)
+    assert segment.supersedes == ("a", "b")
+    assert _ManifestSegment.from_bytes(_ManifestSegment(bitmap).to_bytes()).supersedes is None
+    for data in [b"{", b"{}", b'{"chunk_grid_shape": [3, 7], "chunks": "AAAA"}']:
+        with pytest.raises(ValueError, match="Invalid chunk manifest segment"):
+            _ManifestSegment.from_bytes(data)
+
+    manifest = ChunkManifest(bitmap)
+    assert (0, 1) in manifest
+    assert (1, 1) not in manifest
+    assert manifest.count() == 2
+    assert list(manifest.chunk_coords()) == [(0, 1), (2, 6)]
+
+
+@pytest.mark.parametrize("zarr_format", [2, 3])
+def test_chunk_manifest_skips_absent_chunks(zarr_format: int) -> None:
+    store = LoggingStore(MemoryStore())
+    a = zarr.create_array(
+        store,
+        name="foo/bar",
+        shape=(100,),
+        chunks=(10,),
+        dtype="int32",
+        fill_value=0,
+        zarr_format=zarr_format,
+        config={"chunk_manifest": True},
+    )
+    a[15:25] = 1
+    # the segments written by the creation and by the write
+    assert len(_segment_keys(store._store, "foo/bar")) == 2
+
+    store.counter.clear()
+    expected = np.zeros(100, dtype="int32")
+    expected[15:25] = 1
+    np.testing.assert_array_equal(a[:], expected)
+    # the two chunks that exist, since this process wrote the segments of the manifest
+    assert store.counter["get"] == 2
+    assert store.counter["list_prefix"] == 1
+    np.testing.assert_array_equal(a.vindex[[0, 16, 99]], [0, 1, 0])
+
+    # a store that did not write the segments, as in another process, reads them once
+    other = LoggingStore(MemoryStore(store._store._store_dict))
+    c = zarr.open_array(other, path="foo/bar", config={"chunk_manifest": True})
+    for _ in range(2):
+        other.counter.clear()
+        np.testing.assert_array_equal(c[:], expected)
+    assert other.counter["get"] == 2
+
+    # reads of a single chunk do not load the manifest
+    store.counter.clear()
+    assert a[17] == 1
+    assert a[50] == 0
+    assert store.counter["get"] == 2
+    assert store.counter["list_prefix"] == 0
+
+    # arrays without the option read every chunk, and see the same data
+    b = zarr.open_array(store, path="foo/bar")
+    store.counter.clear()
+    np.testing.assert_array_equal(b[:], expected)
+    assert store.counter["get"] == 10
+
+
+def test_chunk_manifest_write_and_delete() -> None:
+    store = MemoryStore()
+    a = zarr.create_array(
+        store,
+        name="foo/bar",
+        shape=(10, 10),
+        chunks=(2, 5),
+        dtype="int32",
+        fill_value=0,
+        config={"chunk_manifest": True},
+    )
+    a[:, :] = 1
+    assert a.nchunks_initialized == 10
+    # chunks that only hold the fill value are deleted and removed from the manifest
+    a[:4, :] = 0
+    assert a.nchunks_initialized == 6
+    a.vindex[[0, 9], [0, 9]] = 2
+    assert a.nchunks_initialized == 7
+    a.oindex[[1, 3], :] = 3
+    assert a.nchunks_initialized == 10
+
+    expected = np.ones((10, 10), dtype="int32")
+    expected[:4, :] = 0
+    expected[[1, 3], :] = 3
+    expected[0, 0] = expected[9, 9] = 2
+    np.testing.assert_array_equal(a[:], expected)
+    b = zarr.open_array(store, path="foo/bar")
+    np.testing.assert_array_equal(b[:], expected)
+    assert b.nchunks_initialized == a.nchunks_initialized
+
+
+def test_chunk_manifest_resize() -> None:
+    store = MemoryStore()
+    a = zarr.create_array(
+        store,
+        shape=(100,),
+        chunks=(10,),
+        dtype="int32",
+        fill_value=0,
+        config={"chunk_manifest": True},
+    )
+    a[5] = 1
+    a[95] = 1
+    a.resize((50,))
+    assert a.nchunks_initialized == 1
+    assert sorted(k for k in store._store_dict if k.startswith("c/")) == ["c/0"]
+    a.resize((100,))
+    assert a[:].sum() == 1
+
+    # chunks outside of the new shape are kept, so the manifest is recreated by the next write
+    a[95] = 1
+    sync(a._async_array.resize((50,), delete_outside_chunks=False))
+    assert _segment_keys(store) == []
+    a.resize((100,))
+    a[0] = 1
+    assert a.nchunks_initialized == 2
+    assert a[:].sum() == 3
+
+
+def test_chunk_manifest_sharding() -> None:
+    store = LoggingStore(MemoryStore())
+    a = zarr.create_array(
+        store,
+        shape=(100,),
+        chunks=(5,),
+        shards=(20,),
+        dtype="int32",
+        fill_value=0,
+        config={"chunk_manifest": True},
+    )
+    a[10:30] = 1
+    assert a.nchunks_initialized == 2
+    store.counter.clear()
+    assert a[:].sum() == 20
+    # the two shards that exist
+    assert store.counter["get"] == 2
+
+
+def test_chunk_manifest_merges_segments() -> None:
+    store = MemoryStore()
+    a = zarr.create_array(
+        store, shape=(100,), chunks=(1,), dtype="int32", config={"chunk_manifest": True}
+    )
+    for i in range(40):
+        a[i] = 1
+        assert len(_segment_keys(store)) <= chunk_manifest._MAX_SEGMENTS
+    a[:20] = 0
+    assert a.nchunks_initialized == 20
+    assert a[:].sum() == 20
+
+
+def test_chunk_manifest_untrusted() -> None:
+    store = LoggingStore(MemoryStore())
+    a = zarr.create_array(
+        store,
+        shape=(100,),
+        chunks=(10,),
+        dtype="int32",
+        fill_value=0,
+        config={"chunk_manifest": True},
+    )
+    a[:20] = 1
+    # a segment that cannot be read, e.g. because a concurrent write merged it with the
+    # others, makes the manifest untrusted, and every chunk is read
+    key = _segment_keys(store._store)[0]
+    store._store._store_dict[key] = store._store._store_dict[key][:-1]
+    # by a process that did not read the segment before
+    store = LoggingStore(MemoryStore(store._store._store_dict))
+    a = zarr.open_array(store, config={"chunk_manifest": True})
+    store.counter.clear()
+    assert a[:].sum() == 20
+    assert store.counter["get"] == 10 + 2
+    assert a.nchunks_initialized == 2
+
+    # the next write rebuilds the manifest from the chunks that exist
+    a[50] = 1
+    assert len(_segment_keys(store._store)) == 1
+    assert a.nchunks_initialized == 3
+    assert a[:].sum() == 21
+
+
+def test_chunk_manifest_writers_without_option() -> None:
+    store = MemoryStore()
+    a = zarr.create_array(
+        store,
+        name="foo",
+        shape=(100,),
+        chunks=(10,),
+        dtype="int32",
+        fill_value=0,
+        config={"chunk_manifest": True},
+    )
+    a[:10] = 1
+    # writes through a store that did not create the array update its manifest too
+    b = zarr.open_array(MemoryStore(store._store_dict), path="foo")
+    b[90:] = 2
+    assert a.nchunks_initialized == 2
+    assert a[:].sum() == 10 + 20
+    b[:10] = 0
+    assert a.nchunks_initialized == 1
+
+    # arrays without a manifest do not get one
+    c = zarr.create_array(store, name="bar", shape=(10,), chunks=(5,), dtype="int32")
+    c[:] = 1
+    assert _segment_keys(store, "bar") == []
+
+
+def test_open_array_chunk_manifest() -> None:
+    store = MemoryStore()
+    zarr.create_array(store, shape=(100,), chunks=(10,), dtype="int32", fill_value=0)
+    a = zarr.open_array(store, config={"chunk_manifest": True})
+    assert a._async_array._config.chunk_manifest
+    a[:10] = 1
+    assert len(_segment_keys(store)) == 1
+    assert a.nchunks_initialized == 1
+
+
+def _write_chunks(root: str, chunks: list[int]) -> None:
+    a = zarr.open_array(LocalStore(root), config={"chunk_manifest": True})
+    for i in chunks:
+        a[i * 2 : i * 2 + 2] = i
+
+
+def test_chunk_manifest_concurrent_writers(tmp_path: Path) -> None:
+    nchunks = 48
+    a = zarr.create_array(
+        LocalStore(tmp_path),
+        shape=(nchunks * 2,),
+        chunks=(2,),
+        dtype="int32",
+        fill_value=-1,
+        config={"chunk_manifest": True},
+    )
+    # every process writes every fourth chunk, one chunk per write, so that the
+    # processes write segments and merge them concurrently
+    with ProcessPoolExecutor(
+        max_workers=4, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        futures = [
+            executor.submit(_write_chunks, str(tmp_path), list(range(i, nchunks, 4)))
+            for i in range(4)
+        ]
+        for future in futures:
+            future.result()
+    assert a.nchunks_initialized == nchunks
+    np.testing.assert_array_equal(a[:], np.repeat(np.arange(nchunks), 2))
+
+
+def test_nchunks_initialized_nested_path() -> None:
+    a = zarr.create_array(MemoryStore(), name="foo/bar", shape=(10,), chunks=(2,), dtype="int32")
+    a[:] = 1
+    assert a.nchunks_initialized == 5
@@ -0,0 +1,303 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Literal
+
+import numcodecs
+import numpy as np
+import pytest
+
+import zarr
+from zarr.core.buffer import cpu, default_buffer_prototype
+from zarr.core.codec_pipeline import BatchedCodecPipeline, fetch_batch, streaming_map
+from zarr.core.config import config
+from zarr.storage import MemoryStore, StorePath
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Iterable
+
+    from zarr.abc.store import ByteRequest, Store
+    from zarr.core.buffer import Buffer, BufferPrototype
+
+
+async def test_streaming_map_runs_all_stages() -> None:
+    results: list[int] = []
+
+    async def double(x: int) -> int:
+        # later items finish first, so results arrive out of order
+        await asyncio.sleep(0.001 * (10 - x))
+        return 2 * x
+
+    async def collect(x: int) -> None:
+        results.append(x)
+
+    await streaming_map(range(10), [double, collect], limit=3)
+    assert sorted(results) == [2 * x for x in range(10)]
+
+
+async def test_streaming_map_bounds_in_flight_items() -> None:
+    in_flight = 0
+    max_in_flight = 0
+
+    async def stage(x: int) -> int:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        return x
+
+    await streaming_map(range(50), [stage], limit=4)
+    assert max_in_flight <= 4
+
+
+async def test_streaming_map_propagates_errors() -> None:
+    async def fail(x: int) -> int:
+        if x == 5:
+            raise ValueError("bad item")
+        return x
+
+    async def noop(x: int) -> None:
+        pass
+
+    with pytest.raises(ValueError, match="bad item"):
+        await streaming_map(range(100), [fail, noop], limit=2)
+
+
+def test_streaming_config() -> None:
+    pipeline = BatchedCodecPipeline.from_codecs([zarr.codecs.BytesCodec()])
+    assert not pipeline.streaming
+    with config.set({"codec_pipeline.streaming": True}):
+        pipeline = BatchedCodecPipeline.from_codecs([zarr.codecs.BytesCodec()])
+        assert pipeline.streaming
+
+
+@pytest.mark.parametrize("store", ["local", "memory"], indirect=["store"])
+@pytest.mark.parametrize("write_empty_chunks", [True, False])
+def test_streaming_roundtrip(store: Store, write_empty_chunks: bool) -> None:
+    data = np.arange(100 * 90, dtype="int32").reshape(100, 90)
+    with config.set({"codec_pipeline.streaming": True}):
+        arr = zarr.create_array(
+            StorePath(store),
+            shape=data.shape,
+            chunks=(16, 16),
+            dtype=data.dtype,
+            fill_value=0,
+            config={"write_empty_chunks": write_empty_chunks},
+        )
+        assert arr._async_array.codec_pipeline.streaming  # type: ignore[attr-defined]
+        arr[:] = data
+        np.testing.assert_array_equal(arr[:], data)
+
+        # partial updates need to merge with the existing chunk data
+        arr[5:20, 7:11] = -1
+        data[5:20, 7:11] = -1
+        np.testing.assert_array_equal(arr[:], data)
+        np.testing.assert_array_equal(
+            arr.get_orthogonal_selection(([1, 50, 99], slice(3, 70))), data[[1, 50, 99], 3:70]
+        )
+        np.testing.assert_array_equal(
+            arr.vindex[[0, 5, 99], [89, 8, 0]], data[[0, 5, 99], [89, 8, 0]]
+        )
+
+        # empty chunks are deleted unless write_empty_chunks is set
+        arr[:] = 0
+        expected = arr.nchunks if write_empty_chunks else 0
+        assert arr.nchunks_initialized == expected
+
+
+def _read_with_config(arr: zarr.Array, **kwargs: Any) -> np.ndarray[Any, Any]:
+    with config.set({f"codec_pipeline.{k}": v for k, v in kwargs.items()}):
+        reopened = zarr.open_array(arr.store_path, mode="r")
+        return reopened[:]  # type: ignore[return-value]
+
+
+def test_streaming_matches_batched() -> None:
+    data = np.random.default_rng(0).random((64, 64))
+    arr = zarr.create_array({}, shape=data.shape, chunks=(10, 10), dtype=data.dtype)
+    arr[:] = data
+    np.testing.assert_array_equal(_read_with_config(arr, streaming=True), data)
+    np.testing.assert_array_equal(_read_with_config(arr, streaming=False, batch_size=4), data)
+
+
+class _GetManyCountingStore(MemoryStore):
+    get_many_calls = 0
+
+    def get_many(
+        self, requests: Iterable[tuple[str, BufferPrototype, ByteRequest | None]]
+    ) -> AsyncGenerator[tuple[str, Buffer | None], None]:
+        self.get_many_calls += 1
+        return super().get_many(requests)
+
+
+def test_batched_pipeline_reads_with_get_many() -> None:
+    store = _GetManyCountingStore()
+    data = np.arange(100, dtype="int32")
+    with config.set({"codec_pipeline.batch_size": 100}):
+        arr = zarr.create_array(store, shape=data.shape, chunks=(10,), dtype=data.dtype)
+        arr[:] = data
+        # a single batched request per mini-batch
+        np.testing.assert_array_equal(arr[:], data)
+        assert store.get_many_calls == 1
+        # partial updates read the chunks they modify in a batch, too
+        arr[5:25] = -1
+        data[5:25] = -1
+        assert store.get_many_calls == 2
+        np.testing.assert_array_equal(arr[:], data)
+
+
+class _KeyGetter:
+    """A byte getter of a key of a store that is not a store path."""
+
+    def __init__(self, store: Store, path: str) -> None:
+        self.store = store
+        self.path = path
+
+    async def get(
+        self, prototype: BufferPrototype, byte_range: ByteRequest | None = None
+    ) -> Buffer | None:
+        raise AssertionError("the key is read through get_many")
+
+
+class _ValueGetter:
+    """A byte getter of a value that is not in a store."""
+
+    def __init__(self, value: bytes) -> None:
+        self.value = value
+
+    async def get(
+        self, prototype: BufferPrototype, byte_range: ByteRequest | None = None
+    ) -> Buffer | None:
+        return prototype.buffer.from_bytes(self.value)
+
+
+async def test_fetch_batch_reads_keys_with_get_many() -> None:
+    store = _GetManyCountingStore()
+    for key in ["a", "b"]:
+        await store.set(key, cpu.Buffer.from_bytes(key.encode()))
+    prototype = default_buffer_prototype()
+    # byte getters that expose their store and path are read through it, whatever their
+    # type, and the other ones on their own
+    values = await fetch_batch(
+        [
+            (StorePath(store, "a"), prototype),
+            (_KeyGetter(store, "b"), prototype),
+            (None, prototype),
+            (_ValueGetter(b"c"), prototype),
+            (_KeyGetter(store, "a"), prototype),
+            (StorePath(store, "missing"), prototype),
+        ]
+    )
+    assert [None if value is None else value.to_bytes() for value in values] == [
+        b"a",
+        b"b",
+        None,
+        b"c",
+        b"a",
+        None,
+    ]
+    assert store.get_many_calls == 1
+
+
+@pytest.mark.parametrize("coordinate_batch_nbytes", [1, 1000, 2**24])
+@pytest.mark.parametrize("zarr_format", [2, 3])
+@pytest.mark.parametrize("shards", [None, (10, 10)])
+def test_coordinate_batches_roundtrip(
+    coordinate_batch_nbytes: int, zarr_format: Literal[2, 3], shards: tuple[int, int] | None
+) -> None:
+    if shards is not None and zarr_format == 2:
+        pytest.skip("sharding is not supported in Zarr format 2")
+    rng = np.random.default_rng(0)
+    data = np.zeros((20, 30))
+    # the first rows of chunks are missing
+    data[10:] = rng.random((10, 30))
+    with config.set({"codec_pipeline.coordinate_batch_nbytes": coordinate_batch_nbytes}):
+        arr = zarr.create_array(
+            {},
+            shape=data.shape,
+            chunks=(5, 5),
+            shards=shards,
+            dtype=data.dtype,
+            fill_value=0,
+            zarr_format=zarr_format,
+        )
+        arr[10:] = data[10:]
+
+        # unsorted and repeated points
+        ix = (rng.integers(0, 20, (7, 8)), rng.integers(0, 30, (7, 8)))
+        np.testing.assert_array_equal(arr.vindex[ix], data[ix])
+        mask = rng.random(data.shape) < 0.2
+        np.testing.assert_array_equal(arr.vindex[mask], data[mask])
+
+        ix = (rng.permutation(20)[:15], rng.permutation(30)[:15])
+        arr.vindex[ix] = np.arange(15)
+        data[ix] = np.arange(15)
+        arr.vindex[mask] = -1
+        data[mask] = -1
+        np.testing.assert_array_equal(arr[:], data)
+
+        # chunks that become empty are deleted
+        arr.vindex[np.ones(data.shape, dtype=bool)] = 0
+        assert arr.nchunks_initialized == 0
+
+
+def test_coordinate_batches_read_with_get_many() -> None:
+    store = _GetManyCountingStore()
+    data = np.arange(100, dtype="int32")
+    arr = zarr.create_array(store, shape=data.shape, chunks=(10,), dtype=data.dtype)
+    arr[:] = data
+    # all chunks touched by a coordinate selection fit in a single batch
+    ix = np.array([95, 3, 42, 17, 3])
+    np.testing.assert_array_equal(arr.vindex[ix], data[ix])
+    assert store.get_many_calls == 1
+    with config.set({"codec_pipeline.coordinate_batch_nbytes": 80}):
+        np.testing.assert_array_equal(arr.vindex[ix], data[ix])
+    assert store.get_many_calls == 1 + 2
+
+
+@pytest.mark.parametrize(
+    ("zarr_format", "codecs", "decoded_into"),
+    [
+        (3, {}, True),
+        (3, {"compressors": None}, True),
+        (3, {"compressors": zarr.codecs.BloscCodec()}, True),
+        (3, {"compressors": zarr.codecs.GzipCodec()}, True),
+        (3, {"compressors": [zarr.codecs.ZstdCodec(), zarr.codecs.Crc32cCodec()]}, True),
+        (3, {"serializer": zarr.codecs.BytesCodec(endian="big")}, False),
+        (2, {}, True),
+        (2, {"filters": [numcodecs.Delta(dtype="int32")]}, False),
+    ],
+)
+@pytest.mark.parametrize("streaming", [True, False])
+def test_decode_into_output(
+    zarr_format: Literal[2, 3],
+    codecs: dict[str, Any],
+    decoded_into: bool,
+    streaming: bool,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    results: list[bool] = []
+    decode_into = BatchedCodecPipeline._decode_into
+
+    async def _decode_into(self: BatchedCodecPipeline, *args: Any) -> bool:
+        result = await decode_into(self, *args)
+        results.append(result)
+        return result
+
+    monkeypatch.setattr(BatchedCodecPipeline, "_decode_into", _decode_into)
+    data = np.arange(1200, dtype="int32").reshape(40, 30)
+    arr = zarr.create_array(
+        {}, shape=(45, 30), chunks=(10, 30), dtype="int32", zarr_format=zarr_format, **codecs
+    )
+    arr[:40] = data
+    with config.set({"codec_pipeline.streaming": streaming, "codec_pipeline.batch_size": 2}):
+        # the chunks of the first 40 rows fill contiguous regions of the output, the
+        # last chunk is missing
+        np.testing.assert_array_equal(arr[:40], data)
+        assert results == [decoded_into] * 4
+        # chunks that are partially selected, or do not fill a contiguous region, are not
+        # decoded into the output
+        np.testing.assert_array_equal(arr[5:35], data[5:35])
+        np.testing.assert_array_equal(arr[:40, :20], data[:, :20])
+        np.testing.assert_array_equal(arr[:40:2], data[::2])
+        assert results == [decoded_into] * 6
@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+import numcodecs
 import numpy as np
 import pytest
 
@@ -12,14 +13,22 @@ import zarr.api
 import zarr.api.asynchronous
 from zarr import Array, AsyncArray, config
 from zarr.codecs import (
+    BloscCodec,
     BytesCodec,
+    Crc32cCodec,
     GzipCodec,
     ShardingCodec,
     TransposeCodec,
+    ZstdCodec,
 )
 from zarr.core.buffer import default_buffer_prototype
-from zarr.core.indexing import Selection, morton_order_iter
-from zarr.storage import StorePath
+from zarr.core.indexing import (
+    Selection,
+    decode_morton,
+    morton_order_iter,
+    morton_order_permutation,
+)
+from zarr.storage import MemoryStore, StorePath
 
 if TYPE_CHECKING:
     from zarr.abc.store import Store
@@ -216,6 +225,23 @@ def test_morton2(shape) -> None:
         assert all(x[j] < shape[j] for j in range(len(shape)))  # all indices are within bounds
 
 
+@pytest.mark.parametrize("shape", [(1,), (7,), (5, 2), (2, 9, 2), (3, 2, 12), (4, 3, 6, 2, 7)])
+def test_morton_matches_decode_morton(shape: tuple[int, ...]) -> None:
+    expected = []
+    z = 0
+    while len(expected) < np.prod(shape):
+        coords = decode_morton(z, shape)
+        if all(c < s for c, s in zip(coords, shape, strict=True)):
+            expected.append(coords)
+        z += 1
+    assert list(morton_order_iter(shape)) == expected
+
+    permutation = morton_order_permutation(shape)
+    assert permutation is morton_order_permutation(shape)
+    assert not permutation.flags.writeable
+    np.testing.assert_array_equal(np.array(np.unravel_index(permutation, shape)).T, expected)
+
+
 @pytest.mark.parametrize("store", ["local", "memory"], indirect=["store"])
 def test_write_partial_chunks(store: Store) -> None:
     data = np.arange(0, 256, dtype="uint16").reshape((16, 16))
@@ -406,3 +432,44 @@ async def test_resize(store: Store) -> None:
     assert await store.get(f"{path}/0.1", prototype=default_buffer_prototype()) is not None
     assert await store.get(f"{path}/1.0", prototype=default_buffer_prototype()) is None
     assert await store.get(f"{path}/1.1", prototype=default_buffer_prototype()) is None
+
+
+@pytest.mark.parametrize("executor", ["thread", "process", "inline"])
+@pytest.mark.parametrize(
+    ("dtype", "codecs_kwargs"),
+    [
+        ("uint16", {"compressors": [GzipCodec(), Crc32cCodec()]}),
+        ("uint16", {"compressors": BloscCodec()}),
+        ("uint16", {"compressors": ZstdCodec()}),
+        ("str", {}),
+    ],
+)
+def test_codec_executor(executor: str, dtype: str, codecs_kwargs: dict[str, Any]) -> None:
+    data = np.arange(64).astype(dtype).reshape(8, 8)
+    with config.set({"codec_pipeline.executor": executor}):
+        a = zarr.create_array(
+            StorePath(MemoryStore()),
+            shape=data.shape,
+            chunks=(4, 4),
+            dtype=data.dtype,
+            **codecs_kwargs,
+        )
+        a[:] = data
+        np.testing.assert_array_equal(a[:], data)
+
+
+@pytest.mark.parametrize("executor", ["thread", "process", "inline"])
+def test_codec_executor_v2(executor: str) -> None:
+    data = np.arange(64, dtype="float64").reshape(8, 8)
+    with config.set({"codec_pipeline.executor": executor}):
+        a = zarr.create_array(
+            StorePath(MemoryStore()),
+            shape=data.shape,
+            chunks=(4, 4),
+            dtype=data.dtype,
+            zarr_format=2,
+            filters=[numcodecs.Delta(dtype="float64")],
+            compressors=numcodecs.Zlib(),
+        )
+        a[:] = data
+        np.testing.assert_array_equal(a[:], data)
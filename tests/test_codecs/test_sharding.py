@@ -1,4 +1,7 @@
+import asyncio
+import gc
 import pickle
+from dataclasses import replace
 from typing import Any
 
 import numpy as np
@@ -9,17 +12,25 @@ import zarr
 import zarr.api
 import zarr.api.asynchronous
 from zarr import Array
-from zarr.abc.store import Store
+from zarr.abc.store import ByteRequest, Store
 from zarr.codecs import (
     BloscCodec,
+    BytesCodec,
+    Crc32cCodec,
+    GzipCodec,
     ShardingCodec,
     ShardingCodecIndexLocation,
     TransposeCodec,
 )
-from zarr.core.buffer import default_buffer_prototype
-from zarr.storage import StorePath
+from zarr.codecs.sharding import (
+    ShardCompactionReport,
+    _coalesce_byte_ranges,
+)
+from zarr.core.buffer import Buffer, BufferPrototype, default_buffer_prototype
+from zarr.core.codec_pipeline import BatchedCodecPipeline
+from zarr.storage import LoggingStore, MemoryStore, StorePath
 
-from ..conftest import ArrayRequest
+from ..conftest import ArrayRequest, ProcessCache
 from .test_codecs import _AsyncArrayProxy, order_from_dim
 
 
@@ -477,3 +488,397 @@ def test_invalid_metadata(store: Store) -> None:
             dtype=np.dtype("uint8"),
             fill_value=0,
         )
+
+
+@pytest.mark.parametrize("process_cache", ["shard_index_cache"], indirect=True)
+@pytest.mark.parametrize("store", ["local", "memory"], indirect=["store"])
+def test_shard_index_cache(process_cache: ProcessCache, store: Store) -> None:
+    data = np.arange(64 * 64, dtype="uint16").reshape(64, 64)
+    a = zarr.create_array(
+        StorePath(store, path="cached"),
+        shape=data.shape,
+        chunks=(8, 8),
+        shards=(32, 32),
+        dtype=data.dtype,
+    )
+    a[:] = data
+
+    np.testing.assert_array_equal(a[:8, :8], data[:8, :8])
+    assert process_cache.info().misses == 1
+    assert process_cache.info().hits == 0
+    np.testing.assert_array_equal(a[8:16, :8], data[8:16, :8])
+    assert process_cache.info().hits == 1
+    assert process_cache.info().size == 1
+    assert process_cache.info().nbytes == 4 * 4 * 2 * 8
+
+    # writing a shard invalidates its index
+    a[:8, :8] = 0
+    assert process_cache.info().size == 0
+    np.testing.assert_array_equal(a[:8, :8], 0)
+    np.testing.assert_array_equal(a[8:16, :8], data[8:16, :8])
+    assert process_cache.info().misses == 2
+
+
+@pytest.mark.parametrize("process_cache", ["shard_index_cache"], indirect=True)
+@pytest.mark.usefixtures("process_cache")
+def test_shard_index_cache_invalidated_by_shard_rewrites() -> None:
+    # transposed shards support partial reads, but are always rewritten as a whole
+    with pytest.warns(UserWarning, match="disables partial writes"):
+        a = zarr.create_array(
+            MemoryStore(),
+            shape=(16, 16),
+            chunks=(16, 16),
+            dtype="float64",
+            filters=[TransposeCodec(order=(1, 0))],
+            serializer=ShardingCodec(chunk_shape=(8, 8), codecs=[BytesCodec(), GzipCodec()]),
+            compressors=None,
+        )
+    a[:] = np.ones(a.shape)
+    np.testing.assert_array_equal(a[0, 8:10], 1)
+    data = np.random.default_rng(0).random(a.shape)
+    a[:] = data
+    np.testing.assert_array_equal(a[0, 8:10], data[0, 8:10])
+
+    # deleting the shard invalidates its index, too
+    a[:] = a.fill_value
+    np.testing.assert_array_equal(a[0, 8:10], a.fill_value)
+    a[:] = data
+    np.testing.assert_array_equal(a[0, 8:10], data[0, 8:10])
+
+
+@pytest.mark.parametrize("process_cache", ["shard_index_cache"], indirect=True)
+def test_shard_index_cache_invalidated_by_overwrite(process_cache: ProcessCache) -> None:
+    store = MemoryStore()
+    a = zarr.create_array(store, name="x", shape=(64,), chunks=(8,), shards=(32,), dtype="uint8")
+    a[:] = 1
+    np.testing.assert_array_equal(a[:8], 1)
+    assert process_cache.info().size == 1
+    b = zarr.create_array(
+        store, name="x", shape=(64,), chunks=(8,), shards=(32,), dtype="uint8", overwrite=True
+    )
+    assert process_cache.info().size == 0
+    b[8:16] = 2
+    np.testing.assert_array_equal(b[:16], [0] * 8 + [2] * 8)
+
+
+@pytest.mark.parametrize("process_cache", ["shard_index_cache"], indirect=True)
+def test_shard_index_cache_forgets_collected_stores(process_cache: ProcessCache) -> None:
+    store = MemoryStore()
+    a = zarr.create_array(StorePath(store), shape=(64,), chunks=(8,), shards=(32,), dtype="uint8")
+    a[:] = 1
+    np.testing.assert_array_equal(a[:8], 1)
+    assert process_cache.info().size == 1
+    del a, store
+    gc.collect()
+    assert process_cache.info().size == 0
+
+
+@pytest.mark.parametrize(
+    ("byte_ranges", "max_gap", "expected"),
+    [
+        ([], 0, []),
+        ([(0, 10), (10, 20)], 0, [(0, 20, [0, 1])]),
+        ([(0, 10), (12, 20)], 0, [(0, 10, [0]), (12, 20, [1])]),
+        ([(0, 10), (12, 20)], 2, [(0, 20, [0, 1])]),
+        ([(30, 40), (0, 10), (10, 20)], 5, [(0, 20, [1, 2]), (30, 40, [0])]),
+    ],
+)
+def test_coalesce_byte_ranges(
+    byte_ranges: list[tuple[int, int]],
+    max_gap: int,
+    expected: list[tuple[int, int, list[int]]],
+) -> None:
+    assert _coalesce_byte_ranges(byte_ranges, max_gap) == expected
+
+
+@pytest.mark.parametrize("max_gap", [0, 2**16])
+@pytest.mark.parametrize("index_location", ["start", "end"])
+def test_sharding_partial_read_coalesced(
+    max_gap: int, index_location: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    memory_store = MemoryStore()
+    store = LoggingStore(memory_store)
+    data = np.arange(256, dtype="uint8")
+    a = zarr.create_array(
+        StorePath(store),
+        shape=data.shape,
+        chunks=(8,),
+        shards={"shape": (128,), "index_location": index_location},
+        dtype=data.dtype,
+        compressors=None,
+    )
+    a[:] = data
+    store.counter.clear()
+
+    requested_ranges: list[int] = []
+    get_partial_values = memory_store.get_partial_values
+
+    async def spy(prototype: Any, key_ranges: Any) -> Any:
+        key_ranges = list(key_ranges)
+        requested_ranges.append(len(key_ranges))
+        return await get_partial_values(prototype, key_ranges)
+
+    monkeypatch.setattr(memory_store, "get_partial_values", spy)
+    with zarr.config.set(
+        {"sharding.read_coalesce_max_gap": max_gap, "sharding.index_cache_size": 0}
+    ):
+        np.testing.assert_array_equal(a[8:40], data[8:40])
+        np.testing.assert_array_equal(a.oindex[[0, 20, 100]], data[[0, 20, 100]])
+    # one request for the shard index and a single batch of chunk requests per read
+    assert store.counter["get"] == 2
+    assert store.counter["get_partial_values"] == 2
+    assert requested_ranges == ([1, 3] if max_gap == 0 else [1, 1])
+
+
+def test_sharding_decode_across_shards(monkeypatch: pytest.MonkeyPatch) -> None:
+    data = np.arange(64 * 64, dtype="uint16").reshape(64, 64)
+    with zarr.config.set({"codec_pipeline.batch_size": 4}):
+        a = zarr.create_array(
+            StorePath(MemoryStore()),
+            shape=data.shape,
+            chunks=(8, 8),
+            shards=(16, 16),
+            dtype=data.dtype,
+        )
+    a[:] = data
+
+    decoded_plans: list[int] = []
+    decode_inner_chunks = ShardingCodec._decode_inner_chunks
+
+    async def spy(self: ShardingCodec, plans: Any) -> None:
+        plans = list(plans)
+        decoded_plans.append(len(plans))
+        await decode_inner_chunks(self, plans)
+
+    monkeypatch.setattr(ShardingCodec, "_decode_inner_chunks", spy)
+    np.testing.assert_array_equal(a[4:60, 4:60], data[4:60, 4:60])
+    # the inner chunks of the shards of each mini-batch are decoded in a single work queue
+    assert decoded_plans == [4, 4, 4, 4]
+
+
+def test_sharding_decode_budget_shared_across_shards(monkeypatch: pytest.MonkeyPatch) -> None:
+    data = np.arange(64 * 64, dtype="uint16").reshape(64, 64)
+    a = zarr.create_array(
+        MemoryStore(), shape=data.shape, chunks=(8, 8), shards=(16, 16), dtype=data.dtype
+    )
+    a[:] = data
+
+    active = 0
+    max_active = 0
+    decode = BatchedCodecPipeline.decode
+
+    async def spy(self: BatchedCodecPipeline, chunk_bytes_and_specs: Any) -> Any:
+        nonlocal active, max_active
+        chunk_bytes_and_specs = list(chunk_bytes_and_specs)
+        # only the decodes of inner chunks are counted, not those of whole shards or indexes
+        if any(chunk_spec.shape != (8, 8) for _, chunk_spec in chunk_bytes_and_specs):
+            return await decode(self, chunk_bytes_and_specs)
+        active += 1
+        max_active = max(max_active, active)
+        try:
+            await asyncio.sleep(0.001)
+            return await decode(self, chunk_bytes_and_specs)
+        finally:
+            active -= 1
+
+    monkeypatch.setattr(BatchedCodecPipeline, "decode", spy)
+    np.testing.assert_array_equal(a[:], data)
+    # with the default configuration, every shard is fetched by its own mini-batch, and the
+    # inner chunks of the shards in flight are decoded within one budget
+    assert zarr.config.get("codec_pipeline.batch_size") == 1
+    assert 4 < max_active <= zarr.config.get("async.concurrency")
+
+
+async def test_sharding_decode_iterator() -> None:
+    store = MemoryStore()
+    data = np.arange(32 * 32, dtype="uint16").reshape(32, 32)
+    a = zarr.create_array(store, shape=data.shape, chunks=(8, 8), shards=(16, 16), dtype=data.dtype)
+    a[:] = data
+    codec = a.metadata.codecs[0]
+    assert isinstance(codec, ShardingCodec)
+    shard_spec = a.metadata.get_chunk_spec(
+        (0, 1), a._async_array._config, default_buffer_prototype()
+    )
+    shard_bytes = await store.get("c/0/1", prototype=default_buffer_prototype())
+
+    # codec pipelines pass batches as one-shot iterators
+    (shard,) = await codec.decode(iter([(shard_bytes, shard_spec)]))
+    assert shard is not None
+    np.testing.assert_array_equal(shard.as_numpy_array(), data[:16, 16:])
+
+
+@pytest.mark.parametrize("index_location", ["start", "end"])
+async def test_sharding_partial_read_through_transpose_and_crc32c(
+    monkeypatch: pytest.MonkeyPatch, index_location: str
+) -> None:
+    store = MemoryStore()
+    data = np.arange(32 * 32, dtype="uint16").reshape(32, 32)
+    with pytest.warns(UserWarning, match="disables partial writes"):
+        a = zarr.create_array(
+            store,
+            shape=data.shape,
+            chunks=data.shape,
+            dtype=data.dtype,
+            filters=[TransposeCodec(order=(1, 0))],
+            serializer=ShardingCodec(chunk_shape=(8, 8), index_location=index_location),
+            compressors=[Crc32cCodec()],
+        )
+    a[:] = data
+    assert a._async_array.codec_pipeline.supports_partial_decode
+
+    byte_ranges: list[ByteRequest | None] = []
+    get = MemoryStore.get
+
+    async def spy(
+        self: MemoryStore,
+        key: str,
+        prototype: BufferPrototype,
+        byte_range: ByteRequest | None = None,
+    ) -> Buffer | None:
+        byte_ranges.append(byte_range)
+        return await get(self, key, prototype, byte_range)
+
+    monkeypatch.setattr(MemoryStore, "get", spy)
+    with zarr.config.set(
+        {"sharding.index_cache_size": 0, "sharding.verify_partial_checksums": False}
+    ):
+        assert a[3, 21] == data[3, 21]
+        np.testing.assert_array_equal(a[2:5, 9:13], data[2:5, 9:13])
+        np.testing.assert_array_equal(a.vindex[[1, 30], [2, 17]], data[[1, 30], [2, 17]])
+    # only the shard index and the needed inner chunks are read
+    assert None not in byte_ranges
+
+    # by default, partial reads fetch and verify the whole shard once
+    byte_ranges.clear()
+    np.testing.assert_array_equal(a[2:5, 9:13], data[2:5, 9:13])
+    assert byte_ranges == [None]
+
+    # the checksum is verified when the whole shard is read
+    byte_ranges.clear()
+    np.testing.assert_array_equal(a[:], data)
+    assert byte_ranges == [None]
+    shard = store._store_dict["c/0/0"]
+    store._store_dict["c/0/0"] = shard.__class__.from_bytes(b"\xff" + shard.to_bytes()[1:])
+    with pytest.raises(ValueError, match="checksum"):
+        a[:]
+    with pytest.raises(ValueError, match="checksum"):
+        a[3, 21]
+
+
+@pytest.mark.parametrize("store", ["local", "memory"], indirect=["store"])
+@pytest.mark.parametrize("index_location", ["start", "end"])
+async def test_sharding_append_write_mode(store: Store, index_location: str) -> None:
+    spath = StorePath(store, "append")
+    data = np.arange(32 * 32, dtype="uint16").reshape(32, 32)
+    a = zarr.create_array(
+        spath,
+        shape=data.shape,
+        chunks=(8, 8),
+        shards={"shape": (32, 32), "index_location": index_location},
+        dtype=data.dtype,
+        compressors=None,
+    )
+    a[:] = data
+    shard_nbytes = await store.getsize("append/c/0/0")
+    chunk_nbytes = 8 * 8 * 2
+
+    with zarr.config.set({"sharding.write_mode": "append"}):
+        # a partial update of one inner chunk only appends that chunk
+        a[2:4, 2:4] = 0
+        data[2:4, 2:4] = 0
+        assert await store.getsize("append/c/0/0") == shard_nbytes + chunk_nbytes
+        np.testing.assert_array_equal(a[:], data)
+
+        # a full update of two inner chunks only appends those chunks
+        a[8:16, :16] = 1
+        data[8:16, :16] = 1
+        assert await store.getsize("append/c/0/0") == shard_nbytes + 3 * chunk_nbytes
+        np.testing.assert_array_equal(a[:], data)
+
+        # deleted inner chunks are removed from the index
+        a[24:, 24:] = 0
+        data[24:, 24:] = 0
+        np.testing.assert_array_equal(a[:], data)
+
+        # the shard is deleted once all of its inner chunks are empty
+        a[:16, :] = 0
+        a[16:, :] = 0
+        assert not await store.exists("append/c/0/0")
+        np.testing.assert_array_equal(a[:], 0)
+
+
+def test_sharding_append_write_mode_new_shard() -> None:
+    store = MemoryStore()
+    a = zarr.create_array(
+        StorePath(store), shape=(64,), chunks=(8,), shards=(32,), dtype="uint8", compressors=None
+    )
+    with zarr.config.set({"sharding.write_mode": "append"}):
+        # shards that do not exist yet are written in full
+        a[:8] = 1
+        assert len(store._store_dict["c/0"]) == 8 + 4 * 16 + 4
+        np.testing.assert_array_equal(a[:8], 1)
+
+
+def test_sharding_invalid_write_mode() -> None:
+    a = zarr.create_array(
+        StorePath(MemoryStore()), shape=(64,), chunks=(8,), shards=(32,), dtype="uint8"
+    )
+    with (
+        zarr.config.set({"sharding.write_mode": "inplace"}),
+        pytest.raises(ValueError, match="sharding.write_mode"),
+    ):
+        a[:8] = 1
+
+
+@pytest.mark.parametrize("index_location", ["start", "end"])
+async def test_compact_shards(index_location: str) -> None:
+    store = MemoryStore()
+    data = np.arange(32 * 64, dtype="uint16").reshape(32, 64)
+    a = zarr.create_array(
+        StorePath(store, "compact"),
+        shape=data.shape,
+        chunks=(8, 8),
+        shards={"shape": (32, 32), "index_location": index_location},
+        dtype=data.dtype,
+        compressors=None,
+    )
+    a[:] = data
+    shard_nbytes = await store.getsize("compact/c/0/0")
+    chunk_nbytes = 8 * 8 * 2
+
+    report = zarr.compact_shards(store, path="compact", dry_run=True)
+    assert report == ShardCompactionReport(
+        nshards=2,
+        nshards_fragmented=0,
+        nshards_compacted=0,
+        nbytes_wasted=0,
+        nchunks_out_of_order=0,
+    )
+
+    with zarr.config.set({"sharding.write_mode": "append"}):
+        a[2:4, 2:4] = 0
+        data[2:4, 2:4] = 0
+    # the replaced first chunk is stored after all others, so neither it nor its
+    # successor in Morton order directly follows the previous chunk
+    fragmented = ShardCompactionReport(
+        nshards=2,
+        nshards_fragmented=1,
+        nshards_compacted=0,
+        nbytes_wasted=chunk_nbytes,
+        nchunks_out_of_order=2,
+    )
+    assert zarr.compact_shards(store, path="compact", dry_run=True) == fragmented
+    assert await store.getsize("compact/c/0/0") == shard_nbytes + chunk_nbytes
+
+    report = zarr.compact_shards(store, path="compact", max_memory=1)
+    assert report == replace(fragmented, nshards_compacted=1)
+    assert await store.getsize("compact/c/0/0") == shard_nbytes
+    assert zarr.compact_shards(store, path="compact").nshards_fragmented == 0
+    np.testing.assert_array_equal(a[:], data)
+
+
+def test_compact_shards_unsharded() -> None:
+    store = MemoryStore()
+    zarr.create_array(store, shape=(64,), chunks=(8,), dtype="uint8")
+    with pytest.raises(ValueError, match="sharding_indexed"):
+        zarr.compact_shards(store)
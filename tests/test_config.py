@@ -51,7 +51,10 @@ def test_config_defaults_set() -> None:
             "default_zarr_format": 3,
             "array": {
                 "order": "C",
+                "chunk_cache_size": 0,
+                "buffer_pool_size": 0,
                 "write_empty_chunks": False,
+                "chunk_manifest": False,
                 "v2_default_compressor": {
                     "numeric": {"id": "zstd", "level": 0, "checksum": False},
                     "string": {"id": "zstd", "level": 0, "checksum": False},
@@ -86,6 +89,16 @@ def test_config_defaults_set() -> None:
             "codec_pipeline": {
                 "path": "zarr.core.codec_pipeline.BatchedCodecPipeline",
                 "batch_size": 1,
+                "coordinate_batch_nbytes": 2**24,
+                "streaming": False,
+                "executor": "thread",
+            },
+            "metadata_cache": {"ttl": 0, "size": 2**24},
+            "sharding": {
+                "index_cache_size": 0,
+                "read_coalesce_max_gap": 2**16,
+                "verify_partial_checksums": True,
+                "write_mode": "rewrite",
             },
             "buffer": "zarr.core.buffer.cpu.Buffer",
             "ndbuffer": "zarr.core.buffer.cpu.NDBuffer",
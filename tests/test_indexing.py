@@ -13,9 +13,13 @@ from numpy.testing import assert_array_equal
 import zarr
 from zarr import Array
 from zarr.core.buffer import default_buffer_prototype
+from zarr.core.chunk_grids import RegularChunkGrid
 from zarr.core.indexing import (
+    BasicIndexer,
     BasicSelection,
+    CoordinateIndexer,
     CoordinateSelection,
+    OrthogonalIndexer,
     OrthogonalSelection,
     Selection,
     _iter_grid,
@@ -1953,3 +1957,66 @@ def test_vectorized_indexing_incompatible_shape(store) -> None:
     )
     with pytest.raises(ValueError, match="Attempting to set"):
         arr[np.array([1, 2]), np.array([1, 2])] = np.array([[-1, -2], [-3, -4]])
+
+
+@pytest.mark.parametrize(
+    ("selection", "indexer_class"),
+    [
+        ((slice(None), slice(None)), BasicIndexer),
+        ((slice(3, 17, 2), 5), BasicIndexer),
+        ((slice(9, 9), slice(None)), BasicIndexer),
+        ((np.array([15, 1, 8, 8]), slice(2, 11)), OrthogonalIndexer),
+        ((np.arange(20) % 3 == 0, [4, 18]), OrthogonalIndexer),
+    ],
+)
+def test_chunk_projection_plan(selection: Any, indexer_class: type) -> None:
+    shape = (20, 19)
+    chunk_grid = RegularChunkGrid(chunk_shape=(4, 3))
+    indexer = indexer_class(selection, shape, chunk_grid)
+    plan = indexer.plan()
+
+    # the plan is iterated in C order of the chunks, like the original per chunk projection
+    projections = list(plan)
+    assert len(projections) == len(plan)
+    assert [p.chunk_coords for p in projections] == [tuple(c) for c in plan.chunk_coords.tolist()]
+
+    # and assembles the selection from the projections
+    a = np.arange(np.prod(shape)).reshape(shape)
+    out = np.zeros(indexer.shape, dtype=a.dtype)
+    for chunk_coords, chunk_selection, out_selection in projections:
+        chunk_slices = tuple(
+            slice(c * n, (c + 1) * n) for c, n in zip(chunk_coords, (4, 3), strict=True)
+        )
+        out[out_selection] = a[chunk_slices][chunk_selection]
+    assert_array_equal(out, oindex(a, selection))
+
+
+@pytest.mark.parametrize("max_chunks", [1, 3, 100])
+@pytest.mark.parametrize("sort", [True, False])
+def test_coordinate_indexer_batches(max_chunks: int, sort: bool) -> None:
+    shape = (20, 19)
+    rng = np.random.default_rng(0)
+    selection = (rng.integers(0, 20, 50), rng.integers(0, 19, 50))
+    if sort:
+        selection = tuple(np.sort(dim_sel) for dim_sel in selection)
+    indexer = CoordinateIndexer(selection, shape, RegularChunkGrid(chunk_shape=(4, 3)))
+    batches = list(indexer.batches(max_chunks))
+    assert all(len(batch.chunk_coords) <= max_chunks for batch in batches)
+
+    # the batches hold the projections of the chunks, in order
+    projections = [p for batch in batches for p in batch.projections()]
+    assert [p.chunk_coords for p in projections] == [p.chunk_coords for p in indexer]
+
+    # and gather the selected items from the chunks
+    a = np.arange(np.prod(shape)).reshape(shape)
+    out = np.zeros(indexer.shape, dtype=a.dtype)
+    for batch in batches:
+        chunk_ixs = np.repeat(np.arange(len(batch.chunk_coords)), np.diff(batch.chunk_offsets))
+        chunk_offsets = np.array(batch.chunk_coords) * (4, 3)
+        out[batch.out_selection] = a[
+            tuple(
+                dim_sel + chunk_offsets[chunk_ixs, dim]
+                for dim, dim_sel in enumerate(batch.chunk_selection)
+            )
+        ]
+    assert_array_equal(out, a[selection])
@@ -0,0 +1,156 @@
+import gc
+import time
+
+import pytest
+
+from zarr.core._lru import CacheInfo, LRUCache, StoreToken, store_token
+
+
+def test_lru_cache_get_set() -> None:
+    cache: LRUCache[str, bytes] = LRUCache(10, sizeof=len)
+    assert cache.get("a") is None
+    cache.set("a", b"1234")
+    assert cache.get("a") == b"1234"
+    assert "a" in cache
+    assert len(cache) == 1
+    assert cache.info() == CacheInfo(hits=1, misses=1, evictions=0, size=1, nbytes=4, max_nbytes=10)
+
+
+def test_lru_cache_evicts_least_recently_used() -> None:
+    cache: LRUCache[str, bytes] = LRUCache(10, sizeof=len)
+    cache.set("a", b"1234")
+    cache.set("b", b"1234")
+    cache.get("a")  # "b" is now the least recently used entry
+    cache.set("c", b"1234")
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.info().evictions == 1
+    assert cache.info().nbytes == 8
+
+
+def test_lru_cache_replace_and_pop() -> None:
+    cache: LRUCache[str, bytes] = LRUCache(10, sizeof=len)
+    cache.set("a", b"1234")
+    cache.set("a", b"12")
+    assert cache.info().nbytes == 2
+    assert cache.pop("a") == b"12"
+    assert cache.pop("a") is None
+    assert cache.info().nbytes == 0
+
+
+def test_lru_cache_oversized_value() -> None:
+    cache: LRUCache[str, bytes] = LRUCache(4, sizeof=len)
+    cache.set("a", b"12")
+    cache.set("a", b"12345")
+    assert "a" not in cache
+    assert cache.info().evictions == 0
+
+
+def test_lru_cache_pop_matching() -> None:
+    cache: LRUCache[tuple[int, str], bytes] = LRUCache(100, sizeof=len)
+    cache.set((1, "a"), b"1")
+    cache.set((1, "b"), b"1")
+    cache.set((2, "a"), b"1")
+    cache.pop_matching(lambda key: key[0] == 1)
+    assert len(cache) == 1
+    assert (2, "a") in cache
+
+
+def test_lru_cache_resize_and_clear() -> None:
+    cache: LRUCache[str, bytes] = LRUCache(10, sizeof=len)
+    cache.set("a", b"1234")
+    cache.set("b", b"1234")
+    cache.resize(4)
+    assert len(cache) == 1
+    assert "b" in cache
+    cache.clear()
+    assert cache.info() == CacheInfo(hits=0, misses=0, evictions=0, size=0, nbytes=0, max_nbytes=4)
+    with pytest.raises(ValueError, match="non-negative"):
+        cache.resize(-1)
+
+
+def test_lru_cache_on_evict() -> None:
+    evicted: list[tuple[str, bytes]] = []
+    cache: LRUCache[str, bytes] = LRUCache(
+        4, sizeof=len, on_evict=lambda key, value: evicted.append((key, value))
+    )
+    cache.set("a", b"12")
+    cache.set("b", b"12")
+    cache.set("c", b"12")
+    cache.set("d", b"12345")
+    cache.pop("b")
+    assert evicted == [("a", b"12"), ("d", b"12345")]
+
+
+def test_lru_cache_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = 0.0
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    cache: LRUCache[str, bytes] = LRUCache(10, sizeof=len, ttl=5)
+    cache.set("a", b"1")
+    now = 4.9
+    assert cache.get("a") == b"1"
+    now = 5.0
+    assert cache.get("a") is None
+    assert "a" not in cache
+    assert (cache.info().hits, cache.info().misses) == (1, 1)
+
+
+def test_lru_cache_groups() -> None:
+    cache: LRUCache[tuple[int, str], bytes] = LRUCache(
+        3, sizeof=len, groups=lambda key: ((key[0],), key)
+    )
+    cache.set((1, "a"), b"1")
+    cache.set((1, "b"), b"1")
+    cache.set((2, "a"), b"1")
+    cache.pop_group((1, "a"))
+    assert (1, "a") not in cache
+    cache.pop_matching(lambda key: True, group=(2,))
+    assert len(cache) == 1
+    cache.set((1, "c"), b"1")
+    cache.set((2, "b"), b"1")
+    cache.set((2, "c"), b"1")  # evicts (1, "b")
+    cache.pop_group((1,))
+    assert len(cache) == 2
+    assert cache._groups == {(2,): {(2, "b"), (2, "c")}, (2, "b"): {(2, "b")}, (2, "c"): {(2, "c")}}
+
+
+def test_lru_cache_generation() -> None:
+    cache: LRUCache[str, bytes] = LRUCache(10, sizeof=len, groups=lambda key: (key[0],))
+    generation = cache.generation
+    cache.set("a", b"1", generation)
+    assert cache.get("a") == b"1"
+    cache.set("bc", b"12")  # evictions and writes are not invalidations
+    assert cache.generation == generation
+    # a value read before an invalidation is not cached
+    for invalidate in (
+        lambda: cache.pop("x"),
+        lambda: cache.pop_group("x"),
+        lambda: cache.pop_matching(lambda key: False),
+        cache.clear,
+    ):
+        invalidate()
+        cache.set("d", b"1", generation)
+        assert "d" not in cache
+        generation = cache.generation
+
+
+def test_lru_cache_track_store() -> None:
+    class Store:
+        def __str__(self) -> str:
+            return "store://a"
+
+    cache: LRUCache[tuple[StoreToken, str], bytes] = LRUCache(
+        10, sizeof=len, groups=lambda key: ((key[0],),)
+    )
+    store = Store()
+    token = cache.track_store(store)
+    assert token == store_token(store) == (Store, "store://a")
+    assert cache.track_store(store) == token
+    cache.set((token, "a"), b"1")
+    cache.set((("other", ""), "a"), b"1")
+    # the entries of a store are removed when it is garbage collected
+    del store
+    gc.collect()
+    assert len(cache) == 1
+    assert cache._stores == set()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import itertools
 import json
 import re
 from typing import TYPE_CHECKING, Literal
@@ -411,3 +412,24 @@ def test_dtypes(dtype_str: str) -> None:
     else:
         # return type for vlen types may vary depending on numpy version
         assert dt.byte_count is None
+
+
+@pytest.mark.parametrize(
+    "chunk_key_encoding",
+    [
+        DefaultChunkKeyEncoding(separator="/"),
+        DefaultChunkKeyEncoding(separator="."),
+        V2ChunkKeyEncoding(separator="."),
+        V2ChunkKeyEncoding(separator="/"),
+    ],
+)
+@pytest.mark.parametrize("dim_chunk_ixs", [(), ([3],), ([0, 2], [11], [1, 5, 7])])
+def test_encode_chunk_keys(
+    chunk_key_encoding: DefaultChunkKeyEncoding | V2ChunkKeyEncoding,
+    dim_chunk_ixs: tuple[list[int], ...],
+) -> None:
+    expected = [
+        chunk_key_encoding.encode_chunk_key(chunk_coords)
+        for chunk_coords in itertools.product(*dim_chunk_ixs)
+    ]
+    assert list(chunk_key_encoding.encode_chunk_keys(dim_chunk_ixs)) == expected
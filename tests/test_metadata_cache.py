@@ -0,0 +1,59 @@
+import pytest
+
+import zarr
+from zarr.core.metadata_cache import metadata_cache_info
+from zarr.storage import LoggingStore, MemoryStore
+
+
+pytestmark = [
+    pytest.mark.parametrize("process_cache", ["metadata_cache"], indirect=True),
+    pytest.mark.usefixtures("process_cache"),
+]
+
+
+def test_metadata_cache() -> None:
+    store = LoggingStore(MemoryStore())
+    root = zarr.create_group(store)
+    root.create_array("a", shape=(10,), dtype="int32")
+
+    zarr.open_group(store, mode="r")["a"]
+    zarr.open_array(store, path="a", mode="r")
+    gets = store.counter["get"]
+    # opening nodes again does not touch the store, including the probes of keys that
+    # do not exist
+    zarr.open_group(store, mode="r")["a"]
+    zarr.open_array(store, path="a", mode="r")
+    assert store.counter["get"] == gets
+    assert metadata_cache_info().hits > 0
+
+
+def test_metadata_cache_invalidated_by_writes() -> None:
+    store = MemoryStore()
+    a = zarr.create_array(store, shape=(10,), dtype="int32")
+    assert zarr.open_array(store, mode="r").shape == (10,)
+
+    a.resize((20,))
+    a.attrs["foo"] = "bar"
+    b = zarr.open_array(store, mode="r")
+    assert b.shape == (20,)
+    assert b.attrs["foo"] == "bar"
+
+    # a cached missing document is invalidated by creating the node
+    with pytest.raises(FileNotFoundError):
+        zarr.open_group(store, path="g", mode="r")
+    zarr.create_group(store, path="g")
+    zarr.open_group(store, path="g", mode="r")
+
+    # and cached documents by deleting the node
+    zarr.create_array(store, shape=(5,), dtype="int8", overwrite=True)
+    assert zarr.open_array(store, mode="r").shape == (5,)
+
+
+def test_metadata_cache_ttl() -> None:
+    store = LoggingStore(MemoryStore())
+    zarr.create_array(store, shape=(10,), dtype="int32")
+    with zarr.config.set({"metadata_cache.ttl": 1e-9}):
+        zarr.open_array(store, mode="r")
+        gets = store.counter["get"]
+        zarr.open_array(store, mode="r")
+        assert store.counter["get"] > gets
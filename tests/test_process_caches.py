@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+import zarr
+from zarr.abc.store import Store
+from zarr.storage import LocalStore, MemoryStore
+from zarr.storage._wrapper import WrapperStore
+
+from .conftest import PROCESS_CACHES, ProcessCache
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterable
+    from pathlib import Path
+
+    from zarr.abc.store import ByteRequest
+    from zarr.core.buffer import Buffer, BufferPrototype
+
+
+def _shards(cache: ProcessCache, shape: tuple[int, ...]) -> tuple[int, ...] | None:
+    # decoded chunks are not cached for sharded arrays, and shard indexes only for the
+    # reads of parts of shards
+    return shape if cache.name == "shard_index_cache" else None
+
+
+@pytest.mark.parametrize("cache", PROCESS_CACHES.values(), ids=PROCESS_CACHES.keys())
+def test_process_cache_disabled_by_default(cache: ProcessCache) -> None:
+    def exercise() -> None:
+        store = MemoryStore()
+        data = np.arange(512 * 512, dtype="int32").reshape(512, 512)
+        a = zarr.create_array(
+            store,
+            shape=data.shape,
+            chunks=(128, 128),
+            shards=_shards(cache, data.shape),
+            dtype=data.dtype,
+        )
+        a[:] = data
+        a[3:500, 3:500] = 0
+        data[3:500, 3:500] = 0
+        b = zarr.open_array(store, mode="r")
+        np.testing.assert_array_equal(b[1:255, 1:255], data[1:255, 1:255])
+
+    cache.clear()
+    exercise()
+    assert cache.info().size == 0
+    assert cache.info().misses == 0
+    # the same operations use the cache once it is enabled
+    with zarr.config.set(cache.enable):
+        exercise()
+    assert cache.info().misses > 0
+    cache.clear()
+
+
+@pytest.mark.parametrize(
+    "process_cache", ["chunk_cache", "metadata_cache", "shard_index_cache"], indirect=True
+)
+@pytest.mark.parametrize("reopen_store", [False, True])
+def test_process_cache_sees_writes_of_other_handles(
+    process_cache: ProcessCache, reopen_store: bool, tmp_path: Path
+) -> None:
+    store = LocalStore(tmp_path)
+    data = np.arange(64, dtype="int32")
+    a = zarr.create_array(
+        store, shape=(64,), chunks=(8,), shards=_shards(process_cache, (32,)), dtype="int32"
+    )
+    a[:] = data
+    np.testing.assert_array_equal(zarr.open_array(store, mode="r")[1:20], data[1:20])
+    assert process_cache.info().size > 0
+
+    # another array handle, over the same store or another store for the same location
+    b = zarr.open_array(LocalStore(tmp_path) if reopen_store else store)
+    b[:8] = -1
+    data[:8] = -1
+    b.attrs["written"] = True
+    np.testing.assert_array_equal(a[1:20], data[1:20])
+    c = zarr.open_array(store, mode="r")
+    assert c.attrs["written"] is True
+    np.testing.assert_array_equal(c[1:20], data[1:20])
+
+
+class _WriteDuringRead(WrapperStore[Store]):
+    """Runs a write after reading a value of ``key`` and before returning it, as if the
+    write raced the read."""
+
+    key: str | None = None
+    write: Callable[[], Awaitable[object]] | None = None
+
+    async def _race(self, key: str) -> None:
+        if key == self.key and self.write is not None:
+            write, self.write = self.write, None
+            await write()
+
+    async def get(
+        self, key: str, prototype: BufferPrototype, byte_range: ByteRequest | None = None
+    ) -> Buffer | None:
+        value = await self._store.get(key, prototype, byte_range)
+        await self._race(key)
+        return value
+
+    async def get_partial_values(
+        self,
+        prototype: BufferPrototype,
+        key_ranges: Iterable[tuple[str, ByteRequest | None]],
+    ) -> list[Buffer | None]:
+        key_ranges = list(key_ranges)
+        values = await self._store.get_partial_values(prototype, key_ranges)
+        for key, _ in key_ranges:
+            await self._race(key)
+        return values
+
+    # reads many values through ``get``
+    get_many = Store.get_many
+
+
+@pytest.mark.parametrize(
+    ("process_cache", "key"),
+    [
+        ("chunk_cache", "c/0"),
+        ("metadata_cache", "zarr.json"),
+        ("shard_index_cache", "c/0"),
+    ],
+    indirect=["process_cache"],
+)
+def test_process_cache_read_racing_write(process_cache: ProcessCache, key: str) -> None:
+    # chunks are appended to shards, so that a read with the shard index from before the
+    # write finds the chunks from before the write
+    with zarr.config.set({"sharding.write_mode": "append"}):
+        store = _WriteDuringRead(MemoryStore())
+        a = zarr.create_array(
+            store, shape=(64,), chunks=(8,), shards=_shards(process_cache, (32,)), dtype="int32"
+        )
+        data = np.ones(64, dtype="int32")
+        a[:] = data
+        a.attrs["value"] = 1
+
+        async def write() -> None:
+            # a chunk that encodes to another size, so that the shard index changes, too
+            data[:8] = np.arange(8)
+            await a._async_array.setitem(slice(0, 8), data[:8])
+            await a._async_array.update_attributes({"value": 2})
+
+        store.key, store.write = key, write
+        # the read may see the values from before the write, but must not cache them
+        zarr.open_array(store, mode="r")[1:20]
+        assert store.write is None
+        b = zarr.open_array(store, mode="r")
+        assert b.attrs["value"] == 2
+        np.testing.assert_array_equal(b[1:20], data[1:20])
@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+import zarr
+import zarr.storage._caching
+from zarr.abc.store import RangeByteRequest
+from zarr.core.buffer import cpu, default_buffer_prototype
+from zarr.storage import CachingStore, LoggingStore, MemoryStore
+from zarr.testing.store import StoreTests
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Any
+
+    from zarr.core.buffer import Buffer
+
+
+class TestCachingStore(StoreTests[CachingStore, cpu.Buffer]):
+    store_cls = CachingStore
+    buffer_cls = cpu.Buffer
+
+    async def set(self, store: CachingStore, key: str, value: Buffer) -> None:
+        store._store._store_dict[key] = value
+
+    async def get(self, store: CachingStore, key: str) -> Buffer:
+        return store._store._store_dict[key]
+
+    @pytest.fixture(params=["memory", "disk"])
+    def store_kwargs(self, request: pytest.FixtureRequest, tmp_path: Path) -> dict[str, Any]:
+        return {
+            "store": MemoryStore(),
+            "cache_dir": tmp_path if request.param == "disk" else None,
+        }
+
+    @pytest.fixture
+    async def store(self, store_kwargs: dict[str, Any]) -> CachingStore:
+        store = self.store_cls(**store_kwargs)
+        await store._open()
+        return store
+
+    @pytest.mark.parametrize("read_only", [True, False])
+    async def test_store_open_read_only(
+        self, store_kwargs: dict[str, Any], read_only: bool
+    ) -> None:
+        store = await self.store_cls.open(MemoryStore, read_only=read_only)
+        assert store._store._is_open
+        assert store.read_only == read_only
+
+    async def test_read_only_store_raises(self, store_kwargs: dict[str, Any]) -> None:
+        store = await self.store_cls.open(MemoryStore, read_only=True)
+        assert store.read_only
+
+        with pytest.raises(ValueError):
+            await store.set("foo", self.buffer_cls.from_bytes(b"bar"))
+
+        with pytest.raises(ValueError):
+            await store.delete("foo")
+
+    def test_store_repr(self, store: CachingStore) -> None:
+        assert str(store) == f"caching-{store._store}"
+        assert repr(store) == f"CachingStore({store._store!r})"
+
+    def test_store_supports_writes(self, store: CachingStore) -> None:
+        assert store.supports_writes
+
+    def test_store_supports_partial_writes(self, store: CachingStore) -> None:
+        assert store.supports_partial_writes
+
+    def test_store_supports_listing(self, store: CachingStore) -> None:
+        assert store.supports_listing
+
+    async def test_cached_values_follow_writes(self, store: CachingStore) -> None:
+        prototype = default_buffer_prototype()
+        await store.set("a", self.buffer_cls.from_bytes(b"0123"))
+        for value in [b"4567", b"89"]:
+            assert (await store.get("a", prototype)) is not None
+            await store.set_partial_values([("a", 0, value)])
+            result = await store.get("a", prototype)
+            assert result is not None
+            assert result.to_bytes()[: len(value)] == value
+        await store.delete("a")
+        assert await store.get("a", prototype) is None
+
+
+async def test_caching_store_memory() -> None:
+    backend = LoggingStore(MemoryStore())
+    store = CachingStore(backend, max_memory=12)
+    prototype = default_buffer_prototype()
+    await store.set("a", cpu.Buffer.from_bytes(b"0123456789"))
+    await store.set("b", cpu.Buffer.from_bytes(b"abcdef"))
+
+    for _ in range(2):
+        result = await store.get("a", prototype=prototype)
+        assert result is not None
+        assert result.to_bytes() == b"0123456789"
+        result = await store.get("b", prototype=prototype, byte_range=RangeByteRequest(1, 3))
+        assert result is not None
+        assert result.to_bytes() == b"bc"
+    # the second reads are served from the cache
+    assert backend.counter["get"] == 2
+    info = store.cache_info()["memory"]
+    assert (info.hits, info.misses, info.nbytes) == (2, 2, 12)
+
+    # least recently used values are evicted
+    await store.set("c", cpu.Buffer.from_bytes(b"c"))
+    await store.get("c", prototype=prototype)
+    info = store.cache_info()["memory"]
+    assert (info.size, info.evictions) == (2, 1)
+
+    # writes invalidate the cached values
+    await store.set("b", cpu.Buffer.from_bytes(b"ABCDEF"))
+    result = await store.get("b", prototype=prototype, byte_range=RangeByteRequest(1, 3))
+    assert result is not None
+    assert result.to_bytes() == b"BC"
+    await store.delete("b")
+    assert await store.get("b", prototype=prototype, byte_range=RangeByteRequest(1, 3)) is None
+
+
+async def test_caching_store_disk(tmp_path: Path) -> None:
+    backend = MemoryStore()
+    store = CachingStore(LoggingStore(backend), max_memory=0, cache_dir=tmp_path)
+    prototype = default_buffer_prototype()
+    await store.set("x/a", cpu.Buffer.from_bytes(b"0123456789"))
+    await store.set("x/b", cpu.Buffer.from_bytes(b"abcdef"))
+    results = await store.get_partial_values(
+        prototype, [("x/a", None), ("x/b", RangeByteRequest(2, 4)), ("x/c", None)]
+    )
+    assert [None if r is None else r.to_bytes() for r in results] == [
+        b"0123456789",
+        b"cd",
+        None,
+    ]
+    await store._flush_disk_writes()
+    assert store.cache_info()["disk"].nbytes == 12
+    # mark x/b as the most recently used value
+    await store.get("x/b", prototype=prototype, byte_range=RangeByteRequest(2, 4))
+
+    # another store with the same cache directory reuses the cached values, and evicts
+    # the least recently used ones that do not fit
+    other = CachingStore(LoggingStore(backend), cache_dir=tmp_path, max_disk=10)
+    result = await other.get("x/b", prototype=prototype, byte_range=RangeByteRequest(2, 4))
+    assert result is not None
+    assert result.to_bytes() == b"cd"
+    assert other._store.counter["get"] == 0
+    assert other.cache_info()["disk"].size == 1
+    assert len(list(tmp_path.rglob("#*"))) == 1
+
+    # delete_dir invalidates all keys below the prefix, on disk as well
+    await other.delete_dir("x")
+    assert other.cache_info()["disk"].size == 0
+    assert list(tmp_path.rglob("#*")) == []
+
+
+async def test_caching_store_invalidation(tmp_path: Path) -> None:
+    store = CachingStore(MemoryStore(), cache_dir=tmp_path)
+    prototype = default_buffer_prototype()
+    keys = ["x/a", "x/ab", "x/y/a", "xy/a"]
+    for key in keys:
+        await store.set(key, cpu.Buffer.from_bytes(b"0123"))
+    for key in keys:
+        await store.get(key, prototype=prototype)
+        await store.get(key, prototype=prototype, byte_range=RangeByteRequest(1, 2))
+    await store._flush_disk_writes()
+    assert store.cache_info()["memory"].size == store.cache_info()["disk"].size == 8
+
+    # the values of a key are invalidated, but not those of keys that it prefixes
+    await store.set("x/a", cpu.Buffer.from_bytes(b"4567"))
+    assert store.cache_info()["memory"].size == store.cache_info()["disk"].size == 6
+    result = await store.get("x/a", prototype=prototype)
+    assert result is not None
+    assert result.to_bytes() == b"4567"
+
+    # and delete_dir invalidates the keys below the directory only
+    await store.delete_dir("x")
+    await store._flush_disk_writes()
+    assert store.cache_info()["memory"].size == store.cache_info()["disk"].size == 2
+    assert sorted(p.parent.name for p in tmp_path.rglob("#*")) == ["a", "a"]
+    result = await store.get("xy/a", prototype=prototype, byte_range=RangeByteRequest(1, 2))
+    assert result is not None
+    assert result.to_bytes() == b"1"
+
+
+async def test_caching_store_reads_do_not_wait_for_disk(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    written = threading.Event()
+    write_file = zarr.storage._caching._write_file
+
+    def blocked_write_file(path: Path, value: Buffer) -> None:
+        written.wait()
+        write_file(path, value)
+
+    monkeypatch.setattr(zarr.storage._caching, "_write_file", blocked_write_file)
+    backend = MemoryStore()
+    store = CachingStore(backend, cache_dir=tmp_path)
+    prototype = default_buffer_prototype()
+    await backend.set("a", cpu.Buffer.from_bytes(b"old"))
+    result = await store.get("a", prototype=prototype)
+    assert result is not None
+    assert result.to_bytes() == b"old"
+    assert store.cache_info()["disk"].size == 0
+
+    # a value written to disk after its key was modified is not cached
+    await store.set("a", cpu.Buffer.from_bytes(b"new"))
+    written.set()
+    await store._flush_disk_writes()
+    assert store.cache_info()["disk"].size == 0
+    assert list(tmp_path.rglob("#*")) == []
+
+
+async def test_caching_store_close_waits_for_disk(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    written = threading.Event()
+    write_file = zarr.storage._caching._write_file
+
+    def slow_write_file(path: Path, value: Buffer) -> None:
+        written.wait(0.2)
+        write_file(path, value)
+
+    monkeypatch.setattr(zarr.storage._caching, "_write_file", slow_write_file)
+    backend = MemoryStore()
+    await backend.set("a", cpu.Buffer.from_bytes(b"0123"))
+    with CachingStore(backend, cache_dir=tmp_path) as store:
+        await store.get("a", prototype=default_buffer_prototype())
+        assert store.cache_info()["disk"].size == 0
+    # the value read before closing the store is on disk once it is closed
+    assert store.cache_info()["disk"].size == 1
+    assert len(list(tmp_path.rglob("#*"))) == 1
+
+
+def test_caching_store_array() -> None:
+    store = CachingStore(MemoryStore())
+    data = np.arange(100).reshape(10, 10)
+    a = zarr.create_array(store, shape=data.shape, chunks=(5, 5), dtype=data.dtype)
+    a[:] = data
+    np.testing.assert_array_equal(a[:], data)
+    a[:5] = 0
+    data[:5] = 0
+    np.testing.assert_array_equal(a[:], data)
+    assert store.cache_info()["memory"].hits > 0
@@ -1,9 +1,14 @@
+import asyncio
 import tempfile
+from collections.abc import AsyncIterator
 from pathlib import Path
 
 import pytest
 from _pytest.compat import LEGACY_PATH
 
+import zarr
+from zarr.abc.store import ByteRequest, Store
+from zarr.core.buffer import Buffer, BufferPrototype, cpu, default_buffer_prototype
 from zarr.core.common import AccessModeLiteral
 from zarr.storage import FsspecStore, LocalStore, MemoryStore, StoreLike, StorePath
 from zarr.storage._common import make_store_path
@@ -123,3 +128,77 @@ def test_normalize_path_none():
 def test_normalize_path_invalid(path: str):
     with pytest.raises(ValueError):
         normalize_path(path)
+
+
+async def test_get_many_bounds_concurrency() -> None:
+    in_flight = 0
+    max_in_flight = 0
+
+    class SlowStore(MemoryStore):
+        async def get(
+            self, key: str, prototype: BufferPrototype, byte_range: ByteRequest | None = None
+        ) -> Buffer | None:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            # later keys finish first
+            await asyncio.sleep(0.001 * (20 - int(key)))
+            in_flight -= 1
+            return await super().get(key, prototype, byte_range)
+
+    store = SlowStore()
+    for i in range(20):
+        await store.set(str(i), cpu.Buffer.from_bytes(str(i).encode()))
+    requests = [(str(i), default_buffer_prototype(), None) for i in range(20)]
+    with zarr.config.set({"async.concurrency": 4}):
+        results = [(key, value) async for key, value in store.get_many(requests)]
+    assert max_in_flight == 4
+    assert [key for key, _ in results] != [str(i) for i in range(20)]
+    assert sorted((int(key), value.to_bytes()) for key, value in results if value is not None) == [
+        (i, str(i).encode()) for i in range(20)
+    ]
+
+
+async def test_get_many_propagates_errors() -> None:
+    class BrokenStore(MemoryStore):
+        async def get(
+            self, key: str, prototype: BufferPrototype, byte_range: ByteRequest | None = None
+        ) -> Buffer | None:
+            if key == "5":
+                raise OSError("bad key")
+            return await super().get(key, prototype, byte_range)
+
+    store = BrokenStore()
+    requests = [(str(i), default_buffer_prototype(), None) for i in range(10)]
+    with pytest.raises(OSError, match="bad key"):
+        async for _ in store.get_many(requests):
+            pass
+
+
+async def test_getsize_prefix_overlaps_listing() -> None:
+    events: list[str] = []
+
+    class SlowListingStore(MemoryStore):
+        async def list_prefix(self, prefix: str) -> AsyncIterator[str]:
+            async for key in super().list_prefix(prefix):
+                events.append("list")
+                await asyncio.sleep(0)
+                yield key
+
+        async def getsize(self, key: str) -> int:
+            events.append("getsize")
+            if key == "missing":
+                raise FileNotFoundError(key)
+            return await super().getsize(key)
+
+    store = SlowListingStore()
+    for i in range(100):
+        await store.set(f"c/{i}", cpu.Buffer.from_bytes(b"x" * i))
+    # the default implementation, rather than the one of MemoryStore
+    assert await Store.getsize_prefix(store, "c/") == sum(range(100))
+    # sizes are queried while the keys are listed
+    assert events.index("getsize") < len(events) - events[::-1].index("list") - 1
+
+    await store.set("missing", cpu.Buffer.from_bytes(b""))
+    with pytest.raises(FileNotFoundError):
+        await Store.getsize_prefix(store, "")
@@ -1,16 +1,23 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+import mmap
+import os
+from typing import TYPE_CHECKING, Any
 
+import numpy as np
 import pytest
 
 import zarr
-from zarr.core.buffer import Buffer, cpu
+import zarr.storage._local
+from zarr.abc.store import OffsetByteRequest, RangeByteRequest, SuffixByteRequest
+from zarr.core.buffer import Buffer, cpu, default_buffer_prototype
 from zarr.storage import LocalStore
 from zarr.testing.store import StoreTests
 
 if TYPE_CHECKING:
     import pathlib
+    from collections.abc import Iterator
 
 
 class TestLocalStore(StoreTests[LocalStore, cpu.Buffer]):
@@ -47,9 +54,179 @@ class TestLocalStore(StoreTests[LocalStore, cpu.Buffer]):
         (store.root / "foo/bar").mkdir(parents=True)
         assert await store.is_empty("")
 
+    @pytest.mark.skipif(not hasattr(os, "pread"), reason="os.pread is not available")
+    async def test_get_partial_values_batched(
+        self, store: LocalStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        await store.set("a", cpu.Buffer.from_bytes(b"0123456789"))
+        await store.set("b", cpu.Buffer.from_bytes(b"abcdefghij"))
+        key_ranges = [
+            ("a", RangeByteRequest(0, 2)),
+            ("b", SuffixByteRequest(3)),
+            ("a", RangeByteRequest(2, 4)),
+            ("missing", None),
+            ("a", OffsetByteRequest(8)),
+            ("b", RangeByteRequest(1, 4)),
+            ("a", RangeByteRequest(1, 3)),
+            ("a", RangeByteRequest(9, 20)),
+        ]
+        preads: list[tuple[int, int]] = []
+        pread = os.pread
+
+        def _pread(fd: int, n: int, offset: int) -> bytes:
+            preads.append((offset, n))
+            return pread(fd, n, offset)
+
+        monkeypatch.setattr(os, "pread", _pread)
+        result = await store.get_partial_values(default_buffer_prototype(), key_ranges)
+        assert [None if r is None else r.to_bytes() for r in result] == [
+            b"01",
+            b"hij",
+            b"23",
+            None,
+            b"89",
+            b"bcd",
+            b"12",
+            b"9",
+        ]
+        if not store.mmap:
+            # overlapping and adjacent ranges of a file are read together
+            assert sorted(preads) == [(0, 4), (1, 3), (7, 3), (8, 2)]
+
+    async def test_get_partial_values_without_pread(
+        self, store: LocalStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # os.pread does not exist on Windows
+        monkeypatch.delattr(os, "pread", raising=False)
+        await store.set("a", cpu.Buffer.from_bytes(b"0123456789"))
+        key_ranges = [
+            ("a", RangeByteRequest(0, 2)),
+            ("a", RangeByteRequest(1, 3)),
+            ("a", SuffixByteRequest(3)),
+            ("a", RangeByteRequest(9, 20)),
+            ("missing", None),
+        ]
+        result = await store.get_partial_values(default_buffer_prototype(), key_ranges)
+        assert [None if r is None else r.to_bytes() for r in result] == [
+            b"01",
+            b"12",
+            b"789",
+            b"9",
+            None,
+        ]
+
+    async def test_list_nested(self, store: LocalStore) -> None:
+        keys = [f"a/{i}/{j}" for i in range(30) for j in range(50)] + ["a/b", "c"]
+        for key in keys:
+            await store.set(key, cpu.Buffer.from_bytes(b"x"))
+        (store.root / "empty").mkdir()
+        # links to files are listed, links to directories are not followed
+        (store.root / "link").symlink_to(store.root / "c")
+        (store.root / "a-link").symlink_to(store.root / "a", target_is_directory=True)
+
+        assert sorted([k async for k in store.list()]) == sorted([*keys, "link"])
+        assert sorted([k async for k in store.list_prefix("a/1/")]) == sorted(
+            f"a/1/{j}" for j in range(50)
+        )
+        assert [k async for k in store.list_prefix("missing")] == []
+        assert [k async for k in store.list_prefix("c")] == []
+
+    async def test_list_stopped_early(
+        self, store: LocalStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        produced = 0
+        closed = False
+
+        def _walk_keys(root: pathlib.Path, prefix: str) -> Iterator[str]:
+            nonlocal produced, closed
+            try:
+                while True:
+                    produced += 1
+                    yield str(produced)
+            finally:
+                closed = True
+
+        monkeypatch.setattr(zarr.storage._local, "_walk_keys", _walk_keys)
+        keys = store.list()
+        assert await anext(keys) == "1"
+        await keys.aclose()
+        # the worker thread stopped and the walk, with its open directories, was closed
+        assert closed
+        nproduced = produced
+        await asyncio.sleep(0.01)
+        assert produced == nproduced
+
     def test_creates_new_directory(self, tmp_path: pathlib.Path):
         target = tmp_path.joinpath("a", "b", "c")
         assert not target.exists()
 
         store = self.store_cls(root=target)
         zarr.group(store=store)
+
+
+class TestLocalStoreMmap(TestLocalStore):
+    @pytest.fixture
+    def store_kwargs(self, tmpdir) -> dict[str, Any]:
+        return {"root": str(tmpdir), "mmap": True}
+
+    async def test_get_is_mapped(self, store: LocalStore) -> None:
+        await store.set("a", cpu.Buffer.from_bytes(b"0123456789"))
+        whole = await store.get("a", prototype=default_buffer_prototype())
+        part = await store.get(
+            "a", prototype=default_buffer_prototype(), byte_range=RangeByteRequest(2, 5)
+        )
+        assert whole is not None
+        assert part is not None
+        assert part.to_bytes() == b"234"
+        # the buffers are read-only views of the mapped file
+        for buf in (whole, part):
+            array = buf.as_numpy_array()
+            assert not array.flags.writeable
+            assert isinstance(array.base.obj, mmap.mmap)
+
+        # replacing the value does not affect the buffers that were read before
+        await store.set("a", cpu.Buffer.from_bytes(b"x"))
+        assert whole.to_bytes() == b"0123456789"
+        assert part.to_bytes() == b"234"
+        assert [k async for k in store.list()] == ["a"]
+        assert [k async for k in store.list_dir("")] == ["a"]
+        assert list((store.root / ".zarr-tmp").iterdir()) == []
+
+    async def test_set_partial_values_copy_on_write(self, store: LocalStore) -> None:
+        await store.set("a", cpu.Buffer.from_bytes(b"aaaaaaaa"))
+        before = await store.get("a", prototype=default_buffer_prototype())
+        assert before is not None
+        await store.set_partial_values([("a", 0, b"ZZ"), ("a", 6, b"YYYY"), ("a", 12, b"X")])
+        # the buffers that were read before are not modified by partial writes
+        assert before.to_bytes() == b"aaaaaaaa"
+        after = await store.get("a", prototype=default_buffer_prototype())
+        assert after is not None
+        assert after.to_bytes() == b"ZZaaaaYYYY\x00\x00X"
+        assert list((store.root / ".zarr-tmp").iterdir()) == []
+
+    async def test_stale_tmp_files_removed(self, store: LocalStore) -> None:
+        await store.set("a", cpu.Buffer.from_bytes(b"x"))
+        # the temporary files of writes interrupted by a crash are never listed
+        stale = store.root / ".zarr-tmp" / "a.crashed"
+        recent = store.root / ".zarr-tmp" / "a.in-progress"
+        stale.write_bytes(b"y")
+        recent.write_bytes(b"y")
+        os.utime(stale, (0, 0))
+        assert [k async for k in store.list()] == ["a"]
+
+        # and are removed once they are old, when the store is opened for writing
+        reopened = LocalStore(store.root, mmap=True)
+        await reopened._open()
+        assert not stale.exists()
+        assert recent.exists()
+
+    def test_uncompressed_array(self, store: LocalStore) -> None:
+        data = np.arange(100, dtype="int32").reshape(10, 10)
+        a = zarr.create_array(
+            store, shape=data.shape, chunks=(5, 5), dtype=data.dtype, compressors=None
+        )
+        a[:] = data
+        np.testing.assert_array_equal(a[:], data)
+        a[2:7] = 0
+        data[2:7] = 0
+        np.testing.assert_array_equal(a[:], data)
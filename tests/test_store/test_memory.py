@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import pickle
+
 import pytest
 
-from zarr.core.buffer import Buffer, cpu, gpu
+from zarr.core.buffer import Buffer, cpu, default_buffer_prototype, gpu
 from zarr.storage import GpuMemoryStore, MemoryStore
+from zarr.storage._memory import _SortedKeyDict, _SortedKeys
 from zarr.testing.store import StoreTests
 from zarr.testing.utils import gpu_test
 
@@ -46,6 +49,93 @@ class TestMemoryStore(StoreTests[MemoryStore, cpu.Buffer]):
     def test_list_prefix(self, store: MemoryStore) -> None:
         assert True
 
+    async def test_sorted_key_index(self, store: MemoryStore) -> None:
+        for key in ["a/y/z", "a!b", "b", "a/x", "a"]:
+            await store.set(key, self.buffer_cls.from_bytes(b"x"))
+        assert sorted([k async for k in store.list_dir("")]) == ["a", "a!b", "b"]
+        assert sorted([k async for k in store.list_dir("a")]) == ["x", "y"]
+        assert sorted([k async for k in store.list_prefix("a/")]) == ["a/x", "a/y/z"]
+
+        # the index follows keys set and deleted through the store
+        await store.delete("a/x")
+        await store.set_if_not_exists("a/w", self.buffer_cls.from_bytes(b"x"))
+        await store.set_partial_values([("a/v", 0, b"x")])
+        assert sorted([k async for k in store.list_dir("a/")]) == ["v", "w", "y"]
+
+        # keys can be deleted while listing
+        async for key in store.list_prefix("a/"):
+            await store.delete(key)
+        assert sorted([k async for k in store.list_prefix("")]) == ["a", "a!b", "b"]
+
+        # and so do modifications of the backing mapping that keep its size
+        del store._store_dict["b"]
+        store._store_dict["c/d"] = self.buffer_cls.from_bytes(b"x")
+        assert sorted([k async for k in store.list_dir("")]) == ["a", "a!b", "c"]
+        await store.clear()
+        assert [k async for k in store.list_dir("")] == []
+
+    async def test_listing_shared_store_dict(self, store: MemoryStore) -> None:
+        # stores over the same mapping see each other's modifications
+        other = self.store_cls(store_dict=store._store_dict)
+        await store.set("g/x", self.buffer_cls.from_bytes(b"x"))
+        assert [k async for k in other.list_prefix("g/")] == ["g/x"]
+        await store.delete("g/x")
+        await store.set("g/y", self.buffer_cls.from_bytes(b"x"))
+        assert [k async for k in other.list_prefix("g/")] == ["g/y"]
+        assert [k async for k in other.list_dir("g")] == ["y"]
+
+    async def test_set_partial_values_appends_in_place(self, store: MemoryStore) -> None:
+        value = self.buffer_cls.from_bytes(b"abcd")
+        await store.set("k", value)
+        await store.set_partial_values([("k", 2, b"XY"), ("k", 4, b"ef")])
+        # the value that was set is copied once, and not modified
+        assert value.to_bytes() == b"abcd"
+        backings = []
+        for i in range(100):
+            await store.set_partial_values([("k", 6 + i, b"%d" % (i % 10))])
+            backing, _ = store._partial_values["k"]
+            if not any(backing is b for b in backings):
+                backings.append(backing)
+        # appends are written into the spare capacity of arrays that grow geometrically
+        assert len(backings) <= 5
+        await store.set_partial_values([("k", 108, b"z")])
+        result = await store.get("k", prototype=default_buffer_prototype())
+        assert result is not None
+        assert result.to_bytes() == b"abXYef" + b"0123456789" * 10 + b"\x00\x00z"
+        assert pickle.loads(pickle.dumps(store)) == store
+        await store.delete("k")
+        assert "k" not in store._partial_values
+
+    def test_sorted_key_dict(self) -> None:
+        store_dict = _SortedKeyDict({"c": 1, "a": 2})
+        store_dict["b"] = 3
+        store_dict.update({"e": 4}, d=5)
+        store_dict.setdefault("f", 6)
+        store_dict |= {"g": 7}
+        del store_dict["a"]
+        store_dict.pop("c")
+        store_dict.pop("x", None)
+        assert list(store_dict.sorted_keys.iter_from("")) == ["b", "d", "e", "f", "g"]
+        key, _ = store_dict.popitem()
+        assert key not in list(store_dict.sorted_keys.iter_from(""))
+        unpickled = pickle.loads(pickle.dumps(store_dict))
+        assert unpickled == store_dict
+        assert list(unpickled.sorted_keys.iter_from("")) == sorted(store_dict)
+        store_dict.clear()
+        assert store_dict.sorted_keys.first_from("") is None
+
+    def test_sorted_keys_blocks(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(_SortedKeys, "_BLOCK_SIZE", 4)
+        keys = [f"{i:03}" for i in range(100)]
+        sorted_keys = _SortedKeys(keys[::2])
+        for key in keys[1::2]:
+            sorted_keys.add(key)
+        assert list(sorted_keys.iter_from("")) == keys
+        for key in keys[:50]:
+            sorted_keys.discard(key)
+        assert list(sorted_keys.iter_from("")) == keys[50:]
+        assert sorted_keys.first_from("0505") == "051"
+
 
 @gpu_test
 class TestGpuMemoryStore(StoreTests[GpuMemoryStore, gpu.Buffer]):
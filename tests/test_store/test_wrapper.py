@@ -8,7 +8,7 @@ from zarr.core.buffer.cpu import Buffer, buffer_prototype
 from zarr.storage import WrapperStore
 
 if TYPE_CHECKING:
-    from zarr.abc.store import Store
+    from zarr.abc.store import ByteRequest, Store
     from zarr.core.buffer.core import BufferPrototype
 
 
@@ -44,3 +44,27 @@ async def test_wrapped_get(store: Store, capsys: pytest.CaptureFixture[str]) ->
     assert await store_wrapped.get(key, buffer_prototype) == value
     captured = capsys.readouterr()
     assert f"getting {key}" in captured.out
+
+
+@pytest.mark.parametrize("store", ["memory"], indirect=True)
+async def test_wrapped_get_many(store: Store, capsys: pytest.CaptureFixture[str]) -> None:
+    class NoisyGetter(WrapperStore):
+        async def get(
+            self, key: str, prototype: BufferPrototype, byte_range: ByteRequest | None = None
+        ) -> Buffer | None:
+            print(f"getting {key}")
+            return await super().get(key, prototype=prototype, byte_range=byte_range)
+
+    await store.set("foo", Buffer.from_bytes(b"bar"))
+    requests = [("foo", buffer_prototype, None), ("baz", buffer_prototype, None)]
+
+    # plain wrappers forward batched reads to the wrapped store
+    result = {key: value async for key, value in WrapperStore(store).get_many(requests)}
+    assert result == {"foo": Buffer.from_bytes(b"bar"), "baz": None}
+
+    # wrappers that intercept reads see the reads of batches, too
+    result = {key: value async for key, value in NoisyGetter(store).get_many(requests)}
+    assert result == {"foo": Buffer.from_bytes(b"bar"), "baz": None}
+    captured = capsys.readouterr()
+    assert "getting foo" in captured.out
+    assert "getting baz" in captured.out
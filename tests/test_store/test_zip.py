@@ -1,19 +1,25 @@
 from __future__ import annotations
 
+import mmap
 import os
 import tempfile
 import zipfile
+import zlib
 from typing import TYPE_CHECKING
 
 import numpy as np
 import pytest
 
 import zarr
+from zarr.abc.store import OffsetByteRequest, RangeByteRequest, SuffixByteRequest
 from zarr.core.buffer import Buffer, cpu, default_buffer_prototype
+from zarr.core.sync import _collect_aiterator
 from zarr.storage import ZipStore
 from zarr.testing.store import StoreTests
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from pathlib import Path
     from typing import Any
 
 
@@ -111,3 +117,194 @@ class TestZipStore(StoreTests[ZipStore, cpu.Buffer]):
         kws = {**store_kwargs, "mode": zip_mode}
         store = await self.store_cls.open(**kws)
         assert store.read_only == read_only
+
+
+class TestReadOnlyZipStore(StoreTests[ZipStore, cpu.Buffer]):
+    """The store tests for archives opened in mode 'r', which are read from a memory map.
+    Values are added by appending them to the archive and reopening the store."""
+
+    store_cls = ZipStore
+    buffer_cls = cpu.Buffer
+
+    @pytest.fixture(
+        params=[zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED, zipfile.ZIP_BZIP2],
+        ids=["stored", "deflated", "bzip2"],
+    )
+    def store_kwargs(self, request: pytest.FixtureRequest, tmp_path: Path) -> dict[str, Any]:
+        path = tmp_path / "data.zip"
+        with zipfile.ZipFile(path, mode="w"):
+            pass
+        return {"path": path, "mode": "r", "compression": request.param}
+
+    async def get(self, store: ZipStore, key: str) -> Buffer:
+        return store._get(key, prototype=default_buffer_prototype())
+
+    async def set(self, store: ZipStore, key: str, value: Buffer) -> None:
+        await self._set_many(store, {key: value})
+
+    async def _set_many(self, store: ZipStore, values: Mapping[str, Buffer]) -> None:
+        store.close()
+        with zipfile.ZipFile(store.path, mode="a", compression=store.compression) as zf:
+            for key, value in values.items():
+                zf.writestr(key, value.to_bytes())
+        store._sync_open()
+        assert store._view is not None
+
+    def test_store_read_only(self, store: ZipStore) -> None:
+        assert store.read_only
+
+    @pytest.mark.parametrize("read_only", [True])
+    async def test_store_open_read_only(
+        self, store_kwargs: dict[str, Any], read_only: bool
+    ) -> None:
+        await super().test_store_open_read_only(store_kwargs, read_only)
+
+    def test_store_repr(self, store: ZipStore) -> None:
+        assert str(store) == f"zip://{store.path}"
+
+    def test_store_supports_writes(self, store: ZipStore) -> None:
+        assert store.supports_writes
+
+    def test_store_supports_partial_writes(self, store: ZipStore) -> None:
+        assert store.supports_partial_writes is False
+
+    def test_store_supports_listing(self, store: ZipStore) -> None:
+        assert store.supports_listing
+
+    async def test_set(self, store: ZipStore) -> None:
+        with pytest.raises(ValueError):
+            await store.set("foo", self.buffer_cls.from_bytes(b"bar"))
+
+    async def test_set_many(self, store: ZipStore) -> None:
+        with pytest.raises(ValueError):
+            await store._set_many([("foo", self.buffer_cls.from_bytes(b"bar"))])
+
+    async def test_set_if_not_exists(self, store: ZipStore) -> None:
+        with pytest.raises(ValueError):
+            await store.set_if_not_exists("foo", self.buffer_cls.from_bytes(b"bar"))
+
+    async def test_clear(self, store: ZipStore) -> None:
+        with pytest.raises(ValueError):
+            await store.clear()
+
+    async def test_exists(self, store: ZipStore) -> None:
+        assert not await store.exists("foo/zarr.json")
+        await self.set(store, "foo/zarr.json", self.buffer_cls.from_bytes(b"bar"))
+        assert await store.exists("foo/zarr.json")
+
+    async def test_list(self, store: ZipStore) -> None:
+        assert await _collect_aiterator(store.list()) == ()
+        keys = ["foo/zarr.json", *(f"foo/c/{i}" for i in range(10))]
+        await self._set_many(store, dict.fromkeys(keys, self.buffer_cls.from_bytes(b"")))
+        assert sorted(await _collect_aiterator(store.list())) == sorted(keys)
+
+    async def test_list_prefix(self, store: ZipStore) -> None:
+        keys = ["zarr.json", "a/zarr.json", "a/b/zarr.json", "ab/zarr.json"]
+        await self._set_many(store, dict.fromkeys(keys, self.buffer_cls.from_bytes(b"")))
+        observed = sorted(await _collect_aiterator(store.list_prefix("a/")))
+        assert observed == ["a/b/zarr.json", "a/zarr.json"]
+
+    async def test_list_dir(self, store: ZipStore) -> None:
+        keys = ["foo/zarr.json", "foo/c/1", "foo/c/2"]
+        await self._set_many(store, dict.fromkeys(keys, self.buffer_cls.from_bytes(b"")))
+        assert sorted(await _collect_aiterator(store.list_dir("foo"))) == ["c", "zarr.json"]
+
+    async def test_getsize_prefix(self, store: ZipStore) -> None:
+        values = {
+            "foo/zarr.json": self.buffer_cls.from_bytes(b"0123456789"),
+            "foo/c/0/0": self.buffer_cls.from_bytes(b"01234"),
+            "bar/c/0": self.buffer_cls.from_bytes(b"0"),
+        }
+        await self._set_many(store, values)
+        assert await store.getsize_prefix("foo") == 15
+        assert await store.getsize_prefix("") == 16
+
+    async def test_range_reads_decompress_once(
+        self, store: ZipStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        data = bytes(range(256)) * 16
+        await self.set(store, "c/0", self.buffer_cls.from_bytes(data))
+        decompress = zlib.decompress
+        calls = []
+
+        def counting_decompress(*args: Any, **kwargs: Any) -> bytes:
+            calls.append(args)
+            return decompress(*args, **kwargs)
+
+        monkeypatch.setattr(zlib, "decompress", counting_decompress)
+        prototype = default_buffer_prototype()
+        for byte_range, expected in [
+            (SuffixByteRequest(16), data[-16:]),
+            (RangeByteRequest(0, 16), data[:16]),
+            (OffsetByteRequest(16), data[16:]),
+            (None, data),
+        ]:
+            result = await store.get("c/0", prototype=prototype, byte_range=byte_range)
+            assert result is not None
+            assert result.to_bytes() == expected
+        # deflated members are decompressed by the first byte range read only
+        assert len(calls) == (1 if store.compression == zipfile.ZIP_DEFLATED else 0)
+
+
+@pytest.mark.parametrize(
+    "compression", [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED, zipfile.ZIP_BZIP2]
+)
+async def test_read_only_mapped(tmp_path: Path, compression: int) -> None:
+    path = tmp_path / "data.zip"
+    values = {"a": b"0123456789", "b/c": bytes(range(256)) * 10, "empty": b""}
+    with zipfile.ZipFile(path, mode="w", compression=compression) as zf:
+        for key, value in values.items():
+            zf.writestr(key, value)
+
+    store = await ZipStore.open(path, mode="r")
+    assert store._view is not None
+    prototype = default_buffer_prototype()
+    for key, value in values.items():
+        result = await store.get(key, prototype=prototype)
+        assert result is not None
+        assert result.to_bytes() == value
+    assert await store.get("missing", prototype=prototype) is None
+
+    key_ranges = [
+        ("a", RangeByteRequest(2, 5)),
+        ("b/c", OffsetByteRequest(2555)),
+        ("a", SuffixByteRequest(3)),
+        ("missing", None),
+        ("empty", None),
+    ]
+    results = await store.get_partial_values(prototype, key_ranges)
+    assert [None if r is None else r.to_bytes() for r in results] == [
+        b"234",
+        b"\xfb\xfc\xfd\xfe\xff",
+        b"789",
+        None,
+        b"",
+    ]
+    requests = [(key, prototype, None) for key in [*values, "missing"]]
+    results = {key: value async for key, value in store.get_many(requests)}
+    assert {key: None if r is None else r.to_bytes() for key, r in results.items()} == {
+        **values,
+        "missing": None,
+    }
+
+    if compression == zipfile.ZIP_STORED:
+        # uncompressed members are views of the mapped archive
+        result = await store.get("b/c", prototype=prototype)
+        assert result is not None
+        assert isinstance(result.as_numpy_array().base.obj, mmap.mmap)
+    store.close()
+
+
+async def test_read_only_mapped_bad_crc(tmp_path: Path) -> None:
+    path = tmp_path / "data.zip"
+    with zipfile.ZipFile(path, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("a", b"0" * 100)
+    data = bytearray(path.read_bytes())
+    # corrupt the CRC-32 in the central directory
+    crc_offset = data.rindex(b"PK\x01\x02") + 16
+    data[crc_offset] ^= 0xFF
+    path.write_bytes(data)
+
+    store = await ZipStore.open(path, mode="r")
+    with pytest.raises(zipfile.BadZipFile, match="Bad CRC-32"):
+        await store.get("a", prototype=default_buffer_prototype())
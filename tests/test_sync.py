@@ -11,8 +11,10 @@ from zarr.core.sync import (
     _get_executor,
     _get_lock,
     _get_loop,
+    _get_process_executor,
     cleanup_resources,
     loop,
+    run_codec_function,
     sync,
 )
 from zarr.storage import MemoryStore
@@ -165,6 +167,37 @@ def test_threadpool_executor(clean_state, workers: int | None) -> None:
             assert _get_executor()._max_workers == workers
 
 
+@pytest.mark.parametrize("executor", ["thread", "process", "inline"])
+def test_run_codec_function(clean_state, executor: str) -> None:
+    with zarr.config.set({"codec_pipeline.executor": executor}):
+        assert sync(run_codec_function(pow, 2, 10)) == 1024
+        assert sync(run_codec_function(int, "ff", base=16)) == 255
+
+
+def test_run_codec_function_process_errors(clean_state) -> None:
+    with (
+        zarr.config.set({"codec_pipeline.executor": "process"}),
+        pytest.raises(ValueError, match="invalid literal"),
+    ):
+        sync(run_codec_function(int, "not a number"))
+
+
+def test_run_codec_function_invalid_executor() -> None:
+    with (
+        zarr.config.set({"codec_pipeline.executor": "fork"}),
+        pytest.raises(ValueError, match="codec_pipeline.executor"),
+    ):
+        sync(run_codec_function(pow, 2, 10))
+
+
+def test_cleanup_resources_process_executor() -> None:
+    executor = _get_process_executor()
+    assert _get_process_executor() is executor
+    cleanup_resources()
+    assert _get_process_executor() is not executor
+    cleanup_resources()
+
+
 def test_cleanup_resources_idempotent() -> None:
     _get_executor()  # trigger resource creation (iothread, loop, thread-pool)
     cleanup_resources()